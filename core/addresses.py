@@ -0,0 +1,91 @@
+"""
+The saved-address book behind checkout.
+
+An address is stored once per user. normalize() folds case and
+whitespace, and the SHA-256 of the normalized fields is unique per user
+(core_billingaddress_uniq), so submitting the same address again, typed
+with other spacing or capitals, finds the existing row instead of adding
+one. Addresses submitted with "save this information" are listed in the
+user's address book for one-click reuse at checkout.
+
+Every step is a single statement and safe against concurrent
+submissions. The insert skips a row that already holds the hash (INSERT
+... ON CONFLICT DO NOTHING), and the open order is pointed at whichever
+row holds it through a subquery. A checkout POST costs at most three
+queries of its own, and reusing a saved address costs one.
+"""
+import hashlib
+
+from django.conf import settings
+from django.db.models import Exists, Subquery
+
+from .models import BillingAddress, Order
+
+# saved addresses offered at checkout, most recent first
+ADDRESS_BOOK_SIZE = getattr(settings, 'ADDRESS_BOOK_SIZE', 10)
+
+ADDRESS_FIELDS = ('street_address', 'apartment_address', 'country', 'zip')
+
+
+def clean_address(data):
+    """The address fields of `data` with whitespace trimmed and collapsed."""
+    return {name: ' '.join(str(data.get(name) or '').split()) for name in ADDRESS_FIELDS}
+
+
+def normalize(address):
+    """What two addresses must share to be the same one."""
+    return (
+        address['street_address'].casefold(),
+        address['apartment_address'].casefold(),
+        address['country'].upper(),
+        # postcodes are written with and without their space
+        address['zip'].replace(' ', '').upper(),
+    )
+
+
+def content_hash(address):
+    return hashlib.sha256('\x1f'.join(normalize(address)).encode()).hexdigest()
+
+
+def address_book(user):
+    return list(BillingAddress.objects.filter(user=user, saved=True).order_by('-pk')
+                [:ADDRESS_BOOK_SIZE])
+
+
+def _use_address(user, addresses):
+    # one UPDATE, which matches nothing if the user has no open order or
+    # the address is not theirs
+    return Order.objects.filter(user=user, ordered=False).filter(
+        Exists(addresses)
+    ).update(billing_address=Subquery(addresses.values('pk')[:1]))
+
+
+def use_new_address(user, data, save=False):
+    """
+    Store the address in `data` for the user (once) and make it their open
+    order's billing address; `save` adds it to their address book. Returns
+    False if the user has no open order.
+    """
+    address = clean_address(data)
+    digest = content_hash(address)
+    BillingAddress.objects.bulk_create([
+        BillingAddress(user=user, content_hash=digest, saved=save, **address)
+    ], ignore_conflicts=True)
+    stored = BillingAddress.objects.filter(user=user, content_hash=digest)
+    if save:
+        stored.filter(saved=False).update(saved=True)
+    return bool(_use_address(user, stored))
+
+
+def use_saved_address(user, address_id):
+    """
+    Make one of the user's saved addresses their open order's billing
+    address. Returns False if there is no open order or no such address.
+    """
+    return bool(_use_address(
+        user, BillingAddress.objects.filter(user=user, pk=address_id, saved=True)))
+
+
+def forget_address(user, address_id):
+    """Take an address out of the user's address book; orders keep it."""
+    return bool(BillingAddress.objects.filter(user=user, pk=address_id).update(saved=False))
@@ -1,8 +1,148 @@
+"""
+Admin for the shop's models, written for tables with millions of rows.
+
+- Every column a changelist shows is loaded with the page
+  (list_select_related), never one query per row.
+- Foreign keys and the order's lines are raw-id or autocomplete inputs;
+  a <select> of every OrderItem or user stops working past a few thousand.
+- Searches are exact matches on indexed columns (a username, a slug, a
+  primary key), and items are searched through core.search; Django's own
+  search is an icontains, a scan of the whole table.
+- The unfiltered changelist is counted from the database's statistics
+  (EstimatedCountPaginator) and show_full_result_count is off, so a page
+  costs no COUNT(*) over the whole table.
+"""
+from django import forms
 from django.contrib import admin
+from django.db.models import Q
+
+from .inventory import set_stock_on_hand, stock_on_hand
+from .models import BillingAddress, Item, Order, OrderItem, Payment
+from .pagination import EstimatedCountPaginator
+from .search import search_items
+
+# items considered per admin search
+ITEM_SEARCH_LIMIT = 500
+# the largest primary key a (signed 64-bit) bigint column holds
+MAX_PK = 2 ** 63 - 1
+
+
+class BigTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # newest first, straight off the primary key index
+    ordering = ('-pk',)
+
+    def get_search_results(self, request, queryset, search_term):
+        # the search_fields are matched exactly, and a number that can be
+        # one is tried as a primary key too
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        condition = Q()
+        if term.isdecimal() and int(term) <= MAX_PK:
+            condition = Q(pk=int(term))
+        for field in self.search_fields:
+            condition |= Q(**{field: term})
+        return queryset.filter(condition), False
+
+
+class ItemAdminForm(forms.ModelForm):
+    # edited as the stock on hand; inventory_quantity leaves out the units
+    # carts hold, and changes under the form as they come and go
+    stock_on_hand = forms.IntegerField(min_value=0, initial=0)
+
+    class Meta:
+        model = Item
+        exclude = ('inventory_quantity',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.initial['stock_on_hand'] = stock_on_hand(self.instance)
+
+
+@admin.register(Item)
+class ItemAdmin(admin.ModelAdmin):
+    form = ItemAdminForm
+    list_display = ('title', 'slug', 'price', 'discount_price', 'category', 'label',
+                    'inventory_quantity', 'modified')
+    list_filter = ('category', 'label')
+    search_fields = ('slug', 'title')
+    prepopulated_fields = {'slug': ('title',)}
+    # written by the image pipeline (core.images)
+    readonly_fields = ('image_digest', 'image_width', 'image_height')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        # the search index (core.search) instead of title LIKE '%term%';
+        # it also serves the autocomplete widgets of the other admins
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        matches = search_items(term, limit=ITEM_SEARCH_LIMIT).items
+        return queryset.filter(Q(slug=term) | Q(pk__in=[item.pk for item in matches])), False
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.inventory_quantity = form.cleaned_data['stock_on_hand']
+            obj.save()
+            return
+        # never write back the inventory_quantity loaded with the form
+        obj.save(update_fields=[field.name for field in Item._meta.concrete_fields
+                                if not field.primary_key and field.name != 'inventory_quantity'])
+        if 'stock_on_hand' in form.changed_data:
+            set_stock_on_hand([obj.pk], form.cleaned_data['stock_on_hand'])
+
+
+@admin.register(Order)
+class OrderAdmin(BigTableAdmin):
+    list_display = ('id', 'user', 'ordered', 'ordered_date', 'item_count', 'total',
+                    'payment_status')
+    list_filter = ('ordered',)
+    list_select_related = ('user', 'payment')
+    search_fields = ('user__username',)
+    # drawn by admin_dates.indexed_date_hierarchy (see the change_list.html
+    # override in templates/admin/core/order/)
+    date_hierarchy = 'ordered_date'
+    raw_id_fields = ('user', 'items', 'billing_address', 'payment')
+    # kept by the cart code (core.cart); verify_cart_totals repairs them
+    readonly_fields = ('item_count', 'subtotal_cents', 'discount_total_cents',
+                       'total_cents')
+
+    def total(self, order):
+        return order.total
+    total.admin_order_field = 'total_cents'
+
+    def payment_status(self, order):
+        return order.payment.get_status_display() if order.payment else None
+
+
+@admin.register(OrderItem)
+class OrderItemAdmin(BigTableAdmin):
+    list_display = ('id', 'user', 'item', 'order_quantity', 'ordered')
+    list_filter = ('ordered',)
+    list_select_related = ('user', 'item')
+    search_fields = ('user__username', 'item__slug')
+    raw_id_fields = ('user',)
+    autocomplete_fields = ('item',)
+
+
+@admin.register(BillingAddress)
+class BillingAddressAdmin(BigTableAdmin):
+    list_display = ('id', 'user', 'street_address', 'country', 'zip', 'saved')
+    list_select_related = ('user',)
+    search_fields = ('user__username',)
+    raw_id_fields = ('user',)
+    # kept by core.addresses, which finds addresses by it
+    readonly_fields = ('content_hash',)
 
-# Register your models here.
-from .models import Item, Order, OrderItem
 
-admin.site.register(Item)
-admin.site.register(Order)
-admin.site.register(OrderItem)
+@admin.register(Payment)
+class PaymentAdmin(BigTableAdmin):
+    list_display = ('id', 'user', 'amount', 'status', 'processor', 'timestamp', 'charge_id')
+    list_filter = ('status', 'processor')
+    list_select_related = ('user',)
+    search_fields = ('user__username', 'charge_id')
+    raw_id_fields = ('user',)
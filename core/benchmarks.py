@@ -0,0 +1,193 @@
+"""
+Helpers shared by the bench_* management commands: their base command,
+synthetic data generators and a small latency recorder.
+
+These write straight into whatever database the settings point at, so run
+them against a scratch database, never production: a command that seeds or
+deletes rows refuses to start unless given --scratch-db, or unless the
+BENCH_SCRATCH_DB setting is on (for a settings module kept for benchmarks).
+"""
+import random
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, transaction
+from django.db.models import Max
+from django.test import override_settings
+from django.utils import timezone
+
+from .facets import rebuild_facet_counts
+from .latency import summarize
+from .money import to_cents, to_decimal
+from .models import CATEGORY_CHOICES, LABEL_CHOICES, Item, Order, OrderItem
+
+BENCH_SCRATCH_DB = getattr(settings, 'BENCH_SCRATCH_DB', False)
+
+
+class BenchCommand(BaseCommand):
+    """
+    Base of the bench_* commands. They run with DEBUG off: DEBUG keeps every
+    query in memory, which would skew the numbers.
+    """
+    # False for a command that only reads the database
+    writes = True
+
+    def create_parser(self, prog_name, subcommand, **kwargs):
+        parser = super().create_parser(prog_name, subcommand, **kwargs)
+        if self.writes:
+            parser.add_argument(
+                '--scratch-db', action='store_true',
+                help='Confirm that the configured database is a scratch one, '
+                     'which the benchmark may fill with and empty of rows')
+        return parser
+
+    def execute(self, *args, **options):
+        if self.writes and not (options.get('scratch_db') or BENCH_SCRATCH_DB):
+            raise CommandError(
+                f"{settings.DATABASES['default']['NAME']} is not known to be a scratch "
+                f"database; pass --scratch-db (or set BENCH_SCRATCH_DB) to benchmark "
+                f"against it")
+        with override_settings(DEBUG=False):
+            return super().execute(*args, **options)
+
+
+def measure(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def format_summary(name, summary):
+    return "{:<32} n={count:<6} mean={mean_ms:.3f}ms p50={p50_ms:.3f}ms " \
+        "p95={p95_ms:.3f}ms p99={p99_ms:.3f}ms".format(name, **summary)
+
+
+def retry_locked(func):
+    """
+    Call func until it gets past SQLite's "database is locked", which SQLite
+    raises instead of waiting when concurrent transactions collide.
+    """
+    while True:
+        try:
+            return func()
+        except OperationalError:
+            time.sleep(random.uniform(0, 0.005))
+
+
+def _next_pk(model):
+    # bulk_create does not hand primary keys back on every backend, so the
+    # generators below assign them explicitly
+    return (model.objects.aggregate(m=Max('pk'))['m'] or 0) + 1
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def seed_items(count, batch_size=5000, seed=0):
+    rng = random.Random(seed)
+    start = _next_pk(Item)
+    categories = [c[0] for c in CATEGORY_CHOICES]
+    labels = [value for value, _ in LABEL_CHOICES]
+
+    def rows():
+        for pk in range(start, start + count):
+            price = to_decimal(round(rng.uniform(5, 200), 2))
+            yield Item(
+                pk=pk,
+                title=f"Bench item {pk}",
+                price=price,
+                discount_price=to_decimal(price * Decimal('0.8')) if rng.random() < 0.3 else None,
+                category=rng.choice(categories),
+                label=rng.choice(labels),
+                slug=f"bench-item-{pk}",
+                description=f"Synthetic catalog entry number {pk}",
+                inventory_quantity=rng.randint(0, 500),
+            )
+
+    for batch in _batches(rows(), batch_size):
+        Item.objects.bulk_create(batch)
+    # bulk_create skips the Item signals that keep the facet counts
+    rebuild_facet_counts()
+    return list(range(start, start + count))
+
+
+def seed_users(count, batch_size=5000):
+    User = get_user_model()
+    start = _next_pk(User)
+    rows = (User(pk=pk, username=f"bench-user-{pk}", password='!')
+            for pk in range(start, start + count))
+    for batch in _batches(rows, batch_size):
+        User.objects.bulk_create(batch)
+    return list(range(start, start + count))
+
+
+def seed_orders(user_ids, item_ids, lines_per_order=10, orders_per_user=10,
+                ordered=True, batch_size=5000, created=None, seed=0):
+    """
+    Give every user orders_per_user orders of lines_per_order lines each.
+    When ordered is False only the first order of each user is left open,
+    so the one-open-order and one-line-per-item constraints hold.
+    """
+    rng = random.Random(seed)
+    created = created or timezone.now()
+    Through = Order.items.through
+    # (price, discount) per unit in cents, for the orders' stored totals
+    unit_cents = {
+        pk: (to_cents(price), to_cents(price) - to_cents(discount) if discount else 0)
+        for pk, price, discount in Item.objects.filter(pk__in=item_ids).values_list(
+            'pk', 'price', 'discount_price')}
+    order_pk = _next_pk(Order)
+    line_pk = _next_pk(OrderItem)
+    orders, lines, links = [], [], []
+
+    def flush():
+        if not orders:
+            return
+        with transaction.atomic():
+            Order.objects.bulk_create(orders)
+            OrderItem.objects.bulk_create(lines)
+            Through.objects.bulk_create(links)
+            # auto_now_add ignores the value given on insert
+            Order.objects.filter(
+                pk__range=(orders[0].pk, orders[-1].pk)
+            ).update(order_created_date=created)
+        orders.clear()
+        lines.clear()
+        links.clear()
+
+    for user_id in user_ids:
+        for n in range(orders_per_user):
+            placed = ordered or n > 0
+            order = Order(
+                pk=order_pk, user_id=user_id, ordered=placed,
+                ordered_date=created, item_count=lines_per_order)
+            for item_id in rng.sample(item_ids, lines_per_order):
+                quantity = rng.randint(1, 3)
+                price, saved = unit_cents[item_id]
+                order.subtotal_cents += quantity * price
+                order.discount_total_cents += quantity * saved
+                lines.append(OrderItem(
+                    pk=line_pk, user_id=user_id, item_id=item_id,
+                    ordered=placed, order_quantity=quantity))
+                links.append(Through(order_id=order_pk, orderitem_id=line_pk))
+                line_pk += 1
+            order.total_cents = order.subtotal_cents - order.discount_total_cents
+            orders.append(order)
+            order_pk += 1
+        if len(lines) >= batch_size:
+            flush()
+    flush()
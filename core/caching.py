@@ -0,0 +1,70 @@
+"""
+Full-page cache for anonymous product pages.
+
+Pages are stored per slug together with their ETag and Last-Modified
+values, so a repeat visit is answered from the cache (or with a 304)
+without touching the database. Item signals purge the entry whenever the
+item changes; see core.signals.
+"""
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .cart import CacheStats
+
+PAGE_CACHE = getattr(settings, 'PAGE_CACHE', 'default')
+PAGE_CACHE_TIMEOUT = getattr(settings, 'PAGE_CACHE_TIMEOUT', 60 * 60 * 24)
+
+page_cache_stats = CacheStats()
+
+
+def product_page_key(slug):
+    return f"product-page:{slug}"
+
+
+def item_etag(item):
+    return f'"{item.pk}-{int(item.modified.timestamp() * 1000000)}"'
+
+
+def invalidate_product_pages(slugs):
+    caches[PAGE_CACHE].delete_many([product_page_key(slug) for slug in slugs])
+
+
+def _finish(request, response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return get_conditional_response(
+        request, etag=etag, last_modified=last_modified, response=response)
+
+
+def cached_product_page(request, slug, render_page):
+    """
+    Serve the product page for slug from the page cache. On a miss
+    render_page() is called; it returns (item, response).
+    """
+    cache = caches[PAGE_CACHE]
+    key = product_page_key(slug)
+    entry = cache.get(key)
+    if entry is not None:
+        page_cache_stats.hit()
+        response = HttpResponse(entry['content'],
+                                content_type=entry['content_type'])
+        return _finish(request, response, entry['etag'], entry['last_modified'])
+
+    page_cache_stats.miss()
+    item, response = render_page()
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        return response
+    etag = item_etag(item)
+    last_modified = int(item.modified.timestamp())
+    cache.set(key, {
+        'content': response.content,
+        'content_type': response['Content-Type'],
+        'etag': etag,
+        'last_modified': last_modified,
+    }, PAGE_CACHE_TIMEOUT)
+    return _finish(request, response, etag, last_modified)
@@ -0,0 +1,427 @@
+import json
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, Min, Q, Sum
+from django.utils import timezone
+
+from .inventory import release, reserve
+from .models import Item, Order, OrderItem, StockReservation
+from .money import from_cents, to_cents
+
+# the navbar badge is cached per user; Django's default cache is a
+# local-memory backend unless CACHES says otherwise
+CART_COUNT_CACHE = getattr(settings, 'CART_COUNT_CACHE', 'default')
+CART_COUNT_TIMEOUT = getattr(settings, 'CART_COUNT_TIMEOUT', 60 * 60)
+# open carts older than this are deleted by manage.py cleanup_carts
+ABANDONED_CART_DAYS = getattr(settings, 'ABANDONED_CART_DAYS', 30)
+
+
+class Cart:
+    """
+    A user's open order together with its priced lines and totals.
+
+    Everything a cart page needs is loaded up front with a fixed number of
+    queries (the order, which carries the totals, and its lines joined to
+    their items), so templates never have to walk order.items or
+    order_item.item.
+    """
+
+    def __init__(self, order, lines, totals):
+        self.order = order
+        self.lines = lines
+        self.total = totals['total'] or from_cents(0)
+        self.savings = totals['savings'] or from_cents(0)
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __iter__(self):
+        return iter(self.lines)
+
+    @property
+    def item_count(self):
+        return len(self.lines)
+
+
+def get_cart(user):
+    """Return the Cart for the user's open order, or None if there is none."""
+    order = Order.objects.filter(user=user, ordered=False).first()
+    if order is None:
+        return None
+    lines = list(order.items.with_prices().order_by('pk'))
+    return Cart(order, lines, {'total': order.total, 'savings': order.discount_total})
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for a cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def as_dict(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+
+cart_count_stats = CacheStats()
+
+
+def _cart_count_key(user_id):
+    return f"cart-count:{user_id}"
+
+
+def get_cart_item_count(user):
+    """
+    Number of lines in the user's open order, served from the cache when
+    possible. A miss reads the order's item_count.
+    """
+    cache = caches[CART_COUNT_CACHE]
+    key = _cart_count_key(user.pk)
+    count = cache.get(key)
+    if count is not None:
+        cart_count_stats.hit()
+        return count
+    cart_count_stats.miss()
+    count = Order.objects.filter(user=user, ordered=False).values_list(
+        'item_count', flat=True).first() or 0
+    cache.set(key, count, CART_COUNT_TIMEOUT)
+    return count
+
+
+def invalidate_cart_item_count(user):
+    caches[CART_COUNT_CACHE].delete(_cart_count_key(user.pk))
+
+
+def invalidate_cart_item_counts(user_ids):
+    caches[CART_COUNT_CACHE].delete_many([_cart_count_key(pk) for pk in user_ids])
+
+
+# outcomes of the cart mutations below, used by the views to pick a message
+ITEM_ADDED = 'added'
+QUANTITY_UPDATED = 'updated'
+ITEM_REMOVED = 'removed'
+NOT_IN_CART = 'not-in-cart'
+NO_ACTIVE_ORDER = 'no-active-order'
+OUT_OF_STOCK = 'out-of-stock'
+PAYMENT_PENDING = 'payment-pending'
+
+
+def _open_lines(user, item):
+    # the line for this item in the user's open order; joining through the
+    # order keeps lines left behind by earlier orders out of the way, and a
+    # cart with a payment in flight is frozen until the payment settles
+    return OrderItem.objects.filter(
+        user=user, item=item, ordered=False,
+        order__user=user, order__ordered=False, order__payment__isnull=True)
+
+
+def _line_cents(item, quantity):
+    # (subtotal, discount) of quantity units, priced like with_prices()
+    price = quantity * to_cents(item.price)
+    if item.discount_price and item.discount_price > 0:
+        return price, price - quantity * to_cents(item.discount_price)
+    return price, 0
+
+
+def _move_totals(user, lines=0, cents=(0, 0)):
+    # apply a mutation to the open order's stored totals as a delta, in the
+    # mutation's transaction; concurrent mutations add up like the line
+    # quantities do
+    subtotal, discount = cents
+    Order.objects.filter(user=user, ordered=False).update(
+        item_count=F('item_count') + lines,
+        subtotal_cents=F('subtotal_cents') + subtotal,
+        discount_total_cents=F('discount_total_cents') + discount,
+        total_cents=F('total_cents') + (subtotal - discount),
+    )
+
+
+def _take_line(user, item):
+    # delete the item's open line; its quantity, or None without one
+    quantity = _open_lines(user, item).select_for_update(of=('self',)).values_list(
+        'order_quantity', flat=True).first()
+    if quantity is not None:
+        _open_lines(user, item).delete()
+    return quantity
+
+
+def _missing_line_outcome(user):
+    order = Order.objects.filter(user=user, ordered=False).first()
+    if order is None:
+        return NO_ACTIVE_ORDER
+    if order.payment_id:
+        return PAYMENT_PENDING
+    return NOT_IN_CART
+
+
+def add_item(user, item):
+    """
+    Add one of item to the user's cart.
+
+    An existing line is bumped with a single conditional UPDATE
+    (order_quantity = order_quantity + 1), so concurrent clicks never lose
+    an increment. Only the first add of an item inserts rows. Each unit is
+    reserved from stock first; see core.inventory. The order's totals move
+    by the item's price.
+    """
+    with transaction.atomic():
+        if not reserve(user, item):
+            return OUT_OF_STOCK
+        if _open_lines(user, item).update(order_quantity=F('order_quantity') + 1):
+            _move_totals(user, cents=_line_cents(item, 1))
+            return QUANTITY_UPDATED
+        order, _ = Order.objects.get_or_create(
+            user=user, ordered=False,
+            defaults={'ordered_date': timezone.now()})
+        if order.payment_id:
+            # undo the reservation above
+            transaction.set_rollback(True)
+            return PAYMENT_PENDING
+        try:
+            with transaction.atomic():
+                order_item = OrderItem.objects.create(user=user, item=item)
+                Order.items.through.objects.create(
+                    order=order, orderitem=order_item)
+        except IntegrityError:
+            # another request inserted the line first; count this click on it
+            _open_lines(user, item).update(
+                order_quantity=F('order_quantity') + 1)
+            _move_totals(user, cents=_line_cents(item, 1))
+            return QUANTITY_UPDATED
+        _move_totals(user, lines=1, cents=_line_cents(item, 1))
+    invalidate_cart_item_count(user)
+    return ITEM_ADDED
+
+
+def remove_single_item(user, item):
+    """Take one of item out of the user's cart, dropping the line at zero."""
+    with transaction.atomic():
+        lines = _open_lines(user, item)
+        if lines.filter(order_quantity__gt=1).update(
+                order_quantity=F('order_quantity') - 1):
+            release(user, item, 1)
+            _move_totals(user, cents=_line_cents(item, -1))
+            return QUANTITY_UPDATED
+        quantity = _take_line(user, item)
+        if quantity is None:
+            return _missing_line_outcome(user)
+        release(user, item)
+        _move_totals(user, lines=-1, cents=_line_cents(item, -quantity))
+    invalidate_cart_item_count(user)
+    return QUANTITY_UPDATED
+
+
+def remove_item(user, item):
+    """Remove the whole line for item from the user's cart."""
+    with transaction.atomic():
+        quantity = _take_line(user, item)
+        if quantity is None:
+            return _missing_line_outcome(user)
+        release(user, item)
+        _move_totals(user, lines=-1, cents=_line_cents(item, -quantity))
+    invalidate_cart_item_count(user)
+    return ITEM_REMOVED
+
+
+def merge_lines(user, quantities):
+    """
+    Add {item_id: quantity} (a visitor's session cart, see core.session_cart)
+    to the user's cart in bulk: a single UPDATE for the lines already in the
+    cart and a single INSERT for the new ones, instead of one add_item per
+    unit. Units are reserved as in add_item; an item without enough stock
+    is left out. Returns the Items left out, or PAYMENT_PENDING (merging
+    nothing) while the cart is frozen.
+    """
+    items = Item.objects.in_bulk(list(quantities))
+    left_out = []
+    with transaction.atomic():
+        order, _ = Order.objects.get_or_create(
+            user=user, ordered=False,
+            defaults={'ordered_date': timezone.now()})
+        if order.payment_id:
+            return PAYMENT_PENDING
+        existing = {line.item_id: line for line in OrderItem.objects.filter(
+            user=user, item__in=items, ordered=False,
+            order__user=user, order__ordered=False)}
+        bumped, added = [], []
+        subtotal = discount = 0
+        for item_id, quantity in quantities.items():
+            item = items.get(item_id)
+            if item is None:
+                continue  # deleted since it was put in the cart
+            if not reserve(user, item, quantity):
+                left_out.append(item)
+                continue
+            price, saved = _line_cents(item, quantity)
+            subtotal += price
+            discount += saved
+            if item_id in existing:
+                line = existing[item_id]
+                line.order_quantity = F('order_quantity') + quantity
+                bumped.append(line)
+            else:
+                added.append(OrderItem(user=user, item=item, order_quantity=quantity))
+        if bumped:
+            OrderItem.objects.bulk_update(bumped, ['order_quantity'])
+        if added:
+            # bulk_create does not return primary keys on every backend, so the
+            # new lines are read back (they are the user's only open lines for
+            # their items) to link them to the order
+            OrderItem.objects.bulk_create(added)
+            Order.items.through.objects.bulk_create([
+                Order.items.through(order=order, orderitem_id=pk)
+                for pk in OrderItem.objects.filter(
+                    user=user, ordered=False,
+                    item__in=[line.item_id for line in added],
+                ).values_list('pk', flat=True)])
+        _move_totals(user, lines=len(added), cents=(subtotal, discount))
+    invalidate_cart_item_count(user)
+    return left_out
+
+
+TOTAL_FIELDS = ['item_count', 'subtotal_cents', 'discount_total_cents', 'total_cents']
+
+
+def refresh_cart_totals(order_ids, repair=True):
+    """
+    Recompute the stored totals of the given orders from their lines (one
+    aggregate query) and, with repair, write back the ones that had drifted
+    in one bulk UPDATE. Returns the drifted Orders, with the true totals.
+    """
+    with transaction.atomic():
+        orders = list(Order.objects.select_for_update().filter(
+            pk__in=order_ids).only('pk', *TOTAL_FIELDS))
+        sums = {row['order']: row for row in OrderItem.objects.filter(
+            order__in=order_ids,
+        ).with_prices().values('order').annotate(
+            lines=Count('pk'),
+            subtotal=Sum('line_price_cents'),
+            discount=Sum('line_savings_cents'),
+        )}
+        drifted = []
+        for order in orders:
+            row = sums.get(order.pk, {})
+            subtotal, discount = row.get('subtotal') or 0, row.get('discount') or 0
+            true = [row.get('lines', 0), subtotal, discount, subtotal - discount]
+            if [getattr(order, name) for name in TOTAL_FIELDS] != true:
+                for name, value in zip(TOTAL_FIELDS, true):
+                    setattr(order, name, value)
+                drifted.append(order)
+        if drifted and repair:
+            Order.objects.bulk_update(drifted, TOTAL_FIELDS)
+    return drifted
+
+
+def refresh_item_carts(item_ids, batch_size=500):
+    """
+    Re-price the open carts holding any of the items, after their prices
+    changed; the deltas the carts were built from are stale.
+    """
+    order_ids = list(Order.objects.filter(
+        ordered=False, items__item__in=item_ids).values_list('pk', flat=True).distinct())
+    for start in range(0, len(order_ids), batch_size):
+        refresh_cart_totals(order_ids[start:start + batch_size])
+
+
+def _pk_windows(queryset, batch_size):
+    bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+    if bounds['low'] is None:
+        return
+    for low in range(bounds['low'], bounds['high'] + 1, batch_size):
+        yield low, low + batch_size
+
+
+def abandoned_cart_batches(created_before, batch_size=500, archive=None, now=None):
+    """
+    Delete open orders created before `created_before`, with their lines,
+    batch_size consecutive primary keys at a time, each batch in its own
+    short transaction so no lock is held for long. Carts with a payment in
+    flight or a live stock hold (their owner is shopping right now) are
+    kept. With `archive`, a text file, each deleted cart is first written
+    to it as a line of JSON. The owners' cached cart counts are dropped.
+
+    A generator: yields (orders, lines) deleted per batch.
+    """
+    now = now or timezone.now()
+    open_orders = Order.objects.filter(ordered=False)
+    active = StockReservation.objects.filter(expires_at__gt=now).values('user_id')
+    for low, high in _pk_windows(open_orders, batch_size):
+        with transaction.atomic():
+            orders = list(open_orders.filter(
+                pk__gte=low, pk__lt=high, payment__isnull=True,
+                order_created_date__lt=created_before,
+            ).exclude(user_id__in=active).values_list('pk', 'user_id', 'order_created_date'))
+            if not orders:
+                continue
+            pks = [pk for pk, _, _ in orders]
+            links = list(Order.items.through.objects.filter(order_id__in=pks).values_list(
+                'order_id', 'orderitem_id', 'orderitem__item_id', 'orderitem__order_quantity'))
+            if archive is not None:
+                lines = {}
+                for order_id, _, item_id, quantity in links:
+                    lines.setdefault(order_id, []).append([item_id, quantity])
+                for pk, user_id, created in orders:
+                    archive.write(json.dumps({
+                        'order': pk, 'user': user_id, 'created': created.isoformat(),
+                        'lines': lines.get(pk, []),
+                    }) + '\n')
+            # the order's links to its lines go with it
+            Order.objects.filter(pk__in=pks).delete()
+            _, deleted = OrderItem.objects.filter(
+                pk__in=[line_pk for _, line_pk, _, _ in links]).delete()
+        invalidate_cart_item_counts({user_id for _, user_id, _ in orders})
+        yield len(pks), deleted.get(OrderItem._meta.label, 0)
+
+
+def cart_total_batches(batch_size=500, repair=True):
+    """
+    Check the stored totals of every open order against its lines, in
+    primary key windows like abandoned_cart_batches, repairing any that
+    drifted (see refresh_cart_totals). Yields (orders checked, drifted
+    Orders) per batch.
+    """
+    open_orders = Order.objects.filter(ordered=False)
+    for low, high in _pk_windows(open_orders, batch_size):
+        pks = list(open_orders.filter(pk__gte=low, pk__lt=high).values_list('pk', flat=True))
+        if pks:
+            yield len(pks), refresh_cart_totals(pks, repair=repair)
+
+
+def dead_line_batches(batch_size=500):
+    """
+    Delete open lines that belong to no order or have nothing in them, in
+    primary key windows like abandoned_cart_batches. Yields lines deleted
+    per batch.
+    """
+    open_lines = OrderItem.objects.filter(ordered=False)
+    for low, high in _pk_windows(open_lines, batch_size):
+        with transaction.atomic():
+            dead = open_lines.filter(pk__gte=low, pk__lt=high).filter(
+                Q(order__isnull=True) | Q(order_quantity__lte=0))
+            # empty lines still count in their order's item_count
+            carts = list(Order.objects.filter(items__in=dead).values_list('pk', 'user_id'))
+            _, deleted = dead.delete()
+            if carts:
+                refresh_cart_totals([pk for pk, _ in carts])
+        if carts:
+            invalidate_cart_item_counts({user_id for _, user_id in carts})
+        if deleted.get(OrderItem._meta.label):
+            yield deleted[OrderItem._meta.label]
@@ -0,0 +1,180 @@
+"""
+Catalog facets: category, label, sale status and price band.
+
+The counts shown next to each filter are read from the FacetCount table
+instead of a GROUP BY over the catalog, so rendering them costs one small
+query however many Items there are. The Item signals in core.signals apply
+each save or delete as +1/-1 deltas; bulk writes that bypass the signals
+(import_catalog, QuerySet.update()) call rebuild_facet_counts() instead.
+"""
+from collections import Counter, namedtuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Case, CharField, Count, F, Q, Value, When
+)
+
+from .models import CATEGORY_CHOICES, LABEL_CHOICES, FacetCount, Item
+
+# (value, display name, lower bound, upper bound) on the price a customer
+# pays, i.e. the discount price when there is one
+PRICE_BANDS = (
+    ('0-25', 'Under $25', 0, 25),
+    ('25-50', '$25 to $50', 25, 50),
+    ('50-100', '$50 to $100', 50, 100),
+    ('100-', '$100 and over', 100, None),
+)
+
+ON_SALE = '1'
+
+FACETS = (
+    ('category', 'Category', CATEGORY_CHOICES),
+    ('label', 'Label', LABEL_CHOICES),
+    ('discount', 'Sale', ((ON_SALE, 'On sale'),)),
+    ('price', 'Price', tuple((value, name) for value, name, _, _ in PRICE_BANDS)),
+)
+
+# the Item fields the facet values are computed from
+FACET_FIELDS = ('category', 'label', 'price', 'discount_price')
+
+FacetGroup = namedtuple('FacetGroup', ['name', 'title', 'options', 'selected', 'clear_query'])
+FacetOption = namedtuple('FacetOption', ['value', 'name', 'count', 'selected', 'query'])
+
+
+def sale_price(price, discount_price):
+    return discount_price if discount_price and discount_price > 0 else price
+
+
+def price_band(price):
+    for value, _, low, high in PRICE_BANDS:
+        if price >= low and (high is None or price < high):
+            return value
+    return None
+
+
+def facet_values(item):
+    """The (facet, value) pairs an Item is counted under."""
+    values = {
+        ('category', item.category),
+        ('label', item.label),
+    }
+    if item.discount_price and item.discount_price > 0:
+        values.add(('discount', ON_SALE))
+    if item.price is not None:
+        band = price_band(sale_price(item.price, item.discount_price))
+        if band is not None:
+            values.add(('price', band))
+    return frozenset(values)
+
+
+def apply_facet_delta(old, new):
+    """Move one Item's counts from the old set of facet values to the new one."""
+    delta = Counter(new or ())
+    delta.subtract(old or ())
+    for (facet, value), change in delta.items():
+        if not change:
+            continue
+        with transaction.atomic():
+            updated = FacetCount.objects.filter(facet=facet, value=value).update(
+                count=F('count') + change)
+            if updated:
+                continue
+            try:
+                with transaction.atomic():
+                    FacetCount.objects.create(facet=facet, value=value, count=change)
+            except IntegrityError:
+                # created concurrently since the update above
+                FacetCount.objects.filter(facet=facet, value=value).update(
+                    count=F('count') + change)
+
+
+def price_band_q(low, high):
+    """Items whose price paid is in [low, high); high None is unbounded."""
+    # spelled out per column rather than on a CASE annotation, which SQLite
+    # would compare with the bound as text
+    def between(field):
+        condition = Q(**{f'{field}__gte': low})
+        if high is not None:
+            condition &= Q(**{f'{field}__lt': high})
+        return condition
+    on_sale = Q(discount_price__gt=0)
+    return (on_sale & between('discount_price')) | (~on_sale & between('price'))
+
+
+def price_band_expression():
+    return Case(*[When(price_band_q(low, high), then=Value(value))
+                  for value, _, low, high in PRICE_BANDS],
+                default=None, output_field=CharField())
+
+
+def rebuild_facet_counts():
+    """Recount every facet from the Items; one GROUP BY per facet."""
+    rows = []
+    for field in ('category', 'label'):
+        for row in Item.objects.values(field).annotate(n=Count('pk')).order_by():
+            rows.append(FacetCount(facet=field, value=row[field], count=row['n']))
+    on_sale = Item.objects.filter(discount_price__gt=0).count()
+    rows.append(FacetCount(facet='discount', value=ON_SALE, count=on_sale))
+    bands = Item.objects.annotate(band=price_band_expression()).values(
+        'band').annotate(n=Count('pk')).order_by()
+    for row in bands:
+        if row['band'] is not None:
+            rows.append(FacetCount(facet='price', value=row['band'], count=row['n']))
+    with transaction.atomic():
+        FacetCount.objects.all().delete()
+        FacetCount.objects.bulk_create(rows)
+
+
+def selected_facets(params):
+    """The valid facet filters in a QueryDict, as {facet: value}."""
+    selected = {}
+    for facet, _, choices in FACETS:
+        value = params.get(facet)
+        if value in dict(choices):
+            selected[facet] = value
+    return selected
+
+
+def filter_items(queryset, selected):
+    if 'category' in selected:
+        queryset = queryset.filter(category=selected['category'])
+    if 'label' in selected:
+        queryset = queryset.filter(label=selected['label'])
+    if 'discount' in selected:
+        queryset = queryset.filter(discount_price__gt=0)
+    if 'price' in selected:
+        _, _, low, high = next(
+            band for band in PRICE_BANDS if band[0] == selected['price'])
+        queryset = queryset.filter(price_band_q(low, high))
+    return queryset
+
+
+def _query(params, facet, value):
+    query = params.copy()
+    # a new filter starts again from the first page
+    query.pop('cursor', None)
+    if value is None:
+        query.pop(facet, None)
+    else:
+        query[facet] = value
+    return query.urlencode()
+
+
+def facet_groups(params, selected):
+    """
+    The facets with their counts and the query strings that select or
+    clear each value, for the catalog filter bar. One query.
+    """
+    counts = {(facet, value): count for facet, value, count in
+              FacetCount.objects.values_list('facet', 'value', 'count')}
+    groups = []
+    for facet, title, choices in FACETS:
+        options = []
+        for value, name in choices:
+            is_selected = selected.get(facet) == value
+            options.append(FacetOption(
+                value, name, counts.get((facet, value), 0), is_selected,
+                _query(params, facet, None if is_selected else value)))
+        groups.append(FacetGroup(facet, title, options, selected.get(facet),
+                                 _query(params, facet, None)))
+    return groups
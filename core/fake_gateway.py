@@ -0,0 +1,139 @@
+"""
+What the local stand-ins for the payment processors (core.fake_stripe,
+core.fake_paypal) share: a threaded HTTP server answering JSON after
+`latency` seconds, idempotent replays, and injected faults.
+
+Like the real APIs, a request repeating an idempotency key (Stripe's
+Idempotency-Key, PayPal's PayPal-Request-Id) gets the first answer back
+without charging again. fail_next() and stall_next() make the next
+requests fail with a given HTTP status (429 rate limits, 5xx errors) or
+answer late, for exercising the retries and circuit breaker in
+core.gateway.
+"""
+import itertools
+import json
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGateway:
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0):
+        self.latency = latency
+        # idempotency key -> (status, body) of the first request with it
+        self.replies = {}
+        self.requests = 0
+        self._faults = deque()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self.server.handle_error = self._handle_error
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reset(self):
+        with self._lock:
+            self.replies.clear()
+            self.requests = 0
+            self._faults.clear()
+
+    def fail_next(self, count=1, status=429):
+        with self._lock:
+            self._faults.extend([('fail', status)] * count)
+
+    def stall_next(self, count=1, seconds=1.0):
+        with self._lock:
+            self._faults.extend([('stall', seconds)] * count)
+
+    def handle(self, answer, key=None):
+        """
+        The (status, body) answer to a request, faults first; answer() is
+        called for a request that is not a replay.
+        """
+        with self._lock:
+            self.requests += 1
+            fault = self._faults.popleft() if self._faults else None
+        if fault and fault[0] == 'fail':
+            return fault[1], self.fault(fault[1])
+        if fault and fault[0] == 'stall':
+            time.sleep(fault[1])
+        return self.reply(answer, key)
+
+    def reply(self, answer, key=None):
+        """answer(), replayed for a repeated key."""
+        if key is not None:
+            with self._lock:
+                if key in self.replies:
+                    return self.replies[key]
+        time.sleep(self.latency)
+        result = answer()
+        if key is not None:
+            with self._lock:
+                # of two requests racing with one key, the first answer sticks
+                result = self.replies.setdefault(key, result)
+        return result
+
+    def next_id(self):
+        with self._lock:
+            return next(self._ids)
+
+    def fault(self, status):
+        """The error body of an injected failure with HTTP `status`."""
+        raise NotImplementedError
+
+    def route(self, method, path, headers, body):
+        """The (status, body) answer to one HTTP request."""
+        raise NotImplementedError
+
+    def _handle_error(self, request, client_address):
+        # a client that timed out (see stall_next) has hung up; that is
+        # expected, anything else gets the default traceback
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            ThreadingHTTPServer.handle_error(self.server, request, client_address)
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # headers and body go out as separate writes; with Nagle on, a
+            # kept-alive connection waits ~40ms for the delayed ACK between them
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                self.answer('GET')
+
+            def do_POST(self):
+                self.answer('POST')
+
+            def answer(self, method):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode()
+                status, reply = fake.route(method, self.path.split('?')[0], self.headers, body)
+                payload = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
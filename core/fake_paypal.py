@@ -0,0 +1,140 @@
+"""
+A stand-in for the PayPal Orders v2 API, for tests, benchmarks and local
+development (manage.py fake_paypal). Point core.paypal.client.api_base
+(or the PAYPAL_API_BASE setting) at FakePayPal.url.
+
+POST /v1/oauth2/token hands out access tokens for any client id and
+secret. POST /v2/checkout/orders creates an order, which, with no buyer
+to click through PayPal's window, is approved at once; create_order()
+does the same without HTTP. GET /v2/checkout/orders/<id> shows an order.
+POST /v2/checkout/orders/<id>/capture answers with the completed
+capture, or with PayPal's INSTRUMENT_DECLINED error for an order created
+with decline=True; capture_status='PENDING' (or 'DECLINED') gives a
+capture that did not complete. The order endpoints answer after `latency` seconds.
+Replays and injected faults are core.fake_gateway's; the token endpoint
+is exempt from faults and not counted in `requests`.
+"""
+import json
+import re
+from decimal import Decimal
+
+from .fake_gateway import FakeGateway
+
+ORDER_PATH = re.compile(r'^/v2/checkout/orders/([^/]+)$')
+CAPTURE_PATH = re.compile(r'^/v2/checkout/orders/([^/]+)/capture$')
+
+
+def _error(status, name, message, issue=None):
+    body = {'name': name, 'message': message, 'debug_id': 'fake'}
+    if issue:
+        body['details'] = [{'issue': issue, 'description': message}]
+    return status, body
+
+
+class FakePayPal(FakeGateway):
+    def __init__(self, *args, **kwargs):
+        self.orders = {}
+        self.captures = []
+        self.tokens = set()
+        self.token_requests = 0
+        super().__init__(*args, **kwargs)
+
+    def reset(self):
+        super().reset()
+        with self._lock:
+            self.orders.clear()
+            self.captures.clear()
+            self.tokens.clear()
+            self.token_requests = 0
+
+    def expire_tokens(self):
+        with self._lock:
+            self.tokens.clear()
+
+    def create_order(self, value, currency='USD', decline=False, capture_status='COMPLETED'):
+        """An approved order for `value` (e.g. '24.68'); returns its id."""
+        order_id = f"ORDER-FAKE-{self.next_id()}"
+        with self._lock:
+            self.orders[order_id] = {
+                'amount': {'currency_code': currency, 'value': str(Decimal(value))},
+                'status': 'APPROVED',
+                'decline': decline,
+                'capture_status': capture_status,
+            }
+        return order_id
+
+    def fault(self, status):
+        if status == 429:
+            return _error(429, 'RATE_LIMIT_REACHED', f"Injected {status}")[1]
+        return _error(status, 'INTERNAL_SERVER_ERROR', f"Injected {status}")[1]
+
+    def route(self, method, path, headers, body):
+        if method == 'POST' and path == '/v1/oauth2/token':
+            return self.token(headers)
+        if (headers.get('Authorization') or '').replace('Bearer ', '', 1) not in self.tokens:
+            return _error(401, 'AUTHENTICATION_FAILURE', 'Authentication failed due to '
+                                                         'invalid authentication credentials')
+        key = headers.get('PayPal-Request-Id')
+        if method == 'POST' and path == '/v2/checkout/orders':
+            return self.handle(lambda: self.create(body), key)
+        match = ORDER_PATH.match(path)
+        if method == 'GET' and match:
+            return self.handle(lambda: self.show(match.group(1)))
+        match = CAPTURE_PATH.match(path)
+        if method == 'POST' and match:
+            return self.handle(lambda: self.capture(match.group(1)), key)
+        return _error(404, 'RESOURCE_NOT_FOUND', f"No such resource ({method}: {path})")
+
+    def token(self, headers):
+        if not (headers.get('Authorization') or '').startswith('Basic '):
+            return 401, {'error': 'invalid_client',
+                         'error_description': 'Client Authentication failed'}
+        with self._lock:
+            self.token_requests += 1
+            token = f"A21-fake-{self.token_requests}"
+            self.tokens.add(token)
+        return 200, {'access_token': token, 'token_type': 'Bearer', 'expires_in': 32400}
+
+    def create(self, body):
+        unit = json.loads(body or '{}').get('purchase_units', [{}])[0]
+        amount = unit.get('amount', {})
+        order_id = self.create_order(amount.get('value', '0'), amount.get('currency_code', 'USD'))
+        return 201, {'id': order_id, 'status': 'APPROVED'}
+
+    def show(self, order_id):
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None:
+                return _error(404, 'RESOURCE_NOT_FOUND', 'The specified resource does not exist.',
+                              'INVALID_RESOURCE_ID')
+            return 200, {'id': order_id, 'status': order['status'],
+                         'purchase_units': [{'amount': order['amount']}]}
+
+    def capture(self, order_id):
+        """The (status, body) answer to capturing one order."""
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None:
+                return _error(404, 'RESOURCE_NOT_FOUND', 'The specified resource does not exist.',
+                              'INVALID_RESOURCE_ID')
+            if order['decline']:
+                return _error(422, 'UNPROCESSABLE_ENTITY', 'The instrument presented was '
+                                                           'declined.', 'INSTRUMENT_DECLINED')
+            if order['status'] == 'COMPLETED':
+                return _error(422, 'UNPROCESSABLE_ENTITY', 'Order already captured.',
+                              'ORDER_ALREADY_CAPTURED')
+            order['status'] = 'COMPLETED'
+        capture = {
+            'id': f"CAPTURE-FAKE-{self.next_id()}",
+            'status': order['capture_status'],
+            'amount': order['amount'],
+        }
+        if order['capture_status'] == 'PENDING':
+            capture['status_details'] = {'reason': 'PENDING_REVIEW'}
+        with self._lock:
+            self.captures.append(capture)
+        return 201, {
+            'id': order_id,
+            'status': 'COMPLETED',
+            'purchase_units': [{'payments': {'captures': [capture]}}],
+        }
@@ -0,0 +1,59 @@
+"""
+A stand-in for the Stripe charges API, for tests, benchmarks and local
+development (manage.py fake_stripe). Point stripe.api_base (or the
+STRIPE_API_BASE setting) at FakeStripe.url.
+
+POST /v1/charges answers after `latency` seconds with a succeeded charge,
+or with Stripe's card_declined error for the tok_chargeDeclined token.
+Replays and injected faults are core.fake_gateway's.
+"""
+from urllib.parse import parse_qs
+
+from .fake_gateway import FakeGateway
+
+DECLINED_TOKEN = 'tok_chargeDeclined'
+
+
+class FakeStripe(FakeGateway):
+    def __init__(self, *args, **kwargs):
+        self.charges = []
+        super().__init__(*args, **kwargs)
+
+    def reset(self):
+        super().reset()
+        with self._lock:
+            self.charges.clear()
+
+    def fault(self, status):
+        return {'error': {
+            'type': 'rate_limit_error' if status == 429 else 'api_error',
+            'message': f"Injected {status}",
+        }}
+
+    def route(self, method, path, headers, body):
+        if method == 'POST' and path == '/v1/charges':
+            params = {key: values[-1] for key, values in parse_qs(body).items()}
+            return self.handle(lambda: self.charge(params), headers.get('Idempotency-Key'))
+        return 404, {'error': {
+            'type': 'invalid_request_error',
+            'message': f"Unrecognized request URL ({method}: {path})"}}
+
+    def charge(self, params):
+        """The (status, body) answer to one charge request."""
+        if params.get('source') == DECLINED_TOKEN:
+            return 402, {'error': {
+                'type': 'card_error',
+                'code': 'card_declined',
+                'message': 'Your card was declined.',
+            }}
+        charge = {
+            'id': f"ch_fake_{self.next_id()}",
+            'object': 'charge',
+            'amount': int(params['amount']),
+            'currency': params.get('currency', 'usd'),
+            'paid': True,
+            'status': 'succeeded',
+        }
+        with self._lock:
+            self.charges.append(charge)
+        return 200, charge
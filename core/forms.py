@@ -6,6 +6,8 @@ PAYMENT_CHOICES = (
     ('S', 'Stripe'),
     ('P', 'Paypal')
 )
+# the core.gateway processor each choice pays through
+CHOICE_PROCESSORS = {'S': 'stripe', 'P': 'paypal'}
 
 
 class CheckoutForm(forms.Form):
@@ -22,9 +24,15 @@ class CheckoutForm(forms.Form):
     zip = forms.CharField(widget=forms.TextInput(attrs={
         'class': 'form-control'
     }))
-    same_shipping_address = forms.BooleanField(
-        required=False, widget=forms.CheckboxInput())
     save_info = forms.BooleanField(
         required=False, widget=forms.CheckboxInput())
     payment_option = forms.ChoiceField(
         widget=forms.RadioSelect, choices=PAYMENT_CHOICES)
+
+
+class SavedAddressForm(forms.Form):
+    # a BillingAddress from the user's address book; checked by the update
+    # that uses it (core.addresses.use_saved_address)
+    saved_address = forms.IntegerField(min_value=1, widget=forms.HiddenInput)
+    payment_option = forms.ChoiceField(
+        widget=forms.RadioSelect, choices=PAYMENT_CHOICES)
@@ -0,0 +1,416 @@
+"""
+The clients the shop talks to its payment processors through.
+
+A processor is plugged in as a backend: StripeBackend (stripe-python) or
+PayPalBackend (core.paypal), which knows how to charge through it and
+which of its errors mean what. PaymentView picks the backend from the
+URL's payment_option. Every backend's calls go over one keep-alive
+connection pool with timeouts we choose (stripe-python's default client
+opens its own sessions and waits up to 80 seconds per call), and one
+Gateway per processor around it
+
+- retries rate limits (429) and connection errors with jittered
+  exponential backoff, honouring Retry-After; charges carry an idempotency
+  key (see core.payments), so a retried charge is never taken twice;
+- stops calling the processor for a while once calls keep failing (a
+  circuit breaker), so that checkouts fail fast with GatewayUnavailable
+  instead of piling up behind timeouts while it is degraded;
+- counts calls, retries, failures and latencies (gateway_stats).
+
+route() moves shoppers to another processor while the one they picked
+has its breaker open or has been slow (a p95 above GATEWAY_SLOW_SECONDS
+over the last GATEWAY_SLOW_WINDOW seconds). Once the window passes
+without calls it is tried again.
+"""
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.conf import settings
+
+import requests
+import stripe
+from stripe.http_client import RequestsClient
+
+from . import paypal
+from .latency import percentile, summarize
+from .money import from_cents
+
+# (connect, read) seconds for one HTTP call to Stripe
+STRIPE_TIMEOUT = getattr(settings, 'STRIPE_TIMEOUT', (3.05, 10))
+STRIPE_POOL_SIZE = getattr(settings, 'STRIPE_POOL_SIZE', 16)
+# further tries after the first; backoff doubles from GATEWAY_RETRY_BACKOFF
+GATEWAY_RETRIES = getattr(settings, 'GATEWAY_RETRIES', 3)
+GATEWAY_RETRY_BACKOFF = getattr(settings, 'GATEWAY_RETRY_BACKOFF', 0.25)
+GATEWAY_RETRY_MAX_BACKOFF = getattr(settings, 'GATEWAY_RETRY_MAX_BACKOFF', 4.0)
+# consecutive failed calls that open a breaker, and seconds it stays open
+GATEWAY_BREAKER_THRESHOLD = getattr(settings, 'GATEWAY_BREAKER_THRESHOLD', 5)
+GATEWAY_BREAKER_RESET = getattr(settings, 'GATEWAY_BREAKER_RESET', 30)
+# a processor whose calls of the last GATEWAY_SLOW_WINDOW seconds (at least
+# GATEWAY_SLOW_SAMPLES of them) took longer than this at p95 is avoided
+GATEWAY_SLOW_SECONDS = getattr(settings, 'GATEWAY_SLOW_SECONDS', 2.0)
+GATEWAY_SLOW_WINDOW = getattr(settings, 'GATEWAY_SLOW_WINDOW', 60)
+GATEWAY_SLOW_SAMPLES = getattr(settings, 'GATEWAY_SLOW_SAMPLES', 20)
+# the processors offered, in order of preference when one is avoided
+PAYMENT_PROCESSORS = tuple(getattr(settings, 'PAYMENT_PROCESSORS', ('stripe', 'paypal')))
+
+
+class GatewayUnavailable(Exception):
+    """The circuit breaker is open; the processor was not called."""
+
+
+class PooledHTTPClient(RequestsClient):
+    """
+    stripe's requests client over one shared session, whose connection pool
+    keeps up to `pool_size` connections to Stripe alive across threads. The
+    timeout can be overridden per thread for a block of calls.
+    """
+
+    def __init__(self, pool_size=STRIPE_POOL_SIZE, timeout=STRIPE_TIMEOUT):
+        self._local = threading.local()
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        super().__init__(timeout=timeout, session=session)
+
+    @property
+    def _timeout(self):
+        return getattr(self._local, 'timeout', None) or self.default_timeout
+
+    @_timeout.setter
+    def _timeout(self, value):
+        self.default_timeout = value
+
+    @contextmanager
+    def timeout(self, value):
+        self._local.timeout = value
+        try:
+            yield
+        finally:
+            self._local.timeout = None
+
+
+http_client = PooledHTTPClient()
+stripe.default_http_client = http_client
+
+
+class CircuitBreaker:
+    """
+    Closed: calls go through. After `threshold` consecutive failures it
+    opens and refuses calls for `reset_timeout` seconds, then lets a single
+    trial call through (half-open); its outcome closes or re-opens it.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, threshold=GATEWAY_BREAKER_THRESHOLD,
+                 reset_timeout=GATEWAY_BREAKER_RESET, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state()
+
+    def _state(self):
+        if self._opened_at is None:
+            return self.CLOSED
+        if self.clock() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self):
+        """Whether a call may go out now."""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            return False
+
+    def success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.threshold:
+                self._opened_at = self.clock()
+            self._trial = False
+
+
+class GatewayStats:
+    """Thread-safe counters and recent call latencies for a Gateway."""
+
+    def __init__(self, window=1000, clock=time.monotonic):
+        self._lock = threading.Lock()
+        self._window = window
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.retries = 0
+            self.failures = 0
+            self.rejected = 0
+            self.latencies = deque(maxlen=self._window)
+            # (clock(), seconds) of the same calls, for recent_latency
+            self.timed = deque(maxlen=self._window)
+
+    def call(self, seconds, failed):
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+            self.latencies.append(seconds)
+            self.timed.append((self.clock(), seconds))
+
+    def retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def reject(self):
+        with self._lock:
+            self.rejected += 1
+
+    def recent_latency(self, window, pct=95):
+        """(count, latency at the pct percentile) of the last `window` seconds' calls."""
+        with self._lock:
+            since = self.clock() - window
+            samples = [seconds for at, seconds in self.timed if at >= since]
+        return len(samples), percentile(samples, pct)
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'retries': self.retries,
+                'failures': self.failures,
+                'rejected': self.rejected,
+                'latency': summarize(list(self.latencies)),
+            }
+
+
+class Backend:
+    """A payment processor: what its errors mean, and how to charge through it."""
+    name = None
+    label = None
+    # worth another try: the processor did not act on the request
+    retryable = ()
+    # the processor is in trouble (as opposed to a decline or a bad request)
+    degraded = ()
+    # anything the processor's client raises
+    errors = ()
+    # (error class, what the shopper is told), first match
+    messages = ()
+    default_timeout = None
+
+    def timeout(self, value):
+        """A context manager applying `value` to this thread's calls."""
+        raise NotImplementedError
+
+    def charge(self, amount, currency, source, idempotency_key=None):
+        """
+        Charge `amount` integer cents to `source`, what the shopper approved
+        on the payment page. Returns a mapping with the charge's 'id'.
+        """
+        raise NotImplementedError
+
+    def failure_message(self, error):
+        for error_class, message in self.messages:
+            if isinstance(error, error_class):
+                return message
+        return "Oops! Something went wrong. You were not charged. Please try again."
+
+
+class StripeBackend(Backend):
+    name = 'stripe'
+    label = 'Stripe'
+    retryable = (stripe.error.RateLimitError, stripe.error.APIConnectionError)
+    degraded = retryable + (stripe.error.APIError,)
+    errors = (stripe.error.StripeError,)
+    messages = (
+        (stripe.error.RateLimitError, "Rate Limit Error"),
+        (stripe.error.InvalidRequestError, "Invalid Parameter"),
+        (stripe.error.AuthenticationError, "Not Authenticated"),
+        (stripe.error.APIConnectionError, "Network Error"),
+    )
+    default_timeout = STRIPE_TIMEOUT
+
+    def timeout(self, value):
+        return http_client.timeout(value)
+
+    def charge(self, amount, currency, source, idempotency_key=None):
+        # the source is a card token from Stripe Elements
+        return stripe.Charge.create(amount=amount, currency=currency, source=source,
+                                    idempotency_key=idempotency_key)
+
+    def failure_message(self, error):
+        if isinstance(error, stripe.error.CardError):
+            err = (error.json_body or {}).get('error', {})
+            return err.get('message') or "Your card was declined."
+        return super().failure_message(error)
+
+
+class PayPalBackend(Backend):
+    name = 'paypal'
+    label = 'PayPal'
+    retryable = (paypal.RateLimitError, paypal.APIConnectionError)
+    degraded = retryable + (paypal.APIError,)
+    errors = (paypal.PayPalError,)
+    messages = (
+        (paypal.DeclinedError, "PayPal declined the payment. You were not charged. "
+                               "Please choose another way to pay in PayPal."),
+        (paypal.AmountMismatch, "Your PayPal payment did not match your order total. "
+                                "You were not charged. Please try again."),
+        (paypal.RateLimitError, "Rate Limit Error"),
+        (paypal.InvalidRequestError, "Invalid Parameter"),
+        (paypal.AuthenticationError, "Not Authenticated"),
+        (paypal.APIConnectionError, "Network Error"),
+    )
+    default_timeout = paypal.PAYPAL_TIMEOUT
+
+    def __init__(self, client=None):
+        self.client = client or paypal.client
+
+    def timeout(self, value):
+        return self.client.timeout(value)
+
+    def create_order(self, amount, currency, reference=None):
+        """A PayPal order for `amount` cents, for the shopper to approve."""
+        return self.client.create_order(str(from_cents(amount)), currency.upper(),
+                                        custom_id=reference)
+
+    def charge(self, amount, currency, source, idempotency_key=None):
+        # the source is the id of the PayPal order the shopper approved; it
+        # comes from the browser, so its amount is checked before capturing
+        if not source:
+            raise paypal.InvalidRequestError("No PayPal order was approved")
+        ordered = self.client.get_order(source)['purchase_units'][0]['amount']
+        if ((ordered['currency_code'].lower(), Decimal(ordered['value']))
+                != (currency.lower(), from_cents(amount))):
+            raise paypal.AmountMismatch(
+                f"PayPal order {source} is for {ordered['value']} {ordered['currency_code']}, "
+                f"not {from_cents(amount)} {currency.upper()}")
+        order = self.client.capture_order(source, request_id=idempotency_key)
+        capture = order['purchase_units'][0]['payments']['captures'][0]
+        # a PENDING capture (held for review, an eCheck) has not paid yet
+        if capture['status'] != 'COMPLETED':
+            reason = capture.get('status_details', {}).get('reason')
+            raise paypal.DeclinedError(
+                f"PayPal capture {capture['id']} of order {source} is {capture['status']}"
+                + (f" ({reason})" if reason else ''), issue=capture['status'])
+        return {'id': capture['id'], 'status': capture['status'].lower(),
+                'amount': amount, 'currency': currency}
+
+
+BACKENDS = {backend.name: backend for backend in (StripeBackend, PayPalBackend)}
+
+
+class Gateway:
+    def __init__(self, backend=None, timeout=None, retries=GATEWAY_RETRIES,
+                 backoff=GATEWAY_RETRY_BACKOFF, max_backoff=GATEWAY_RETRY_MAX_BACKOFF,
+                 breaker=None, stats=None, sleep=time.sleep):
+        self.backend = backend or StripeBackend()
+        self.timeout = timeout or self.backend.default_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = stats or GatewayStats()
+        self.sleep = sleep
+
+    def charge(self, **params):
+        return self.call(self.backend.charge, **params)
+
+    def call(self, method, **params):
+        """
+        Call `method` of the backend's API, retrying what is worth
+        retrying. Raises the backend's last error once retries run out, or
+        GatewayUnavailable while the breaker is open.
+        """
+        backend = self.backend
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                self.stats.reject()
+                raise GatewayUnavailable(f"{backend.label} is failing; not calling it for now")
+            start = time.perf_counter()
+            try:
+                with backend.timeout(self.timeout):
+                    result = method(**params)
+            except backend.degraded as e:
+                self.stats.call(time.perf_counter() - start, failed=True)
+                self.breaker.failure()
+                if not isinstance(e, backend.retryable) or attempt == self.retries:
+                    raise
+                self.stats.retry()
+                self.sleep(self.delay(attempt, e))
+            except backend.errors:
+                # the processor answered (a decline, a bad request): it is up
+                self.stats.call(time.perf_counter() - start, failed=False)
+                self.breaker.success()
+                raise
+            else:
+                self.stats.call(time.perf_counter() - start, failed=False)
+                self.breaker.success()
+                return result
+
+    def delay(self, attempt, error):
+        """Seconds to wait before retry number `attempt` + 1 ("full jitter")."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = (error.headers or {}).get('Retry-After')
+        if retry_after:
+            try:
+                delay = max(delay, min(self.max_backoff, float(retry_after)))
+            except ValueError:
+                pass
+        return delay
+
+    def healthy(self, slow_seconds=GATEWAY_SLOW_SECONDS, window=GATEWAY_SLOW_WINDOW,
+                min_samples=GATEWAY_SLOW_SAMPLES):
+        """Whether shoppers may be sent here: not failing, and not slow lately."""
+        if self.breaker.state == CircuitBreaker.OPEN:
+            return False
+        count, p95 = self.stats.recent_latency(window)
+        return count < min_samples or p95 <= slow_seconds
+
+
+_gateways = {}
+_gateway_lock = threading.Lock()
+
+
+def get_gateway(processor='stripe'):
+    """The process-wide Gateway of a processor, configured from settings."""
+    with _gateway_lock:
+        if processor not in _gateways:
+            _gateways[processor] = Gateway(BACKENDS[processor]())
+        return _gateways[processor]
+
+
+def route(processor):
+    """
+    The processor a shopper who picked `processor` pays through: that one,
+    unless it is not offered or not healthy and another one is.
+    """
+    candidates = [processor] + [other for other in PAYMENT_PROCESSORS if other != processor]
+    for candidate in candidates:
+        if candidate in PAYMENT_PROCESSORS and get_gateway(candidate).healthy():
+            return candidate
+    return processor if processor in PAYMENT_PROCESSORS else PAYMENT_PROCESSORS[0]
@@ -0,0 +1,144 @@
+"""
+Resized copies ("derivatives") of product images, for srcset.
+
+When an Item's image is uploaded, a small thread pool decodes it once and
+writes a WebP and a JPEG copy at each of IMAGE_WIDTHS no wider than the
+original under content-addressed names,
+derivatives/<first two>/<sha256 of the original>/<width>.<format>. The
+same picture uploaded twice, for one item or two, is resized once, and a
+name never has to be invalidated, so it can be cached for good. Once they
+are written Item.image_digest and the image's dimensions are set and
+Item.modified is bumped, which re-keys the catalog card fragments; until
+then pages show the original.
+
+{% item_image %} (core.templatetags.item_images) turns the digest into a
+<picture> with srcsets without touching storage, and
+build_image_derivatives backfills existing images in parallel.
+
+With IMAGES_EAGER = True (e.g. in tests) derivatives are built inline.
+The pool lives in the web process; an image whose build was lost with a
+process is picked up by the next backfill.
+"""
+import hashlib
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .caching import invalidate_product_pages
+from .models import Item
+
+logger = logging.getLogger(__name__)
+
+IMAGE_WIDTHS = sorted(getattr(settings, 'IMAGE_WIDTHS', (160, 320, 480, 640, 960, 1280)))
+IMAGE_WORKERS = getattr(settings, 'IMAGE_WORKERS', 4)
+IMAGES_EAGER = getattr(settings, 'IMAGES_EAGER', False)
+
+# extension, Pillow format, MIME type, save options; the browser takes the
+# first it supports
+FORMATS = (
+    ('webp', 'WEBP', 'image/webp', {'quality': 80, 'method': 6}),
+    ('jpg', 'JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=IMAGE_WORKERS, thread_name_prefix='images')
+        return _executor
+
+
+def derivative_name(digest, width, extension):
+    return f"derivatives/{digest[:2]}/{digest}/{width}.{extension}"
+
+
+def derivative_widths(source_width):
+    """The widths built for an image source_width pixels wide."""
+    widths = [width for width in IMAGE_WIDTHS if width < source_width]
+    if source_width <= IMAGE_WIDTHS[-1]:
+        widths.append(source_width)
+    return widths
+
+
+def write_derivatives(data):
+    """
+    Write the derivatives of the image in `data` that storage does not
+    have yet. Returns (digest, width, height) of the upright image.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    for width in derivative_widths(image.width):
+        resized = None
+        for extension, image_format, _, options in FORMATS:
+            name = derivative_name(digest, width, extension)
+            if default_storage.exists(name):
+                continue
+            if resized is None:
+                height = max(1, round(image.height * width / image.width))
+                resized = image.resize((width, height), Image.LANCZOS)
+            out = resized.convert('RGB') if image_format == 'JPEG' else resized
+            buffer = io.BytesIO()
+            out.save(buffer, image_format, **options)
+            default_storage.save(name, ContentFile(buffer.getvalue()))
+    return digest, image.width, image.height
+
+
+def build_derivatives(item_id):
+    """
+    Build the derivatives of an item's image and record them on the item.
+    Returns the digest, or None if the item has no image (or had it
+    replaced meanwhile, in which case the new one has its own build).
+    """
+    item = Item.objects.filter(pk=item_id).first()
+    if item is None or not item.image:
+        return None
+    name = item.image.name
+    with item.image.open('rb') as image:
+        data = image.read()
+    digest, width, height = write_derivatives(data)
+    if not Item.objects.filter(pk=item_id, image=name).update(
+            image_digest=digest, image_width=width, image_height=height,
+            modified=timezone.now()):
+        return None
+    invalidate_product_pages({item.slug})
+    return digest
+
+
+def schedule_derivatives(item_id):
+    if IMAGES_EAGER:
+        build_derivatives(item_id)
+    else:
+        # the worker has to see the uploaded image, so wait for the commit
+        transaction.on_commit(
+            lambda: get_executor().submit(run_in_worker, item_id))
+
+
+def try_build_derivatives(item_id):
+    try:
+        return build_derivatives(item_id)
+    except Exception:
+        logger.exception("Could not build the image derivatives of item %s", item_id)
+        return None
+
+
+def run_in_worker(item_id):
+    close_old_connections()
+    try:
+        return try_build_derivatives(item_id)
+    finally:
+        close_old_connections()
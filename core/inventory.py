@@ -0,0 +1,187 @@
+"""
+Stock reservations.
+
+Item.inventory_quantity is the stock still available to sell. Putting an
+item in a cart moves units from it into a StockReservation with a single
+conditional UPDATE (inventory_quantity = inventory_quantity - n WHERE
+inventory_quantity >= n), so two shoppers can never take the same last
+unit. Holds expire after RESERVATION_TTL and are handed back by
+release_expired_reservations (the release_reservations command runs it in
+a loop). At payment, commit_order_stock() turns the holds into a sale,
+re-reserving anything whose hold expired in the meantime.
+
+Reservation rows are changed with compare-and-set updates on their
+quantity rather than row locks, so this works the same on SQLite.
+
+The stock on hand is inventory_quantity plus the units held. Restocking
+(set_stock_on_hand, used by the admin, import_catalog and the restock
+command) sets that total and leaves the holds alone. Items start with no
+stock: after upgrading to reservations, `restock N --empty` gives the
+items that had none tracked something to sell.
+"""
+import datetime
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Item, StockReservation
+
+RESERVATION_TTL = getattr(settings, 'RESERVATION_TTL', datetime.timedelta(minutes=15))
+
+
+class OutOfStock(Exception):
+    def __init__(self, item):
+        super().__init__(f"{item} is out of stock")
+        self.item = item
+
+
+def _take_stock(item, quantity):
+    return Item.objects.filter(
+        pk=item.pk, inventory_quantity__gte=quantity
+    ).update(inventory_quantity=F('inventory_quantity') - quantity) == 1
+
+
+def _return_stock(item_id, quantity):
+    Item.objects.filter(pk=item_id).update(
+        inventory_quantity=F('inventory_quantity') + quantity)
+
+
+def held_quantities(item_ids):
+    """{item id: units held for carts} of the items with holds."""
+    return dict(StockReservation.objects.filter(item_id__in=item_ids)
+                .values_list('item_id').annotate(Sum('quantity')))
+
+
+def stock_on_hand(item):
+    return item.inventory_quantity + held_quantities([item.pk]).get(item.pk, 0)
+
+
+def set_stock_on_hand(item_ids, quantity):
+    """
+    Make quantity the stock on hand of the items, in one UPDATE: what carts
+    hold stays held and the rest is available. With more held than is on
+    hand, inventory_quantity goes negative until enough holds are released.
+    """
+    held = StockReservation.objects.filter(item=OuterRef('pk')).values('item').annotate(
+        total=Sum('quantity')).values('total')
+    return Item.objects.filter(pk__in=item_ids).update(
+        inventory_quantity=Value(quantity) - Coalesce(Subquery(held), 0))
+
+
+def reserve(user, item, quantity=1):
+    """
+    Hold quantity more units of item for the user. Returns False, changing
+    nothing, when there is not enough stock. Refreshes the hold's expiry.
+    """
+    expires_at = timezone.now() + RESERVATION_TTL
+    # no savepoint of its own: a failure rolls back the caller's whole
+    # transaction, stock included
+    with transaction.atomic(savepoint=False):
+        if not _take_stock(item, quantity):
+            return False
+        held = StockReservation.objects.filter(user=user, item=item)
+        if held.update(quantity=F('quantity') + quantity, expires_at=expires_at):
+            return True
+        try:
+            with transaction.atomic():
+                StockReservation.objects.create(
+                    user=user, item=item, quantity=quantity, expires_at=expires_at)
+        except IntegrityError:
+            # another request created the hold first
+            held.update(quantity=F('quantity') + quantity, expires_at=expires_at)
+    return True
+
+
+def _take_reservation(reservation, quantity=None):
+    """
+    Remove up to quantity units (all of them by default) from a hold.
+    Returns the number taken, 0 if the hold changed or went away meanwhile.
+    """
+    quantity = reservation.quantity if quantity is None else min(
+        quantity, reservation.quantity)
+    current = StockReservation.objects.filter(
+        pk=reservation.pk, quantity=reservation.quantity)
+    if quantity == reservation.quantity:
+        return quantity if current.delete()[0] else 0
+    if current.update(quantity=F('quantity') - quantity):
+        return quantity
+    return 0
+
+
+def release(user, item, quantity=None):
+    """Hand back up to quantity held units (all by default) to the stock."""
+    with transaction.atomic(savepoint=False):
+        while True:
+            reservation = StockReservation.objects.filter(
+                user=user, item=item).first()
+            if reservation is None:
+                return 0
+            released = _take_reservation(reservation, quantity)
+            if released:
+                _return_stock(item.pk, released)
+                return released
+
+
+def release_expired_reservations(now=None, batch_size=500):
+    """Return the stock of every expired hold. Returns the units released."""
+    now = now or timezone.now()
+    released = 0
+    while True:
+        expired = list(StockReservation.objects.filter(
+            expires_at__lt=now).order_by('expires_at')[:batch_size])
+        if not expired:
+            return released
+        for reservation in expired:
+            with transaction.atomic():
+                # skipped if a cart or checkout touched the hold meanwhile
+                taken = StockReservation.objects.filter(
+                    pk=reservation.pk, quantity=reservation.quantity,
+                    expires_at__lt=now).delete()[0]
+                if taken:
+                    _return_stock(reservation.item_id, reservation.quantity)
+                    released += reservation.quantity
+        if len(expired) < batch_size:
+            return released
+
+
+def commit_order_stock(order):
+    """
+    Turn the holds on an order's lines into a sale. Lines whose hold has
+    expired (or was never made) take their stock now. Raises OutOfStock if
+    that is no longer possible, so call it inside the transaction that
+    records the payment; an exception rolls the whole sale back.
+    """
+    lines = order.items.select_related('item').order_by('item_id')
+    for line in lines:
+        held = 0
+        while True:
+            reservation = StockReservation.objects.filter(
+                user=order.user_id, item=line.item_id).first()
+            if reservation is None:
+                break
+            held = _take_reservation(reservation)
+            if held:
+                break
+        shortfall = line.order_quantity - held
+        if shortfall > 0 and not _take_stock(line.item, shortfall):
+            raise OutOfStock(line.item)
+        if shortfall < 0:
+            _return_stock(line.item_id, -shortfall)
+
+
+def restore_order_stock(order):
+    """
+    Undo commit_order_stock() after a failed payment: the units go back to
+    being held for the order's lines, with a fresh expiry.
+    """
+    expires_at = timezone.now() + RESERVATION_TTL
+    for line in order.items.order_by('item_id'):
+        held = StockReservation.objects.filter(user=order.user_id, item=line.item_id)
+        if not held.update(quantity=F('quantity') + line.order_quantity,
+                           expires_at=expires_at):
+            StockReservation.objects.create(
+                user_id=order.user_id, item_id=line.item_id,
+                quantity=line.order_quantity, expires_at=expires_at)
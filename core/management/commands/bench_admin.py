@@ -0,0 +1,85 @@
+import time
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.db import connection, reset_queries
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from core.benchmarks import (
+    BenchCommand, format_summary, seed_items, seed_orders, seed_users, summarize)
+from core.models import Item, Order, OrderItem
+
+
+class PlainAdmin(admin.ModelAdmin):
+    # what admin.site.register() gives, plus Django's own search and filter
+    search_fields = ('user__username',)
+    list_filter = ('ordered',)
+
+
+class Command(BenchCommand):
+    help = ('Times admin changelists over a big orders table (seeded up to '
+            '--orders) with the shop\'s ModelAdmins versus plain '
+            'admin.site.register() ones')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=1000000,
+                            help='Orders in the table (seeded up to this many)')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Loads per page')
+
+    def handle(self, *args, **options):
+        self.seed(options['orders'])
+        if connection.vendor == 'sqlite':
+            # gives the estimated count something to read, as autovacuum
+            # does on PostgreSQL
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+        # the requests never log in, so the admin user need not be saved
+        user = get_user_model()(username='bench-admin', is_staff=True, is_superuser=True)
+        username = Order.objects.order_by('-pk').values_list('user__username', flat=True)[0]
+        deep = min(500, max(1, options['orders'] // 100))
+        pages = [
+            (Order, 'orders, page 1', {}),
+            (Order, f'orders, page {deep}', {'p': str(deep - 1)}),
+            (Order, 'orders, username search', {'q': username}),
+            (Order, 'orders, open carts', {'ordered__exact': '0'}),
+            (OrderItem, 'order lines, page 1', {}),
+        ]
+        plain = admin.AdminSite(name='plain')
+        factory = RequestFactory()
+        for model, name, params in pages:
+            for label, model_admin in (
+                    ('plain', PlainAdmin(model, plain)),
+                    ('shop', admin.site._registry[model])):
+                self.load(f"{name} ({label})", model_admin, factory, user, params,
+                          options['repeat'])
+
+    def seed(self, count):
+        missing = count - Order.objects.count()
+        if missing <= 0:
+            return
+        item_ids = list(Item.objects.values_list('pk', flat=True)[:1000])
+        if len(item_ids) < 10:
+            item_ids = seed_items(1000)
+        start = time.perf_counter()
+        per_user = 10
+        users = seed_users(-(-missing // per_user))
+        seed_orders(users, item_ids, lines_per_order=1, orders_per_user=per_user)
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(users) * per_user} orders in {time.perf_counter() - start:.1f}s"))
+
+    def load(self, name, model_admin, factory, user, params, repeat):
+        samples = []
+        for _ in range(repeat):
+            request = factory.get('/admin/', params)
+            request.user = user
+            reset_queries()  # a full query log captures nothing
+            start = time.perf_counter()
+            with CaptureQueriesContext(connection) as queries:
+                response = model_admin.changelist_view(request)
+                response.render()
+            samples.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.status_code
+        self.stdout.write(format_summary(name, summarize(samples))
+                          + f" queries={len(queries)}")
@@ -0,0 +1,43 @@
+import time
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.benchmarks import BenchCommand, seed_items, seed_orders, seed_users
+from core.models import Item, Order, OrderItem
+
+
+class Command(BenchCommand):
+    help = ('Seeds stale open carts (millions of rows by default) next to a '
+            'few fresh ones, then times cleanup_carts deleting them')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--carts', type=int, default=1000000,
+                            help='Stale carts to seed')
+        parser.add_argument('--lines', type=int, default=3,
+                            help='Lines per cart')
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        item_ids = list(Item.objects.values_list('pk', flat=True)[:1000])
+        if len(item_ids) < options['lines']:
+            item_ids = seed_items(1000)
+        start = time.perf_counter()
+        stale = timezone.now() - timedelta(days=90)
+        seed_orders(seed_users(options['carts']), item_ids, lines_per_order=options['lines'],
+                    orders_per_user=1, ordered=False, created=stale)
+        fresh_users = seed_users(100)
+        seed_orders(fresh_users, item_ids, lines_per_order=options['lines'],
+                    orders_per_user=1, ordered=False)
+        rows = options['carts'] * (1 + 2 * options['lines'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {options['carts']} stale carts ({rows} rows with their lines "
+            f"and links) in {time.perf_counter() - start:.1f}s"))
+
+        call_command('cleanup_carts', batch_size=options['batch_size'], stdout=self.stdout)
+        kept = Order.objects.filter(user__in=fresh_users, ordered=False).count()
+        self.stdout.write(
+            f"Fresh carts kept: {kept} of {len(fresh_users)}; open carts left: "
+            f"{Order.objects.filter(ordered=False).count()}, open lines left: "
+            f"{OrderItem.objects.filter(ordered=False).count()}")
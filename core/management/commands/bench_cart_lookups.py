@@ -0,0 +1,74 @@
+import random
+import time
+
+from django.db.models import Max, Min
+
+from core.benchmarks import (
+    BenchCommand, format_summary, measure, seed_items, seed_orders, seed_users
+)
+from core.models import Item, Order, OrderItem
+
+
+class Command(BenchCommand):
+    help = ('Seeds carts and times the hot cart lookups. Run it once before '
+            'and once after "migrate core 0018" (with --skip-seed the second '
+            'time) to compare latency with and without the cart indexes.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--order-items', type=int, default=1000000,
+                            help='Number of OrderItem rows to seed')
+        parser.add_argument('--items', type=int, default=10000,
+                            help='Number of catalog items to seed')
+        parser.add_argument('--repeat', type=int, default=1000,
+                            help='Lookups to time per query')
+        parser.add_argument('--skip-seed', action='store_true',
+                            help='Reuse the rows seeded by an earlier run')
+
+    def handle(self, *args, **options):
+        if not options['skip_seed']:
+            self.seed(options['order_items'], options['items'])
+
+        rng = random.Random(0)
+        users = Order.objects.filter(ordered=False).aggregate(
+            low=Min('user'), high=Max('user'))
+        items = Item.objects.aggregate(low=Min('pk'), high=Max('pk'))
+        if users['low'] is None or items['low'] is None:
+            self.stderr.write('Nothing to look up; seed some carts first.')
+            return
+
+        def user_id():
+            return rng.randint(users['low'], users['high'])
+
+        def item_id():
+            return rng.randint(items['low'], items['high'])
+
+        lookups = [
+            ('open order by user',
+             lambda: Order.objects.filter(user_id=user_id(), ordered=False).first(),
+             Order.objects.filter(user_id=users['low'], ordered=False)),
+            ('open line by user and item',
+             lambda: OrderItem.objects.filter(
+                 user_id=user_id(), item_id=item_id(), ordered=False).first(),
+             OrderItem.objects.filter(
+                 user_id=users['low'], item_id=items['low'], ordered=False)),
+            ('item by slug',
+             lambda: Item.objects.filter(slug=f"bench-item-{item_id()}").first(),
+             Item.objects.filter(slug=f"bench-item-{items['low']}")),
+        ]
+        for name, lookup, queryset in lookups:
+            self.stdout.write(format_summary(name, measure(lookup, options['repeat'])))
+            self.stdout.write('  ' + queryset.explain().replace('\n', '\n  '))
+
+    def seed(self, order_items, items):
+        lines_per_order = 10
+        orders_per_user = 10
+        users = max(1, order_items // (lines_per_order * orders_per_user))
+        start = time.perf_counter()
+        item_ids = seed_items(items)
+        user_ids = seed_users(users)
+        seed_orders(user_ids, item_ids, lines_per_order=lines_per_order,
+                    orders_per_user=orders_per_user, ordered=False)
+        self.stdout.write(self.style.SUCCESS(
+            'Seeded {} order items for {} users in {:.1f}s'.format(
+                users * lines_per_order * orders_per_user, users,
+                time.perf_counter() - start)))
@@ -0,0 +1,99 @@
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+
+from core.benchmarks import (
+    BenchCommand, format_summary, seed_items, seed_users, summarize)
+from core.models import Item
+
+WRITES = ('INSERT', 'UPDATE', 'DELETE')
+
+
+class WriteCounter:
+    """A connection.execute_wrapper counting the statements that write."""
+
+    def __init__(self):
+        self.writes = 0
+        self.session_writes = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip().split(None, 1)[0].upper() in WRITES:
+            if 'django_session' in sql:
+                self.session_writes += 1
+            else:
+                self.writes += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BenchCommand):
+    help = ('Database writes of a typical browsing session (a home page, '
+            'product pages, a few cart changes, the cart page) for a '
+            'logged-in shopper versus a visitor with a session cart')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sessions', type=int, default=200,
+                            help='Browsing sessions per mode')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        items = list(Item.objects.filter(inventory_quantity__gte=100)[:50])
+        if len(items) < 50:
+            seed_items(200)
+            items = list(Item.objects.filter(inventory_quantity__gte=100)[:50])
+        count = options['sessions']
+        users = list(get_user_model().objects.filter(pk__in=seed_users(count * 3)))
+        rng = random.Random(0)
+        plans = [rng.sample(items, 8) for _ in range(count)]
+
+        modes = [
+            ('logged-in shopper', 'django.contrib.sessions.backends.db', users[:count]),
+            ('visitor, db sessions', 'django.contrib.sessions.backends.db',
+             users[count:count * 2]),
+            ('visitor, cookie sessions',
+             'django.contrib.sessions.backends.signed_cookies', users[count * 2:]),
+        ]
+        for name, engine, mode_users in modes:
+            with override_settings(SESSION_ENGINE=engine):
+                self.run(name, plans, mode_users, logged_in=name.startswith('logged'))
+
+    def run(self, name, plans, users, logged_in):
+        browsing, login = WriteCounter(), WriteCounter()
+        samples = []
+        for plan, user in zip(plans, users):
+            client = Client()
+            if logged_in:
+                client.force_login(user)
+            start = time.perf_counter()
+            with connection.execute_wrapper(browsing):
+                self.browse(client, plan)
+            samples.append(time.perf_counter() - start)
+            if not logged_in:
+                # checkout starts with logging in, which merges the cart
+                # (force_login sends user_logged_in just as a password login)
+                with connection.execute_wrapper(login):
+                    client.force_login(user)
+
+        sessions = len(samples)
+        self.stdout.write(format_summary(f"browsing ({name})", summarize(samples)))
+        self.stdout.write(
+            f"  {browsing.writes / sessions:.1f} cart writes + "
+            f"{browsing.session_writes / sessions:.1f} session writes per session"
+            + ('' if logged_in else
+               f"; then login and merge {login.writes / sessions:.1f} writes + "
+               f"{login.session_writes / sessions:.1f} session writes"))
+
+    def browse(self, client, plan):
+        viewed, bought = plan[:5], plan[5:]
+        client.get(reverse('core:home'))
+        for item in viewed:
+            client.get(item.get_absolute_url())
+        for item in bought:
+            client.get(item.get_add_to_cart_url())
+        client.get(bought[0].get_add_to_cart_url())
+        client.get(reverse('core:remove-from-cart', args=[bought[1].slug]))
+        client.get(reverse('core:order-summary'))
@@ -0,0 +1,90 @@
+import threading
+import time
+from queue import Empty, Queue
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+
+import stripe
+
+from core import payments
+from core.benchmarks import (
+    BenchCommand, format_summary, retry_locked, seed_users, summarize)
+from core.cart import add_item
+from core.fake_stripe import FakeStripe
+from core.models import Item, Payment
+
+
+class Command(BenchCommand):
+    help = ('Checkout throughput against a fake Stripe with a slow gateway, '
+            'charging inside the request versus in the background')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=200,
+                            help='Checkouts per mode')
+        parser.add_argument('--workers', type=int, default=8,
+                            help='Concurrent web workers (threads) posting payments')
+        parser.add_argument('--latency', type=float, default=0.5,
+                            help='Seconds the fake gateway takes per charge')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        fake = FakeStripe(latency=options['latency']).start()
+        stripe.api_base = fake.url
+        item = Item.objects.create(
+            title='Checkout bench item', slug=f"checkout-bench-{time.time_ns()}",
+            price=10, category='S', label='P', description='',
+            inventory_quantity=options['orders'] * 2)
+        try:
+            for name, eager in (('charge in request', True), ('background charge', False)):
+                users = get_user_model().objects.filter(
+                    pk__in=seed_users(options['orders']))
+                for user in users:
+                    add_item(user, item)
+                self.run(name, eager, list(users), options['workers'])
+        finally:
+            fake.stop()
+
+    def run(self, name, eager, users, workers):
+        payments.PAYMENTS_EAGER = eager
+        queue = Queue()
+        for user in users:
+            queue.put(user)
+        samples = []
+        url = reverse('core:payment', kwargs={'payment_option': 'stripe'})
+
+        def worker():
+            client = Client()
+            while True:
+                try:
+                    user = queue.get_nowait()
+                except Empty:
+                    connection.close()
+                    return
+                retry_locked(lambda: client.force_login(user))
+                start = time.perf_counter()
+                response = retry_locked(
+                    lambda: client.post(url, {'stripeToken': 'tok_visa'}))
+                samples.append(time.perf_counter() - start)
+                assert response.status_code == 302, response.status_code
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        requests_done = time.perf_counter() - start
+        pending = Payment.objects.filter(user__in=users, status=Payment.PENDING)
+        while retry_locked(pending.exists):
+            time.sleep(0.05)
+        settled = time.perf_counter() - start
+        placed = Payment.objects.filter(user__in=users, status=Payment.SUCCEEDED).count()
+
+        self.stdout.write(format_summary(f"POST payment ({name})", summarize(samples)))
+        self.stdout.write(
+            f"  {len(users) / requests_done:.1f} checkout requests/s, "
+            f"{placed} orders placed at {placed / settled:.1f} orders/s")
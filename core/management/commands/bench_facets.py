@@ -0,0 +1,47 @@
+from django.db.models import Count
+from django.http import QueryDict
+from django.test import Client
+from django.test.utils import setup_test_environment
+
+from core.benchmarks import BenchCommand, format_summary, measure, seed_items
+from core.facets import facet_groups, price_band_expression
+from core.models import Item
+
+
+def group_by_counts():
+    # what the filter bar would cost without the FacetCount table
+    for field in ('category', 'label'):
+        list(Item.objects.values(field).annotate(n=Count('pk')).order_by())
+    Item.objects.filter(discount_price__gt=0).count()
+    list(Item.objects.annotate(band=price_band_expression()).values(
+        'band').annotate(n=Count('pk')).order_by())
+
+
+class Command(BenchCommand):
+    help = ('Grows the catalog step by step and reports the cost of the '
+            'facet counts and the filtered home page at each size')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,100000',
+                            help='Comma separated catalog sizes to measure at')
+        parser.add_argument('--repeat', type=int, default=200,
+                            help='Timed runs per measurement')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        client = Client()
+        params = QueryDict('category=S&price=25-50')
+        for size in sorted(int(s) for s in options['sizes'].split(',')):
+            missing = size - Item.objects.count()
+            if missing > 0:
+                seed_items(missing)
+            self.stdout.write(f"-- {Item.objects.count()} items")
+            self.stdout.write(format_summary(
+                'facet counts (table)',
+                measure(lambda: facet_groups(params, {}), options['repeat'])))
+            self.stdout.write(format_summary(
+                'facet counts (GROUP BY)',
+                measure(group_by_counts, max(1, options['repeat'] // 10))))
+            self.stdout.write(format_summary(
+                'GET /?category=S&price=25-50',
+                measure(lambda: client.get('/', params), options['repeat'])))
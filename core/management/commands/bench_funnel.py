@@ -0,0 +1,298 @@
+import json
+import platform
+import random
+import re
+import subprocess
+import threading
+import time
+from queue import Empty, Queue
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+from django.utils import timezone
+
+import requests
+import stripe
+
+from core.benchmarks import (
+    BenchCommand, format_summary, retry_locked, seed_items, seed_orders, seed_users, summarize)
+from core.fake_stripe import FakeStripe
+from core.models import Item, Payment
+
+# in the order a shopper goes through them
+STEPS = ('home', 'product', 'add-to-cart', 'order-summary', 'checkout',
+         'checkout-submit', 'payment', 'payment-submit', 'payment-status')
+KEY_INPUT = re.compile(r'name="idempotency_key" value="([^"]*)"')
+
+
+class ClientDriver:
+    """Requests through Django's test client, in process: no network."""
+
+    def __init__(self, user):
+        self.client = Client()
+        retry_locked(lambda: self.client.force_login(user))
+
+    def get(self, path):
+        response = self.client.get(path)
+        return response.status_code, response.content.decode()
+
+    def post(self, path, data):
+        response = self.client.post(path, data)
+        return response.status_code, response.content.decode()
+
+
+class HTTPDriver:
+    """Requests over HTTP to a server, with the user's session cookie."""
+
+    def __init__(self, user, base_url):
+        self.base_url = base_url
+        self.session = requests.Session()
+        client = Client()
+        retry_locked(lambda: client.force_login(user))
+        self.session.cookies.set(
+            settings.SESSION_COOKIE_NAME, client.cookies[settings.SESSION_COOKIE_NAME].value)
+
+    def get(self, path):
+        response = self.session.get(self.base_url + path, allow_redirects=False)
+        return response.status_code, response.text
+
+    def post(self, path, data):
+        data = dict(data, csrfmiddlewaretoken=self.session.cookies.get(settings.CSRF_COOKIE_NAME))
+        response = self.session.post(self.base_url + path, data, allow_redirects=False)
+        return response.status_code, response.text
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class Command(BenchCommand):
+    help = ('Times every step of the shopping funnel (home, product pages, '
+            'add to cart, cart, checkout, payment) for many shoppers, against '
+            'a fake Stripe, and can save the results as JSON to compare '
+            'between commits')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200,
+                            help='Shoppers going through the funnel, each a new user')
+        parser.add_argument('--items', type=int, default=1000,
+                            help='Catalog size; items are seeded up to it')
+        parser.add_argument('--orders', type=int, default=2,
+                            help='Past orders seeded for each shopper')
+        parser.add_argument('--driver', choices=('client', 'http'), default='client',
+                            help='The test client in process, or HTTP against a '
+                                 'local threaded server')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Concurrent shoppers (threads)')
+        parser.add_argument('--stripe-latency', type=float, default=0.05,
+                            help='Seconds the fake Stripe takes per charge')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write the results to this JSON file')
+        parser.add_argument('--compare', help='A JSON file from an earlier run to compare with')
+
+    def handle(self, *args, **options):
+        try:
+            setup_test_environment()
+        except RuntimeError:
+            pass  # already set up, as under the tests
+        baseline = None
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+
+        item_ids = self.catalog(options['items'])
+        users = list(get_user_model().objects.filter(pk__in=seed_users(options['users'])))
+        if options['orders']:
+            seed_orders([user.pk for user in users], item_ids, lines_per_order=3,
+                        orders_per_user=options['orders'], seed=options['seed'])
+        rng = random.Random(options['seed'])
+        slugs = dict(Item.objects.filter(pk__in=item_ids).values_list('pk', 'slug'))
+        plans = [(user, [slugs[pk] for pk in rng.sample(item_ids, 3)]) for user in users]
+
+        fake = FakeStripe(latency=options['stripe_latency']).start()
+        api_base, stripe.api_base = stripe.api_base, fake.url
+        server = None
+        try:
+            if options['driver'] == 'http':
+                server = self.start_server()
+                host, port = server.server_address[:2]
+                base_url = f"http://{host}:{port}"
+                make_driver = lambda user: HTTPDriver(user, base_url)  # noqa: E731
+            else:
+                make_driver = ClientDriver
+            results = self.run(plans, make_driver, options['workers'])
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+            stripe.api_base = api_base
+            fake.stop()
+
+        results['meta'] = {
+            'commit': self.commit(),
+            'date': timezone.now().isoformat(),
+            'driver': options['driver'],
+            'users': options['users'],
+            'workers': options['workers'],
+            'items': options['items'],
+            'stripe_latency': options['stripe_latency'],
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+        }
+        self.report(results, baseline)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+    def catalog(self, count):
+        # stocked well enough that no shopper runs into an empty shelf
+        item_ids = list(Item.objects.filter(inventory_quantity__gte=100)
+                        .order_by('pk').values_list('pk', flat=True)[:count])
+        if len(item_ids) < count:
+            seed_items(count * 2)
+            item_ids = list(Item.objects.filter(inventory_quantity__gte=100)
+                            .order_by('pk').values_list('pk', flat=True)[:count])
+        if len(item_ids) < 3:
+            raise CommandError('Not enough stocked items for the funnel')
+        return item_ids
+
+    def start_server(self):
+        server = ThreadedWSGIServer(('127.0.0.1', 0), QuietHandler, allow_reuse_address=False)
+        server.daemon_threads = True
+        server.set_app(get_wsgi_application())
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def run(self, plans, make_driver, workers):
+        queue = Queue()
+        for plan in plans:
+            queue.put(plan)
+        samples = {step: [] for step in STEPS}
+        errors = {step: 0 for step in STEPS}
+
+        def step(name, call, *args):
+            start = time.perf_counter()
+            try:
+                status, body = call(*args)
+            except requests.RequestException:
+                status, body = None, ''
+            samples[name].append(time.perf_counter() - start)
+            if status is None or status >= 400:
+                errors[name] += 1
+            return body
+
+        def shopper():
+            while True:
+                try:
+                    user, slugs = queue.get_nowait()
+                except Empty:
+                    return
+                driver = make_driver(user)
+                step('home', driver.get, reverse('core:home'))
+                for slug in slugs:
+                    step('product', driver.get, reverse('core:product', args=[slug]))
+                for slug in slugs[:2]:
+                    step('add-to-cart', driver.get, reverse('core:add-to-cart', args=[slug]))
+                step('order-summary', driver.get, reverse('core:order-summary'))
+                step('checkout', driver.get, reverse('core:checkout'))
+                step('checkout-submit', driver.post, reverse('core:checkout'), {
+                    'street_address': '1 Bench Street', 'country': 'US',
+                    'zip': '12345', 'payment_option': 'S'})
+                url = reverse('core:payment', kwargs={'payment_option': 'stripe'})
+                page = step('payment', driver.get, url)
+                key = KEY_INPUT.search(page)
+                step('payment-submit', driver.post, url, {
+                    'stripeToken': 'tok_visa', 'idempotency_key': key.group(1) if key else ''})
+                payment = retry_locked(
+                    lambda: Payment.objects.filter(user=user).order_by('-pk').first())
+                if payment is not None:
+                    step('payment-status', driver.get,
+                         reverse('core:payment-status', args=[payment.pk]))
+                else:
+                    errors['payment-status'] += 1
+
+        def worker():
+            try:
+                shopper()
+            finally:
+                connection.close()
+
+        start = time.perf_counter()
+        if workers == 1:
+            shopper()  # in this thread and on its connection
+        else:
+            threads = [threading.Thread(target=worker) for _ in range(workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elapsed = time.perf_counter() - start
+        # background charges still running count towards the settle time
+        users = [user for user, slugs in plans]
+        pending = Payment.objects.filter(user__in=users, status=Payment.PENDING)
+        while retry_locked(pending.exists):
+            time.sleep(0.05)
+        settled = time.perf_counter() - start
+        placed = Payment.objects.filter(user__in=users, status=Payment.SUCCEEDED).count()
+
+        steps = {}
+        for name in STEPS:
+            steps[name] = dict(summarize(samples[name]), errors=errors[name],
+                               throughput_rps=round(len(samples[name]) / elapsed, 2))
+        return {
+            'steps': steps,
+            'funnel': {
+                'shoppers': len(plans),
+                'seconds': round(elapsed, 3),
+                'shoppers_per_s': round(len(plans) / elapsed, 2),
+                'requests_per_s': round(sum(map(len, samples.values())) / elapsed, 2),
+                'orders_placed': placed,
+                'orders_per_s': round(placed / settled, 2),
+            },
+        }
+
+    def report(self, results, baseline):
+        for name, summary in results['steps'].items():
+            line = format_summary(name, summary)
+            line += f" {summary['throughput_rps']:.1f} req/s"
+            if summary['errors']:
+                line += f" errors={summary['errors']}"
+            if baseline and name in baseline.get('steps', {}):
+                before = baseline['steps'][name]
+                line += '  vs p50 {:+.1f}% p95 {:+.1f}%'.format(
+                    _change(before['p50_ms'], summary['p50_ms']),
+                    _change(before['p95_ms'], summary['p95_ms']))
+            self.stdout.write(line)
+        funnel = results['funnel']
+        line = (f"{funnel['shoppers']} shoppers in {funnel['seconds']:.1f}s: "
+                f"{funnel['shoppers_per_s']:.1f} shoppers/s, "
+                f"{funnel['requests_per_s']:.1f} requests/s, "
+                f"{funnel['orders_placed']} orders placed at {funnel['orders_per_s']:.1f}/s")
+        if baseline:
+            line += ' (baseline: {} at {})'.format(
+                baseline['meta'].get('commit') or 'unknown commit',
+                f"{baseline['funnel']['shoppers_per_s']:.1f} shoppers/s")
+        self.stdout.write(self.style.SUCCESS(line))
+
+    def commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError, AttributeError):
+            return None
+
+
+def _change(before, after):
+    return (after / before - 1) * 100 if before else 0.0
@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import Counter
+from queue import Empty, Queue
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import setup_test_environment
+from django.urls import reverse
+
+import stripe
+
+from core import payments, paypal
+from core.benchmarks import (
+    BenchCommand, format_summary, retry_locked, seed_users, summarize)
+from core.cart import add_item
+from core.fake_paypal import FakePayPal
+from core.fake_stripe import FakeStripe
+from core.forms import CHOICE_PROCESSORS
+from core.gateway import GATEWAY_SLOW_SECONDS, PAYMENT_PROCESSORS, get_gateway
+from core.models import Item
+
+ADDRESS = {'street_address': '1 Bench Street', 'apartment_address': '',
+           'country': 'GB', 'zip': 'SW1A 1AA'}
+
+
+class Command(BenchCommand):
+    help = ('Checkout latency of each payment processor against local fakes, '
+            'then with PayPal slowed down, where shoppers who pick it are '
+            'moved to Stripe')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=100,
+                            help='Checkouts per run')
+        parser.add_argument('--workers', type=int, default=8,
+                            help='Concurrent web workers (threads) checking out')
+        parser.add_argument('--stripe-latency', type=float, default=0.2,
+                            help='Seconds the fake Stripe takes per charge')
+        parser.add_argument('--paypal-latency', type=float, default=0.3,
+                            help='Seconds the fake PayPal takes per order call')
+        parser.add_argument('--slow-latency', type=float, default=GATEWAY_SLOW_SECONDS + 0.5,
+                            help='Seconds per order call of the slowed-down PayPal')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        fake_stripe = FakeStripe(latency=options['stripe_latency']).start()
+        fake_paypal = FakePayPal(latency=options['paypal_latency']).start()
+        stripe.api_base = fake_stripe.url
+        paypal.client.api_base = fake_paypal.url
+        # the charge runs inside the request, so that it is timed with it
+        payments.PAYMENTS_EAGER = True
+        item = Item.objects.create(
+            title='Gateway bench item', slug=f"gateway-bench-{time.time_ns()}",
+            price=10, category='S', label='P', description='',
+            inventory_quantity=options['orders'] * 4)
+        try:
+            for name, choice in (('Stripe', 'S'), ('PayPal', 'P')):
+                if CHOICE_PROCESSORS[choice] in PAYMENT_PROCESSORS:
+                    self.run(name, choice, item, options)
+            fake_paypal.latency = options['slow_latency']
+            self.run(f"PayPal at {options['slow_latency']}s", 'P', item, options)
+        finally:
+            fake_stripe.stop()
+            fake_paypal.stop()
+
+    def run(self, name, choice, item, options):
+        for processor in PAYMENT_PROCESSORS:
+            get_gateway(processor).stats.reset()
+        users = get_user_model().objects.filter(pk__in=seed_users(options['orders']))
+        queue = Queue()
+        for user in users:
+            add_item(user, item)
+            queue.put(user)
+        samples = []
+        routed = Counter()
+        checkout_url = reverse('core:checkout')
+        paypal_order_url = reverse('core:paypal-order')
+
+        def worker():
+            client = Client()
+            while True:
+                try:
+                    user = queue.get_nowait()
+                except Empty:
+                    connection.close()
+                    return
+                retry_locked(lambda: client.force_login(user))
+                start = time.perf_counter()
+                response = retry_locked(lambda: client.post(
+                    checkout_url, dict(ADDRESS, payment_option=choice)))
+                payment_url = response['Location']
+                processor = 'paypal' if payment_url.endswith('/paypal/') else 'stripe'
+                if processor == 'paypal':
+                    # the order the buyer then approves in PayPal's window
+                    order = retry_locked(lambda: client.post(paypal_order_url)).json()
+                    data = {'paypalOrderID': order['id']}
+                else:
+                    data = {'stripeToken': 'tok_visa'}
+                response = retry_locked(lambda: client.post(payment_url, data))
+                samples.append(time.perf_counter() - start)
+                routed[processor] += 1
+                assert response.status_code == 302, response.status_code
+
+        threads = [threading.Thread(target=worker) for _ in range(options['workers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.stdout.write(format_summary(f"checkout, {name} picked", summarize(samples)))
+        for processor, count in sorted(routed.items()):
+            stats = get_gateway(processor).stats.as_dict()
+            self.stdout.write(format_summary(
+                f"  paid via {processor} ({count}), API calls", stats['latency']))
@@ -0,0 +1,98 @@
+import io
+import os
+import re
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment
+from PIL import Image
+
+from core.benchmarks import BenchCommand, seed_items
+from core.models import Item
+
+SRCSET = re.compile(r'<source type="image/webp" srcset="([^"]+)"|<img src="[^"]+" srcset="([^"]+)"')
+
+
+class Command(BenchCommand):
+    help = ('Builds image derivatives for the first --items items with one '
+            'and with --workers threads, then compares the image bytes of '
+            'the home page with the originals')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=40,
+                            help='Items given an image')
+        parser.add_argument('--workers', type=int, default=4,
+                            help='Threads for the parallel run')
+        parser.add_argument('--source', default=os.path.join(
+            settings.BASE_DIR, 'static_in_env', 'img', 'sample.jpg'),
+            help='Photo the item images are cut from')
+        parser.add_argument('--slot-width', type=int, default=255,
+                            help='CSS pixels of a catalog card image')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        if Item.objects.count() < options['items']:
+            seed_items(options['items'])
+        item_ids = list(Item.objects.order_by('pk').values_list('pk', flat=True)
+                        [:options['items']])
+        media_root = tempfile.mkdtemp()
+        try:
+            with override_settings(MEDIA_ROOT=media_root):
+                originals = self.give_images(item_ids, options['source'])
+                for workers in (1, options['workers']):
+                    shutil.rmtree(os.path.join(media_root, 'derivatives'), ignore_errors=True)
+                    Item.objects.filter(pk__in=item_ids).update(image_digest='')
+                    out = io.StringIO()
+                    call_command('build_image_derivatives', workers=workers, stdout=out)
+                    self.stdout.write(out.getvalue().strip())
+                self.compare_page(originals, media_root, options['slot_width'])
+        finally:
+            Item.objects.filter(pk__in=item_ids).update(
+                image='', image_digest='', image_width=None, image_height=None)
+            shutil.rmtree(media_root)
+
+    def give_images(self, item_ids, source):
+        # a different crop for each item, so that none shares derivatives
+        photo = Image.open(source).convert('RGB')
+        sizes = {}
+        for n, item_id in enumerate(item_ids):
+            crop = photo.crop((n % 50, n // 50, photo.width, photo.height))
+            buffer = io.BytesIO()
+            crop.save(buffer, 'JPEG', quality=90)
+            name = default_storage.save(f"items/bench-{item_id}.jpg",
+                                        ContentFile(buffer.getvalue()))
+            # an update, not save(): these stand for images uploaded before
+            # the pipeline, which the backfill picks up
+            Item.objects.filter(pk=item_id).update(image=name, image_digest='')
+            sizes[item_id] = len(buffer.getvalue())
+        return sizes
+
+    def compare_page(self, originals, media_root, slot_width):
+        page = Client().get('/').content.decode()
+        srcsets = {'webp': [], 'jpg': []}
+        for webp, jpeg in SRCSET.findall(page):
+            srcsets['webp' if webp else 'jpg'].append(webp or jpeg)
+        cards = len(srcsets['webp'])
+        # the home page lists the items by primary key
+        original_bytes = sum(originals[item_id] for item_id in sorted(originals)[:cards])
+        self.stdout.write(f"{cards} cards on the home page, originals: {original_bytes:,} bytes")
+        for extension, candidates in srcsets.items():
+            for density in (1, 2):
+                total = sum(self.picked_size(srcset, slot_width * density, media_root)
+                            for srcset in candidates)
+                self.stdout.write(
+                    f"  {extension:<4} at {density}x: {total:>9,} bytes "
+                    f"({(1 - total / original_bytes) * 100:.1f}% less)")
+
+    def picked_size(self, srcset, needed, media_root):
+        # what a browser picks: the narrowest candidate at least as wide as
+        # the slot, else the widest
+        candidates = sorted((int(width[:-1]), url) for url, width in (
+            candidate.split() for candidate in srcset.split(', ')))
+        width, url = next(((w, u) for w, u in candidates if w >= needed), candidates[-1])
+        return os.path.getsize(os.path.join(media_root, url[len(settings.MEDIA_URL):]))
@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+from queue import Empty, Queue
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.benchmarks import BenchCommand, retry_locked, seed_users
+from core.cart import OUT_OF_STOCK, add_item
+from core.inventory import (
+    RESERVATION_TTL, OutOfStock, commit_order_stock, release_expired_reservations
+)
+from core.models import Item, Order, StockReservation
+
+
+class Command(BenchCommand):
+    help = ('Many threads race to buy the last units of one item; reports '
+            'throughput and checks that nothing is oversold')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--stock', type=int, default=50,
+                            help='Units on sale')
+        parser.add_argument('--buyers', type=int, default=1000,
+                            help='Shoppers trying to buy one unit each')
+        parser.add_argument('--threads', type=int, default=16)
+        parser.add_argument('--abandon', type=float, default=0.2,
+                            help='Share of shoppers who leave the item in their cart')
+
+    def handle(self, *args, **options):
+        stock = options['stock']
+        item = Item.objects.create(
+            title='Flash sale item', slug=f"flash-sale-{time.time_ns()}",
+            price=10, category='S', label='D', description='',
+            inventory_quantity=stock)
+        User = get_user_model()
+        user_ids = seed_users(options['buyers'])
+        users = Queue()
+        for pk in user_ids:
+            users.put(pk)
+        abandoners = set(random.Random(0).sample(
+            user_ids, int(len(user_ids) * options['abandon'])))
+        counts = {'sold': 0, 'held': 0, 'out_of_stock': 0, 'failed_checkout': 0}
+        lock = threading.Lock()
+
+        def buyer():
+            try:
+                while True:
+                    try:
+                        pk = users.get_nowait()
+                    except Empty:
+                        return
+                    user = User(pk=pk)
+                    if retry_locked(lambda: add_item(user, item)) == OUT_OF_STOCK:
+                        outcome = 'out_of_stock'
+                    elif pk in abandoners:
+                        outcome = 'held'
+                    else:
+                        outcome = retry_locked(lambda: self.checkout(user))
+                    with lock:
+                        counts[outcome] += 1
+            finally:
+                connection.close()
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=buyer) for _ in range(options['threads'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        item.refresh_from_db()
+        held = sum(StockReservation.objects.filter(item=item).values_list(
+            'quantity', flat=True))
+        self.stdout.write(
+            f"{options['buyers']} shoppers, {options['threads']} threads, "
+            f"{stock} units: {elapsed:.2f}s ({options['buyers'] / elapsed:.0f} shoppers/s)")
+        self.stdout.write(
+            f"sold {counts['sold']}, held in carts {held}, left "
+            f"{item.inventory_quantity}, turned away {counts['out_of_stock']}")
+        balanced = counts['sold'] + held + item.inventory_quantity == stock
+        released = release_expired_reservations(
+            now=timezone.now() + RESERVATION_TTL * 2)
+        item.refresh_from_db()
+        self.stdout.write(
+            f"sweeper released {released}; stock now {item.inventory_quantity}")
+        balanced &= counts['sold'] + item.inventory_quantity == stock
+        if not balanced or counts['sold'] > stock:
+            raise CommandError(
+                f"stock does not add up: {counts['sold']} sold of {stock}")
+        self.stdout.write(self.style.SUCCESS('oversold: 0'))
+
+    def checkout(self, user):
+        with transaction.atomic():
+            order = Order.objects.get(user=user, ordered=False)
+            try:
+                commit_order_stock(order)
+            except OutOfStock:
+                transaction.set_rollback(True)
+                return 'failed_checkout'
+            order.ordered = True
+            order.ordered_date = timezone.now()
+            order.save()
+            order.items.update(ordered=True)
+        return 'sold'
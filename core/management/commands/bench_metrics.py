@@ -0,0 +1,53 @@
+import time
+
+from django.test import Client, modify_settings
+from django.test.utils import setup_test_environment
+
+from core.benchmarks import BenchCommand, format_summary, seed_items, summarize
+from core.models import Item
+
+WITH_METRICS = {'prepend': 'core.middleware.RequestMetricsMiddleware'}
+WITHOUT_METRICS = {'remove': 'core.middleware.RequestMetricsMiddleware'}
+
+
+class Command(BenchCommand):
+    help = ('Latency of the home page and a product page with and without '
+            'RequestMetricsMiddleware, to check what the metrics cost')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000,
+                            help='Requests per page and mode')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        item = Item.objects.order_by('pk').first()
+        if item is None:
+            seed_items(100)
+            item = Item.objects.order_by('pk').first()
+        for path in ['/', item.get_absolute_url()]:
+            self.compare(path, options['requests'])
+
+    def compare(self, path, requests):
+        clients = {}
+        for name, change in (('without metrics', WITHOUT_METRICS),
+                             ('with metrics', WITH_METRICS)):
+            with modify_settings(MIDDLEWARE=change):
+                # a client's handler loads the middleware on its first request
+                clients[name] = Client()
+                clients[name].get(path)
+        samples = {name: [] for name in clients}
+        # alternate request by request, so that drift (a warming cache, a
+        # busy machine) lands on both alike
+        for _ in range(requests):
+            for name, client in clients.items():
+                start = time.perf_counter()
+                response = client.get(path)
+                samples[name].append(time.perf_counter() - start)
+                assert response.status_code == 200, response.status_code
+        summaries = {name: summarize(values) for name, values in samples.items()}
+        for name, summary in summaries.items():
+            self.stdout.write(format_summary(f"{path} {name}", summary))
+        base = summaries['without metrics']['p50_ms']
+        self.stdout.write(
+            f"  overhead: {summaries['with metrics']['p50_ms'] - base:+.3f}ms p50 "
+            f"({(summaries['with metrics']['p50_ms'] / base - 1) * 100:+.2f}%)")
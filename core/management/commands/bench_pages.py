@@ -0,0 +1,48 @@
+import time
+
+from django.core.cache import caches
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment
+
+from core.benchmarks import BenchCommand, seed_items
+from core.models import Item
+
+NO_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+
+class Command(BenchCommand):
+    help = ('Measures requests/sec for the home page and a product page '
+            'with the page and fragment caches disabled and enabled')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500,
+                            help='Requests per page and mode')
+        parser.add_argument('--seed-items', type=int, default=0,
+                            help='Catalog items to create first')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        if options['seed_items']:
+            seed_items(options['seed_items'])
+        item = Item.objects.order_by('pk').first()
+        if item is None:
+            self.stderr.write('The catalog is empty; use --seed-items.')
+            return
+        paths = ['/', item.get_absolute_url()]
+        client = Client()
+        for path in paths:
+            with override_settings(CACHES=NO_CACHE):
+                uncached = self.rate(client, path, options['requests'])
+            caches['default'].clear()
+            cached = self.rate(client, path, options['requests'])
+            self.stdout.write(
+                f"{path:<40} no cache: {uncached:8.1f} req/s   "
+                f"cached: {cached:8.1f} req/s   ({cached / uncached:.1f}x)")
+
+    def rate(self, client, path, requests):
+        client.get(path)
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = client.get(path)
+            assert response.status_code == 200, response.status_code
+        return requests / (time.perf_counter() - start)
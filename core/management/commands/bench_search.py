@@ -0,0 +1,65 @@
+import random
+import time
+
+
+from core.benchmarks import BenchCommand, format_summary, measure
+from core.models import CATEGORY_CHOICES
+from core.search import InvertedIndex, item_text, search_items
+
+COLOURS = ['black', 'white', 'navy', 'red', 'olive', 'grey', 'blue', 'green',
+           'beige', 'brown', 'pink', 'yellow', 'orange', 'purple', 'teal']
+MATERIALS = ['cotton', 'linen', 'wool', 'denim', 'fleece', 'nylon', 'silk',
+             'polyester', 'cashmere', 'leather', 'canvas', 'jersey']
+GARMENTS = ['shirt', 'tee', 'polo', 'hoodie', 'jacket', 'parka', 'vest',
+            'shorts', 'leggings', 'coat', 'blazer', 'sweater', 'cardigan']
+
+
+def synthetic_text(rng, vocabulary):
+    title = ' '.join([rng.choice(COLOURS), rng.choice(MATERIALS),
+                      rng.choice(GARMENTS), rng.choice(vocabulary)])
+    # Zipf-like description: a few very common words, a long tail of rare ones
+    words = [vocabulary[min(int(rng.paretovariate(1.1)) - 1, len(vocabulary) - 1)]
+             for _ in range(rng.randint(8, 30))]
+    return title, ' '.join(words), rng.choice(CATEGORY_CHOICES)[0]
+
+
+class Command(BenchCommand):
+    help = ('Builds the in-process search index over a synthetic catalog and '
+            'reports query latency percentiles')
+    writes = False
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=500000,
+                            help='Synthetic documents to index')
+        parser.add_argument('--queries', type=int, default=2000,
+                            help='Queries to time')
+        parser.add_argument('--database', action='store_true',
+                            help='Search the Items in the database through '
+                                 'search_items() instead of a synthetic index')
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        vocabulary = [f"w{n}" for n in range(20000)]
+        queries = [' '.join(rng.sample(group, 1)[0] for group in groups)
+                   for groups in ([COLOURS], [GARMENTS], [COLOURS, GARMENTS],
+                                  [MATERIALS, GARMENTS], [COLOURS, MATERIALS, GARMENTS])
+                   for _ in range(50)]
+        queries += [rng.choice(vocabulary[:2000]) for _ in range(250)]
+
+        if options['database']:
+            def run():
+                search_items(rng.choice(queries))
+        else:
+            index = InvertedIndex()
+            start = time.perf_counter()
+            for doc_id in range(options['items']):
+                index.add(doc_id, item_text(*synthetic_text(rng, vocabulary)))
+            self.stdout.write(
+                f"Indexed {len(index)} documents in {time.perf_counter() - start:.1f}s")
+
+            def run():
+                index.search(rng.choice(queries))
+
+        # the first pass also builds the per-term rankings a live index keeps
+        self.stdout.write(format_summary('search (cold)', measure(run, len(queries))))
+        self.stdout.write(format_summary('search', measure(run, options['queries'])))
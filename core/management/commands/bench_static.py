@@ -0,0 +1,85 @@
+import os
+import re
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management import call_command
+from django.http import HttpResponseNotFound
+from django.test import Client, RequestFactory, override_settings
+from django.test.utils import setup_test_environment
+from django.views.static import serve
+
+from core.benchmarks import BenchCommand, seed_items
+from core.middleware import StaticFilesMiddleware
+from core.models import Item
+
+ASSET_URL = re.compile(r'(?:href|src)="(/static/[^"]+)"')
+
+MODES = (
+    # name, storage, Accept-Encoding
+    ('before', 'django.contrib.staticfiles.storage.StaticFilesStorage', 'gzip, deflate, br'),
+    ('after, gzip only', 'core.staticfiles.CompressedManifestStaticFilesStorage', 'gzip, deflate'),
+    ('after', 'core.staticfiles.CompressedManifestStaticFilesStorage', 'gzip, deflate, br'),
+)
+
+
+class Command(BenchCommand):
+    help = ('Bytes transferred for the home page and its CSS and JS, with '
+            'static files collected as they were (plain names, served '
+            'uncompressed) and by core.staticfiles (hashed, precompressed)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', action='append',
+                            help='Static source directory (default: STATICFILES_DIRS, '
+                                 'or static_in_env)')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        if not Item.objects.exists():
+            seed_items(100)
+        sources = options['source'] or getattr(settings, 'STATICFILES_DIRS', None) or [
+            os.path.join(settings.BASE_DIR, 'static_in_env')]
+        results = {}
+        for name, storage, accept_encoding in MODES:
+            with tempfile.TemporaryDirectory() as root, override_settings(
+                    STATIC_ROOT=root, STATICFILES_STORAGE=storage,
+                    STATICFILES_DIRS=sources):
+                start = time.perf_counter()
+                call_command('collectstatic', interactive=False, verbosity=0)
+                self.stdout.write(f"{name}: collectstatic took "
+                                  f"{time.perf_counter() - start:.1f}s")
+                results[name] = self.load_home_page(storage, root, accept_encoding)
+        for name, (page, assets) in results.items():
+            total = page + sum(size for _, size, _ in assets)
+            revalidated = sum(1 for _, _, cached in assets if not cached)
+            self.stdout.write(
+                f"{name:<17} {total:>9,} bytes ({page:,} page + {len(assets)} assets), "
+                f"{revalidated} requests on a repeat visit")
+            for url, size, _ in assets:
+                self.stdout.write(f"    {size:>9,}  {url}")
+        before = sum(size for _, size, _ in results['before'][1]) + results['before'][0]
+        after = sum(size for _, size, _ in results['after'][1]) + results['after'][0]
+        self.stdout.write(f"saved {before - after:,} bytes ({(1 - after / before) * 100:.1f}%) "
+                          f"on a first visit")
+
+    def load_home_page(self, storage, root, accept_encoding):
+        page = Client().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        assert page.status_code == 200, page.status_code
+        if storage.startswith('core.'):
+            middleware = StaticFilesMiddleware(lambda request: HttpResponseNotFound())
+
+            def fetch(request):
+                return middleware(request)
+        else:
+            # what DEBUG's static() route or the old Azure container served
+            def fetch(request):
+                return serve(request, request.path[len(settings.STATIC_URL):], root)
+        assets = []
+        for url in ASSET_URL.findall(page.content.decode()):
+            response = fetch(RequestFactory().get(url, HTTP_ACCEPT_ENCODING=accept_encoding))
+            assert response.status_code == 200, (url, response.status_code)
+            size = sum(len(chunk) for chunk in response.streaming_content)
+            # without a max-age a browser revalidates (or refetches) each visit
+            assets.append((url, size, 'max-age' in response.get('Cache-Control', '')))
+        return len(page.content), assets
@@ -0,0 +1,42 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from core.images import IMAGE_WORKERS, run_in_worker, try_build_derivatives
+from core.models import Item
+
+
+class Command(BaseCommand):
+    help = ('Builds the resized copies of item images that do not have them '
+            'yet (or of every image, with --all), in a thread pool')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=IMAGE_WORKERS,
+                            help='Images resized at a time')
+        parser.add_argument('--all', action='store_true',
+                            help='Also rebuild images that have derivatives; only '
+                                 'the missing files are written')
+
+    def handle(self, *args, **options):
+        items = Item.objects.exclude(image='')
+        if not options['all']:
+            items = items.filter(image_digest='')
+        item_ids = list(items.order_by('pk').values_list('pk', flat=True))
+        start = time.perf_counter()
+        built = 0
+        with ThreadPoolExecutor(max_workers=options['workers'],
+                                thread_name_prefix='images') as pool:
+            if options['workers'] == 1:
+                # in this thread, which also sees an open transaction's rows
+                digests = map(try_build_derivatives, item_ids)
+            else:
+                digests = pool.map(run_in_worker, item_ids)
+            for item_id, digest in zip(item_ids, digests):
+                if digest is None:
+                    self.stderr.write(f"Item {item_id}: no derivatives built")
+                else:
+                    built += 1
+        self.stdout.write(
+            f"Built derivatives for {built} of {len(item_ids)} images in "
+            f"{time.perf_counter() - start:.1f}s with {options['workers']} workers")
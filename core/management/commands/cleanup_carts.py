@@ -0,0 +1,47 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.cart import ABANDONED_CART_DAYS, abandoned_cart_batches, dead_line_batches
+
+
+class Command(BaseCommand):
+    help = ('Deletes abandoned carts (open orders older than --days) and '
+            'empty or orphaned cart lines, in small batches')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=ABANDONED_CART_DAYS,
+                            help='Delete open carts created more than this many days ago')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Primary keys per delete batch (and transaction)')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches, to leave room '
+                                 'for other writers')
+        parser.add_argument('--archive', metavar='PATH',
+                            help='Append each deleted cart to this file as JSON lines')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+        created_before = timezone.now() - timedelta(days=options['days'])
+        archive = open(options['archive'], 'a') if options['archive'] else None
+        start = time.perf_counter()
+        orders = lines = 0
+        try:
+            for batch_orders, batch_lines in abandoned_cart_batches(
+                    created_before, options['batch_size'], archive=archive):
+                orders += batch_orders
+                lines += batch_lines
+                time.sleep(options['pause'])
+            for batch_lines in dead_line_batches(options['batch_size']):
+                lines += batch_lines
+                time.sleep(options['pause'])
+        finally:
+            if archive is not None:
+                archive.close()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"Deleted {orders} abandoned carts and {lines} cart lines in "
+            f"{elapsed:.1f}s ({(orders + lines) / elapsed if elapsed else 0:.0f} rows/s)")
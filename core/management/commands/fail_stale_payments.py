@@ -0,0 +1,30 @@
+import datetime
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.payments import PAYMENT_STALE_AFTER, fail_stale_payments
+
+
+class Command(BaseCommand):
+    help = ('Fails the payments left pending by a payment worker that died, '
+            'reopening their carts')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--minutes', type=float,
+                            default=PAYMENT_STALE_AFTER.total_seconds() / 60,
+                            help='Minutes a payment may stay pending')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running, sweeping every --interval seconds')
+        parser.add_argument('--interval', type=float, default=60,
+                            help='Seconds between sweeps with --loop')
+
+    def handle(self, *args, **options):
+        older_than = datetime.timedelta(minutes=options['minutes'])
+        while True:
+            failed = fail_stale_payments(older_than=older_than)
+            if failed or not options['loop']:
+                self.stdout.write(f"Failed {failed} stale payments")
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
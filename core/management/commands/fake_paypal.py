@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from core.fake_paypal import FakePayPal
+
+
+class Command(BaseCommand):
+    help = ('Runs a local stand-in for the PayPal Orders API; set '
+            'PAYPAL_API_BASE to the printed URL')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=12112)
+        parser.add_argument('--latency', type=float, default=0.5,
+                            help='Seconds each capture takes')
+
+    def handle(self, *args, **options):
+        fake = FakePayPal(port=options['port'], latency=options['latency'])
+        self.stdout.write(f"Fake PayPal listening on {fake.url}")
+        try:
+            fake.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            fake.server.server_close()
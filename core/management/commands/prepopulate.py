@@ -0,0 +1,20 @@
+import os
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+DEFAULT_CATALOG = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'fixtures', 'catalog.csv')
+
+
+class Command(BaseCommand):
+    help = 'Loads a catalog into the database (the bundled sample catalog by default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, nargs='?',
+                            default=os.path.normpath(DEFAULT_CATALOG),
+                            help='CSV or JSON lines file passed to import_catalog')
+
+    def handle(self, *args, **options):
+        call_command('import_catalog', options['path'],
+                     stdout=self.stdout, stderr=self.stderr)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.facets import rebuild_facet_counts
+from core.models import FacetCount
+
+
+class Command(BaseCommand):
+    help = ('Recounts the catalog facet counts from the Items, e.g. after '
+            'bulk changes made outside the ORM signals')
+
+    def handle(self, *args, **options):
+        rebuild_facet_counts()
+        for row in FacetCount.objects.order_by('facet', 'value'):
+            self.stdout.write(f"{row.facet:<10} {row.value:<8} {row.count}")
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.inventory import release_expired_reservations
+
+
+class Command(BaseCommand):
+    help = 'Returns the stock held by expired cart reservations'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running, sweeping every --interval seconds')
+        parser.add_argument('--interval', type=float, default=60,
+                            help='Seconds between sweeps with --loop')
+
+    def handle(self, *args, **options):
+        while True:
+            released = release_expired_reservations()
+            if released or not options['loop']:
+                self.stdout.write(f"Released {released} reserved units")
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.inventory import set_stock_on_hand
+from core.models import Item, StockReservation
+
+
+class Command(BaseCommand):
+    help = ('Sets the stock on hand of items; units held for carts stay held. '
+            'After upgrading to stock reservations, `restock N --empty` makes '
+            'the items without any tracked stock sellable again')
+
+    def add_arguments(self, parser):
+        parser.add_argument('quantity', type=int, help='Units on hand')
+        parser.add_argument('slugs', nargs='*', help='Items to restock')
+        parser.add_argument('--empty', action='store_true',
+                            help='Restock every item with no stock, held or available')
+
+    def handle(self, *args, **options):
+        if options['quantity'] < 0:
+            raise CommandError('quantity must not be negative')
+        if options['slugs']:
+            items = Item.objects.filter(slug__in=options['slugs'])
+            missing = set(options['slugs']) - set(items.values_list('slug', flat=True))
+            if missing:
+                raise CommandError(f"No such items: {', '.join(sorted(missing))}")
+        elif options['empty']:
+            items = Item.objects.filter(inventory_quantity__lte=0).exclude(
+                pk__in=StockReservation.objects.values('item'))
+        else:
+            raise CommandError('Name the items to restock, or pass --empty')
+        restocked = set_stock_on_hand(list(items.values_list('pk', flat=True)),
+                                      options['quantity'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Restocked {restocked} items with {options['quantity']} units"))
@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.cart import cart_total_batches
+
+
+class Command(BaseCommand):
+    help = ('Recomputes the stored totals of every open cart from its lines '
+            'and repairs the ones that drifted, in small batches')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Primary keys per batch (and transaction)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report drifted carts without repairing them')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        checked = drifted = 0
+        for batch_checked, batch_drifted in cart_total_batches(
+                options['batch_size'], repair=not options['dry_run']):
+            checked += batch_checked
+            drifted += len(batch_drifted)
+            for order in batch_drifted[:10]:
+                self.stdout.write(
+                    f"Order {order.pk}: {order.item_count} lines, total {order.total} "
+                    f"(savings {order.discount_total})")
+            time.sleep(options['pause'])
+        self.stdout.write(
+            f"Checked {checked} open carts in {time.perf_counter() - start:.1f}s: "
+            f"{drifted} had drifted" + (
+                '' if options['dry_run'] or not drifted else ', all repaired'))
@@ -0,0 +1,254 @@
+"""
+Request metrics, kept in process and served in the Prometheus text format.
+
+RequestMetricsMiddleware (core.middleware) times every request and, per
+URL name, records its latency, SQL query count and time (through an
+execute wrapper on the connections) and template render time as
+histograms. The cache and payment gateway counters kept elsewhere are
+exported next to them. Every worker process keeps its own numbers;
+Prometheus adds them up across the processes it scrapes.
+
+REQUEST_METRICS turns all of it off (the middleware then drops out of
+the stack); SERVER_TIMING controls the per-response Server-Timing header.
+"""
+import contextvars
+import functools
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connections
+
+REQUEST_METRICS = getattr(settings, 'REQUEST_METRICS', True)
+SERVER_TIMING = getattr(settings, 'SERVER_TIMING', True)
+# a bearer token for the /metrics endpoint; without one it is staff-only
+METRICS_TOKEN = getattr(settings, 'METRICS_TOKEN', None)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """A Prometheus histogram with one series per label value."""
+
+    def __init__(self, name, help, buckets, label='view'):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.label = label
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, label, value):
+        with self._lock:
+            series = self._series.get(label)
+            if series is None:
+                # a count per bucket (not cumulative), then the sum
+                series = self._series[label] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[bisect_left(self.buckets, value)] += 1
+            series[-1] += value
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self, label):
+        """{'count', 'sum'} for one series, for tests and ad-hoc checks."""
+        with self._lock:
+            series = self._series.get(label)
+            if series is None:
+                return {'count': 0, 'sum': 0}
+            return {'count': sum(series[:-1]), 'sum': series[-1]}
+
+    def collect(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((label, list(values)) for label, values in self._series.items())
+        for label, values in series:
+            labels = f'{self.label}="{_escape(label)}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), values):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {values[-1]}")
+            lines.append(f"{self.name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class Counter:
+    """A Prometheus counter with one series per tuple of label values."""
+
+    def __init__(self, name, help, labels):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, *values):
+        with self._lock:
+            self._values[values] = self._values.get(values, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def collect(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            labels = ','.join(f'{name}="{_escape(v)}"'
+                              for name, v in zip(self.labels, label_values))
+            lines.append(f"{self.name}{{{labels}}} {value}")
+        return lines
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+request_latency = Histogram(
+    'shop_request_duration_seconds', 'Time to answer a request, by URL name.',
+    LATENCY_BUCKETS)
+request_queries = Histogram(
+    'shop_request_queries', 'SQL queries run by a request, by URL name.',
+    QUERY_BUCKETS)
+request_db_time = Histogram(
+    'shop_request_db_seconds', 'Time a request spent in SQL queries, by URL name.',
+    LATENCY_BUCKETS)
+request_template_time = Histogram(
+    'shop_request_template_seconds', 'Time a request spent rendering templates, by URL name.',
+    LATENCY_BUCKETS)
+responses = Counter(
+    'shop_responses_total', 'Responses by URL name and status code.', ('view', 'status'))
+
+REQUEST_METRICS_SERIES = (
+    request_latency, request_queries, request_db_time, request_template_time, responses)
+
+
+class RequestStats:
+    """What one request spent; the middleware makes one per request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self._template_depth = 0
+
+    def server_timing(self, total):
+        return (f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries", '
+                f'tpl;dur={self.template_time * 1000:.1f}, '
+                f'total;dur={total * 1000:.1f}')
+
+
+current_request_stats = contextvars.ContextVar('current_request_stats', default=None)
+
+
+def time_query(execute, sql, params, many, context):
+    """
+    A connection.execute_wrapper charging queries to the request in
+    progress. It stays installed (see instrument_connections); outside a
+    request it only passes the query on.
+    """
+    stats = current_request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - start
+
+
+_instrumented = threading.local()
+
+
+def instrument_connections():
+    """
+    Install time_query on this thread's connections, once. Wrapping them
+    per request (with connection.execute_wrapper) would cost more than the
+    rest of the bookkeeping together, as looking the connections up goes
+    through asgiref's Local.
+    """
+    if getattr(_instrumented, 'connections', False):
+        return
+    for connection in connections.all():
+        if time_query not in connection.execute_wrappers:
+            connection.execute_wrappers.append(time_query)
+    _instrumented.connections = True
+
+
+def record(view, status, total, stats):
+    request_latency.observe(view, total)
+    request_queries.observe(view, stats.queries)
+    request_db_time.observe(view, stats.db_time)
+    request_template_time.observe(view, stats.template_time)
+    responses.inc(view, str(status))
+
+
+_templates_instrumented = False
+
+
+def instrument_templates():
+    """
+    Time Template.render for the request in progress. Includes render
+    templates of their own, so only the outermost render is counted.
+    """
+    global _templates_instrumented
+    if _templates_instrumented:
+        return
+    from django.template.base import Template
+    render = Template.render
+
+    @functools.wraps(render)
+    def timed_render(self, context):
+        stats = current_request_stats.get()
+        if stats is None:
+            return render(self, context)
+        stats._template_depth += 1
+        start = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            stats._template_depth -= 1
+            if not stats._template_depth:
+                stats.template_time += time.perf_counter() - start
+
+    Template.render = timed_render
+    _templates_instrumented = True
+
+
+def _stats_counter(name, help, stats, label=None):
+    # with a label, stats maps each of its values to the counters
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} counter"]
+    series = sorted(stats.items()) if label else [(None, stats)]
+    for label_value, counters in series:
+        prefix = f'{label}="{label_value}",' if label else ''
+        for key, value in sorted(counters.items()):
+            lines.append(f'{name}{{{prefix}kind="{key}"}} {value}')
+    return lines
+
+
+def render_prometheus():
+    from .caching import page_cache_stats
+    from .cart import cart_count_stats
+    from .gateway import PAYMENT_PROCESSORS, get_gateway
+
+    lines = []
+    for metric in REQUEST_METRICS_SERIES:
+        lines += metric.collect()
+    lines += _stats_counter('shop_cart_count_cache_total',
+                            'Cart badge cache lookups by outcome.', cart_count_stats.as_dict())
+    lines += _stats_counter('shop_page_cache_total',
+                            'Product page cache lookups by outcome.', page_cache_stats.as_dict())
+    gateways = {}
+    for processor in PAYMENT_PROCESSORS:
+        gateways[processor] = get_gateway(processor).stats.as_dict()
+        del gateways[processor]['latency']
+    lines += _stats_counter('shop_gateway_calls_total',
+                            'Payment gateway calls, retries, failures and rejections.',
+                            gateways, label='processor')
+    return '\n'.join(lines) + '\n'
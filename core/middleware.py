@@ -0,0 +1,104 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from . import metrics, staticfiles
+
+
+class RequestMetricsMiddleware:
+    """
+    Records latency, SQL and template time per URL name (see core.metrics)
+    and adds a Server-Timing header. Put it first in MIDDLEWARE so that it
+    times the rest of the stack too.
+    """
+
+    def __init__(self, get_response):
+        if not metrics.REQUEST_METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        metrics.instrument_templates()
+
+    def __call__(self, request):
+        stats = metrics.RequestStats()
+        token = metrics.current_request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            metrics.instrument_connections()
+            response = self.get_response(request)
+        finally:
+            metrics.current_request_stats.reset(token)
+        total = time.perf_counter() - start
+        match = request.resolver_match
+        metrics.record(match.view_name if match else 'unresolved',
+                       response.status_code, total, stats)
+        if metrics.SERVER_TIMING:
+            response['Server-Timing'] = stats.server_timing(total)
+        return response
+
+
+class StaticFilesMiddleware:
+    """
+    Serves STATIC_ROOT as CompressedManifestStaticFilesStorage leaves it
+    (see core.staticfiles): the .br or .gz variant when the client accepts
+    it, content-hashed names with an immutable year-long Cache-Control and
+    everything else for STATIC_MAX_AGE. The files are listed once, at
+    start-up, so run collectstatic before the server starts. Put it right
+    after SecurityMiddleware.
+    """
+
+    def __init__(self, get_response):
+        prefix = settings.STATIC_URL or ''
+        root = getattr(settings, 'STATIC_ROOT', None)
+        if not prefix.startswith('/') or not root:
+            raise MiddlewareNotUsed  # served from elsewhere
+        self.files = staticfiles.collected_files(root)
+        if not self.files:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.prefix = prefix
+
+    def __call__(self, request):
+        if request.path_info.startswith(self.prefix) and request.method in ('GET', 'HEAD'):
+            static_file = self.files.get(request.path_info[len(self.prefix):])
+            if static_file is not None:
+                return self.serve(request, static_file)
+        return self.get_response(request)
+
+    def serve(self, request, static_file):
+        if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'),
+                                  static_file.mtime, static_file.size):
+            response = HttpResponseNotModified()
+        else:
+            path, encoding = static_file.path, None
+            if static_file.variants:
+                accepted = staticfiles.accepted_encodings(
+                    request.META.get('HTTP_ACCEPT_ENCODING', ''))
+                for encoding, variant in static_file.variants:
+                    if encoding in accepted:
+                        path = variant
+                        break
+                else:
+                    encoding = None
+            if request.method == 'HEAD':
+                response = HttpResponse(content_type=static_file.content_type)
+                response['Content-Length'] = os.path.getsize(path)
+            else:
+                response = FileResponse(open(path, 'rb'),
+                                        content_type=static_file.content_type)
+            if encoding:
+                response['Content-Encoding'] = encoding
+            response['Last-Modified'] = http_date(static_file.mtime)
+        if static_file.variants:
+            patch_vary_headers(response, ('Accept-Encoding',))
+        if static_file.immutable:
+            response['Cache-Control'] = (
+                f'public, max-age={staticfiles.IMMUTABLE_MAX_AGE}, immutable')
+        else:
+            response['Cache-Control'] = f'public, max-age={staticfiles.STATIC_MAX_AGE}'
+        return response
@@ -0,0 +1,60 @@
+# Generated by Django 3.0 on 2026-10-18 04:38
+
+from django.db import migrations
+from django.db.models import Count, Min, Sum
+
+
+def cleanup_open_carts(apps, schema_editor):
+    # bring existing rows in line with the constraints added in 0018
+    Item = apps.get_model('core', 'Item')
+    Order = apps.get_model('core', 'Order')
+    OrderItem = apps.get_model('core', 'OrderItem')
+    OrderItems = Order.items.through
+
+    # lines of placed orders were never flagged as ordered
+    OrderItem.objects.filter(
+        ordered=False, order__ordered=True).update(ordered=True)
+
+    # keep the oldest open order per user and move the other lines into it
+    duplicate_users = Order.objects.filter(ordered=False).values(
+        'user').annotate(n=Count('id'), keep=Min('id')).filter(n__gt=1)
+    for row in duplicate_users:
+        extra = Order.objects.filter(
+            user=row['user'], ordered=False).exclude(pk=row['keep'])
+        OrderItems.objects.filter(order__in=extra).update(order=row['keep'])
+        extra.delete()
+
+    # lines that are not in any open order (e.g. zeroed by remove_from_cart)
+    OrderItem.objects.filter(ordered=False).exclude(
+        order__ordered=False).delete()
+
+    # one line per item in a cart
+    duplicate_lines = OrderItem.objects.filter(ordered=False).values(
+        'user', 'item').annotate(
+            n=Count('id'), keep=Min('id'),
+            quantity=Sum('order_quantity')).filter(n__gt=1)
+    for row in duplicate_lines:
+        OrderItem.objects.filter(
+            user=row['user'], item=row['item'], ordered=False
+        ).exclude(pk=row['keep']).delete()
+        OrderItem.objects.filter(pk=row['keep']).update(
+            order_quantity=row['quantity'])
+
+    # make slugs unique by suffixing the later duplicates with their id
+    duplicate_slugs = Item.objects.values('slug').annotate(
+        n=Count('id'), keep=Min('id')).filter(n__gt=1)
+    for row in duplicate_slugs:
+        for item in Item.objects.filter(slug=row['slug']).exclude(pk=row['keep']):
+            item.slug = f"{item.slug}-{item.pk}"
+            item.save(update_fields=['slug'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_auto_20200103_1650'),
+    ]
+
+    operations = [
+        migrations.RunPython(cleanup_open_carts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 3.0 on 2026-10-18 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_cleanup_open_carts'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='item',
+            name='slug',
+            field=models.SlugField(unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'ordered'], name='core_order_user_ordered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(fields=['user', 'item', 'ordered'], name='core_orderitem_user_item_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.UniqueConstraint(condition=models.Q(ordered=False), fields=('user',), name='core_order_open_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='orderitem',
+            constraint=models.UniqueConstraint(condition=models.Q(ordered=False), fields=('user', 'item'), name='core_orderitem_open_uniq'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 3.0 on 2026-10-18 05:45
+
+from django.db import migrations
+
+# a frozen copy of core.search.PG_SEARCH_VECTOR; queries only use the
+# index while the two expressions are identical
+SEARCH_VECTOR = (
+    "to_tsvector('english', "
+    "coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || "
+    "CASE category WHEN 'S' THEN 'Shirt' WHEN 'SW' THEN 'Sport wear' "
+    "WHEN 'OW' THEN 'Out wear' ELSE '' END)"
+)
+
+
+def create_search_index(apps, schema_editor):
+    # full-text search runs in the database only on PostgreSQL; other
+    # backends use the in-process index in core.search
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE INDEX core_item_search_gin ON core_item "
+            f"USING GIN ({SEARCH_VECTOR})")
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS core_item_search_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_item_modified'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
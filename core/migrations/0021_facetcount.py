@@ -0,0 +1,59 @@
+# Generated by Django 3.0 on 2026-10-18 06:10
+
+from collections import Counter
+
+from django.db import migrations, models
+
+# frozen copy of core.facets.PRICE_BANDS
+PRICE_BANDS = (
+    ('0-25', 0, 25),
+    ('25-50', 25, 50),
+    ('50-100', 50, 100),
+    ('100-', 100, None),
+)
+
+
+def count_facets(apps, schema_editor):
+    Item = apps.get_model('core', 'Item')
+    FacetCount = apps.get_model('core', 'FacetCount')
+    counts = Counter()
+    rows = Item.objects.values_list(
+        'category', 'label', 'price', 'discount_price').iterator()
+    for category, label, price, discount_price in rows:
+        counts['category', category] += 1
+        counts['label', label] += 1
+        on_sale = bool(discount_price and discount_price > 0)
+        if on_sale:
+            counts['discount', '1'] += 1
+        paid = discount_price if on_sale else price
+        for value, low, high in PRICE_BANDS:
+            if paid >= low and (high is None or paid < high):
+                counts['price', value] += 1
+                break
+    FacetCount.objects.bulk_create(
+        FacetCount(facet=facet, value=value, count=count)
+        for (facet, value), count in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_item_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FacetCount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(max_length=20)),
+                ('value', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='facetcount',
+            constraint=models.UniqueConstraint(fields=('facet', 'value'), name='core_facetcount_uniq'),
+        ),
+        migrations.RunPython(count_facets, migrations.RunPython.noop),
+    ]
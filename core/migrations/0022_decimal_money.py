@@ -0,0 +1,63 @@
+# Generated by Django 3.0 on 2026-10-18 06:40
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+
+
+def quantize(value):
+    return Decimal(repr(value)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def prices_to_cents(apps, schema_editor):
+    # round the float prices to whole cents before the column changes type,
+    # so 19.990000000000002 becomes 19.99 on every backend
+    Item = apps.get_model('core', 'Item')
+    rows = Item.objects.values_list('pk', 'price', 'discount_price').iterator()
+    for pk, price, discount_price in rows:
+        # compared as the floats that are stored; a Decimal never equals
+        # the float it was rounded from
+        fixed = (float(quantize(price)),
+                 None if discount_price is None else float(quantize(discount_price)))
+        if fixed != (price, discount_price):
+            Item.objects.filter(pk=pk).update(price=fixed[0], discount_price=fixed[1])
+
+
+def payments_to_units(apps, schema_editor):
+    # Payment.amount held what was sent to Stripe, i.e. cents
+    Payment = apps.get_model('core', 'Payment')
+    for pk, amount in Payment.objects.values_list('pk', 'amount').iterator():
+        Payment.objects.filter(pk=pk).update(amount=float(quantize(amount / 100)))
+
+
+def payments_to_cents(apps, schema_editor):
+    Payment = apps.get_model('core', 'Payment')
+    for pk, amount in Payment.objects.values_list('pk', 'amount').iterator():
+        Payment.objects.filter(pk=pk).update(amount=amount * 100)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_facetcount'),
+    ]
+
+    operations = [
+        migrations.RunPython(prices_to_cents, migrations.RunPython.noop),
+        migrations.RunPython(payments_to_units, payments_to_cents),
+        migrations.AlterField(
+            model_name='item',
+            name='price',
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+        migrations.AlterField(
+            model_name='item',
+            name='discount_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='amount',
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+    ]
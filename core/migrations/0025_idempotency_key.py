@@ -0,0 +1,28 @@
+# Generated by Django 3.0 on 2026-10-18 08:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_payment_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='payment_attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('payment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='idempotency_key', to='core.Payment')),
+            ],
+        ),
+    ]
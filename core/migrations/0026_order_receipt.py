@@ -0,0 +1,82 @@
+# Generated by Django 3.0 on 2026-10-18 09:40
+
+import json
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# frozen copies of core.money's cent helpers
+def to_cents(value):
+    return int(Decimal(value).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP) * 100)
+
+
+def from_cents(cents):
+    return (Decimal(int(cents)) / 100).quantize(Decimal('0.01'))
+
+
+def snapshot(OrderReceipt, order):
+    lines = []
+    total = savings = count = 0
+    for line in sorted(order.items.all(), key=lambda line: line.pk):
+        item = line.item
+        price = line.order_quantity * to_cents(item.price)
+        paid = line.order_quantity * to_cents(item.discount_price or item.price)
+        total += paid
+        savings += price - paid
+        count += line.order_quantity
+        lines.append([
+            item.title, item.slug, line.order_quantity, str(item.price),
+            str(item.discount_price) if item.discount_price else None,
+            str(from_cents(paid)), str(from_cents(price - paid)),
+        ])
+    return OrderReceipt(
+        order=order, user_id=order.user_id, placed_at=order.ordered_date,
+        total=from_cents(total), savings=from_cents(savings),
+        item_count=count, lines_json=json.dumps(lines))
+
+
+def backfill_receipts(apps, schema_editor):
+    # orders placed before receipts existed get one priced at the current
+    # item prices, the best record there is
+    Order = apps.get_model('core', 'Order')
+    OrderReceipt = apps.get_model('core', 'OrderReceipt')
+    # oldest first, so receipt pks follow the order orders were placed in
+    pks = list(Order.objects.filter(ordered=True).order_by(
+        'ordered_date', 'pk').values_list('pk', flat=True))
+    for start in range(0, len(pks), 500):
+        chunk = pks[start:start + 500]
+        orders = Order.objects.prefetch_related('items__item').in_bulk(chunk)
+        OrderReceipt.objects.bulk_create(
+            [snapshot(OrderReceipt, orders[pk]) for pk in chunk])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0025_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderReceipt',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('placed_at', models.DateTimeField()),
+                ('total', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('savings', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('item_count', models.PositiveIntegerField()),
+                ('lines_json', models.TextField()),
+                ('order', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='receipt', to='core.Order')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='orderreceipt',
+            index=models.Index(fields=['user', 'id'], name='core_orderreceipt_user_idx'),
+        ),
+        migrations.RunPython(backfill_receipts, migrations.RunPython.noop),
+    ]
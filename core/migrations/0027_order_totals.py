@@ -0,0 +1,67 @@
+# Generated by Django 3.0 on 2026-10-18 10:25
+
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import migrations, models
+
+TOTAL_FIELDS = ['item_count', 'subtotal_cents', 'discount_total_cents', 'total_cents']
+
+
+# a frozen copy of core.money.to_cents
+def to_cents(value):
+    return int(Decimal(value).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP) * 100)
+
+
+def backfill_totals(apps, schema_editor):
+    # priced at the current item prices, as the carts show them
+    Order = apps.get_model('core', 'Order')
+    Through = Order.items.through
+    pks = list(Order.objects.order_by('pk').values_list('pk', flat=True))
+    for start in range(0, len(pks), 500):
+        chunk = pks[start:start + 500]
+        totals = {}
+        for order_id, quantity, price, discount_price in Through.objects.filter(
+                order_id__in=chunk).values_list(
+                'order_id', 'orderitem__order_quantity',
+                'orderitem__item__price', 'orderitem__item__discount_price'):
+            count, subtotal, discount = totals.get(order_id, (0, 0, 0))
+            line_price = quantity * to_cents(price)
+            if discount_price and discount_price > 0:
+                discount += line_price - quantity * to_cents(discount_price)
+            totals[order_id] = (count + 1, subtotal + line_price, discount)
+        Order.objects.bulk_update([
+            Order(pk=pk, item_count=count, subtotal_cents=subtotal,
+                  discount_total_cents=discount, total_cents=subtotal - discount)
+            for pk, (count, subtotal, discount) in totals.items()
+        ], TOTAL_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_order_receipt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='discount_total_cents',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='subtotal_cents',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='total_cents',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 3.0 on 2026-10-18 10:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_order_totals'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payment',
+            name='stripe_charge_id',
+            field=models.CharField(blank=True, db_index=True, max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['ordered_date'], name='core_order_ordered_date_idx'),
+        ),
+    ]
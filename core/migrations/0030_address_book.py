@@ -0,0 +1,77 @@
+# Generated by Django 3.0 on 2026-10-18 12:10
+
+import hashlib
+
+from django.db import migrations, models
+
+# frozen copies of core.addresses' normalization: this migration has to
+# hash the way the code did when it was written
+ADDRESS_FIELDS = ('street_address', 'apartment_address', 'country', 'zip')
+
+
+def clean_address(data):
+    return {name: ' '.join(str(data.get(name) or '').split()) for name in ADDRESS_FIELDS}
+
+
+def content_hash(address):
+    normalized = (
+        address['street_address'].casefold(),
+        address['apartment_address'].casefold(),
+        address['country'].upper(),
+        address['zip'].replace(' ', '').upper(),
+    )
+    return hashlib.sha256('\x1f'.join(normalized).encode()).hexdigest()
+
+
+def dedupe_addresses(apps, schema_editor):
+    # every checkout used to insert an address; keep the oldest row of each
+    # user's address and point the orders of the others at it
+    BillingAddress = apps.get_model('core', 'BillingAddress')
+    Order = apps.get_model('core', 'Order')
+    kept = {}
+    hashes = {}
+    duplicates = {}
+    rows = BillingAddress.objects.order_by('pk').values_list('pk', 'user_id', *ADDRESS_FIELDS)
+    for pk, user_id, *fields in rows.iterator():
+        digest = content_hash(clean_address(dict(zip(ADDRESS_FIELDS, fields))))
+        if (user_id, digest) in kept:
+            duplicates.setdefault(kept[user_id, digest], []).append(pk)
+        else:
+            kept[user_id, digest] = pk
+            hashes[pk] = digest
+    for keep, pks in duplicates.items():
+        for start in range(0, len(pks), 500):
+            chunk = pks[start:start + 500]
+            Order.objects.filter(billing_address__in=chunk).update(billing_address=keep)
+            BillingAddress.objects.filter(pk__in=chunk).delete()
+    pks = sorted(hashes)
+    for start in range(0, len(pks), 500):
+        BillingAddress.objects.bulk_update([
+            BillingAddress(pk=pk, content_hash=hashes[pk]) for pk in pks[start:start + 500]
+        ], ['content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_item_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='billingaddress',
+            name='content_hash',
+            field=models.CharField(default='', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='billingaddress',
+            name='saved',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(dedupe_addresses, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='billingaddress',
+            constraint=models.UniqueConstraint(fields=('user', 'content_hash'), name='core_billingaddress_uniq'),
+        ),
+    ]
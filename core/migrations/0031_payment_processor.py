@@ -0,0 +1,23 @@
+# Generated by Django 3.0 on 2026-10-18 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0030_address_book'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='payment',
+            old_name='stripe_charge_id',
+            new_name='charge_id',
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='processor',
+            field=models.CharField(choices=[('stripe', 'Stripe'), ('paypal', 'PayPal')], default='stripe', max_length=10),
+        ),
+    ]
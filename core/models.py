@@ -1,8 +1,19 @@
+import json
+from collections import namedtuple
+from decimal import Decimal
+
 from django.conf import settings
 from django.db import models
+from django.db.models import (
+    Case, F, IntegerField, Q, Sum, UniqueConstraint, When
+)
+from django.db.models.functions import Cast, Round
 from django.shortcuts import reverse
+from django.utils.functional import cached_property
 from django_countries.fields import CountryField
 
+from .money import DECIMAL_PLACES, MAX_DIGITS, from_cents
+
 CATEGORY_CHOICES = (
     # first value is what goes into the database, the second value is what is displayed
     ('S', 'Shirt'),
@@ -20,14 +31,22 @@ LABEL_CHOICES = (
 
 class Item(models.Model):
     title = models.CharField(max_length=100)
-    price = models.FloatField()
-    discount_price = models.FloatField(blank=True, null=True)
+    price = models.DecimalField(max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES)
+    discount_price = models.DecimalField(max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES,
+                                         blank=True, null=True)
     category = models.CharField(choices=CATEGORY_CHOICES, max_length=2)
     label = models.CharField(choices=LABEL_CHOICES, max_length=1)
-    slug = models.SlugField()
+    slug = models.SlugField(unique=True)
     description = models.TextField()
-    # TODO add inventory tracking and management
+    # units on hand that are not held by a StockReservation; see core.inventory
     inventory_quantity = models.IntegerField(default=0)
+    # version stamp for the rendered-fragment and page caches
+    modified = models.DateTimeField(auto_now=True)
+    image = models.ImageField(upload_to='items/', blank=True)
+    # set once the resized copies of the image are built; see core.images
+    image_digest = models.CharField(max_length=64, blank=True)
+    image_width = models.PositiveIntegerField(null=True, blank=True)
+    image_height = models.PositiveIntegerField(null=True, blank=True)
 
     def __str__(self):
         return self.title
@@ -42,6 +61,72 @@ class Item(models.Model):
         return reverse("core:remove-from-cart", kwargs={'slug': self.slug})
 
 
+class StockReservation(models.Model):
+    # units of an item held for a user's cart; they are already taken out of
+    # Item.inventory_quantity and go back when the hold is released or expires
+    user = models.ForeignKey(settings.AUTH_USER_MODEL,
+                             on_delete=models.CASCADE)
+    item = models.ForeignKey(Item, on_delete=models.CASCADE)
+    quantity = models.IntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=['user', 'item'],
+                             name='core_stockreservation_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.quantity} of {self.item_id} for {self.user_id}"
+
+
+class FacetCount(models.Model):
+    # number of Items per catalog facet value, kept current by the Item
+    # signals in core.signals so the filter sidebar never needs a GROUP BY
+    facet = models.CharField(max_length=20)
+    value = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=['facet', 'value'],
+                             name='core_facetcount_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.facet}={self.value}: {self.count}"
+
+
+def _cents(field):
+    return Cast(Round(F(field) * 100), IntegerField())
+
+
+class OrderItemQuerySet(models.QuerySet):
+    def with_prices(self):
+        # the price helpers on OrderItem computed in SQL, so a whole cart can be
+        # priced (and summed) without touching order_item.item row by row;
+        # the arithmetic is in integer cents so sums are exact on any backend
+        line_price = F('order_quantity') * _cents('item__price')
+        line_total = Case(
+            When(item__discount_price__gt=0,
+                 then=F('order_quantity') * _cents('item__discount_price')),
+            default=line_price,
+            output_field=IntegerField())
+        return self.select_related('item').annotate(
+            line_price_cents=line_price,
+            line_total_cents=line_total,
+        ).annotate(
+            line_savings_cents=F('line_price_cents') - F('line_total_cents'),
+        )
+
+    def totals(self):
+        totals = self.with_prices().aggregate(
+            total=Sum('line_total_cents'),
+            savings=Sum('line_savings_cents'),
+        )
+        return {name: from_cents(cents) for name, cents in totals.items()}
+
+
 class OrderItem(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              on_delete=models.CASCADE)
@@ -49,6 +134,20 @@ class OrderItem(models.Model):
     item = models.ForeignKey(Item, on_delete=models.CASCADE)
     order_quantity = models.IntegerField(default=1)
 
+    objects = OrderItemQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'item', 'ordered'],
+                         name='core_orderitem_user_item_idx'),
+        ]
+        constraints = [
+            # at most one cart line per item in a user's open order
+            UniqueConstraint(fields=['user', 'item'],
+                             condition=Q(ordered=False),
+                             name='core_orderitem_open_uniq'),
+        ]
+
     def __str__(self):
         return f"{self.order_quantity} of {self.item.title}"
 
@@ -66,6 +165,19 @@ class OrderItem(models.Model):
             return self.get_total_discount_item_price()
         return self.get_total_item_price()
 
+    # the same prices for lines loaded through with_prices()
+    @property
+    def line_price(self):
+        return from_cents(self.line_price_cents)
+
+    @property
+    def line_total(self):
+        return from_cents(self.line_total_cents)
+
+    @property
+    def line_savings(self):
+        return from_cents(self.line_savings_cents)
+
 
 class Order(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
@@ -78,15 +190,48 @@ class Order(models.Model):
         'BillingAddress', on_delete=models.SET_NULL, blank=True, null=True)
     payment = models.ForeignKey(
         'Payment', on_delete=models.SET_NULL, blank=True, null=True)
+    # failed payments so far; part of the idempotency key of the next one
+    payment_attempts = models.PositiveIntegerField(default=0)
+    # the cart's lines and totals, kept up to date by the mutations in
+    # core.cart so that showing them is a single-row read; in integer cents,
+    # like every sum of money (see core.money)
+    item_count = models.PositiveIntegerField(default=0)
+    subtotal_cents = models.BigIntegerField(default=0)
+    discount_total_cents = models.BigIntegerField(default=0)
+    total_cents = models.BigIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'ordered'],
+                         name='core_order_user_ordered_idx'),
+            # the admin's date drill-down
+            models.Index(fields=['ordered_date'], name='core_order_ordered_date_idx'),
+        ]
+        constraints = [
+            # a user has at most one open (cart) order
+            UniqueConstraint(fields=['user'],
+                             condition=Q(ordered=False),
+                             name='core_order_open_uniq'),
+        ]
 
     def __str__(self):
         return self.user.username
 
+    @property
+    def subtotal(self):
+        return from_cents(self.subtotal_cents)
+
+    @property
+    def discount_total(self):
+        return from_cents(self.discount_total_cents)
+
+    @property
+    def total(self):
+        return from_cents(self.total_cents)
+
     def get_total(self):
-        total = 0
-        for order_item in self.items.all():
-            total += order_item.get_final_price()
-        return total
+        # priced from the lines, not the stored total: this is what is charged
+        return self.items.totals()['total'] or from_cents(0)
 
 
 class BillingAddress(models.Model):
@@ -96,17 +241,127 @@ class BillingAddress(models.Model):
     apartment_address = models.CharField(max_length=100)
     country = CountryField(multiple=False)
     zip = models.CharField(max_length=100)
+    # SHA-256 of the normalized address; one row per user and address, see
+    # core.addresses
+    content_hash = models.CharField(max_length=64)
+    # listed in the user's address book at checkout
+    saved = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=['user', 'content_hash'],
+                             name='core_billingaddress_uniq'),
+        ]
 
     def __str__(self):
         return self.user.username
 
 
+PAYMENT_STATUS_CHOICES = (
+    ('pending', 'Pending'),
+    ('succeeded', 'Succeeded'),
+    ('failed', 'Failed')
+)
+
+# the backends of core.gateway
+PAYMENT_PROCESSOR_CHOICES = (
+    ('stripe', 'Stripe'),
+    ('paypal', 'PayPal')
+)
+
+
 class Payment(models.Model):
-    stripe_charge_id = models.CharField(max_length=50)
+    PENDING = 'pending'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    processor = models.CharField(choices=PAYMENT_PROCESSOR_CHOICES, max_length=10,
+                                 default='stripe')
+    # the Stripe charge or PayPal capture; indexed for looking a payment up
+    # from the processor's dashboard in the admin
+    charge_id = models.CharField(max_length=50, blank=True, db_index=True)
     user = models.ForeignKey(settings.AUTH_USER_MODEL,
                              on_delete=models.SET_NULL, blank=True, null=True)
-    amount = models.FloatField()
+    # in currency units; the gateway is sent integer cents (money.to_cents)
+    amount = models.DecimalField(max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES)
     timestamp = models.DateTimeField(auto_now=True)
+    # charges run in the background (core.payments); an order is placed once
+    # its payment has succeeded
+    status = models.CharField(choices=PAYMENT_STATUS_CHOICES, max_length=10,
+                              default=SUCCEEDED)
+    error = models.CharField(max_length=255, blank=True)
 
     def __str__(self):
         return self.user.username
+
+
+class IdempotencyKey(models.Model):
+    # one row per payment attempt (payments.idempotency_key); a duplicate
+    # submission collides on the unique key and gets the first payment back
+    key = models.CharField(max_length=64, unique=True)
+    payment = models.OneToOneField(Payment, on_delete=models.CASCADE,
+                                   related_name='idempotency_key')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.key
+
+
+ReceiptLine = namedtuple(
+    'ReceiptLine', 'title slug quantity price discount_price total savings')
+
+
+class OrderReceipt(models.Model):
+    # a copy of an order as it was paid for, written when its payment
+    # succeeds; the order history renders from these rows alone, and later
+    # price or title changes never reach them
+    order = models.OneToOneField(Order, on_delete=models.CASCADE, related_name='receipt')
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    placed_at = models.DateTimeField()
+    total = models.DecimalField(max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES)
+    savings = models.DecimalField(max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES)
+    item_count = models.PositiveIntegerField()
+    # a JSON list of ReceiptLine fields, amounts as strings
+    lines_json = models.TextField()
+
+    class Meta:
+        indexes = [
+            # a user's receipts, newest (highest pk) first
+            models.Index(fields=['user', 'id'], name='core_orderreceipt_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"Receipt for order {self.order_id}"
+
+    @classmethod
+    def snapshot(cls, order):
+        """Write the receipt of a just-paid order; one query for its lines."""
+        lines = list(order.items.with_prices().order_by('pk'))
+        return cls.objects.create(
+            order=order,
+            user_id=order.user_id,
+            placed_at=order.ordered_date,
+            total=from_cents(sum(line.line_total_cents for line in lines)),
+            savings=from_cents(sum(line.line_savings_cents for line in lines)),
+            item_count=sum(line.order_quantity for line in lines),
+            lines_json=json.dumps([[
+                line.item.title,
+                line.item.slug,
+                line.order_quantity,
+                str(line.item.price),
+                str(line.item.discount_price) if line.item.discount_price else None,
+                str(line.line_total),
+                str(line.line_savings),
+            ] for line in lines]),
+        )
+
+    @cached_property
+    def lines(self):
+        return [ReceiptLine(title, slug, quantity, Decimal(price),
+                            Decimal(discount_price) if discount_price else None,
+                            Decimal(total), Decimal(savings))
+                for title, slug, quantity, price, discount_price, total, savings
+                in json.loads(self.lines_json)]
+
+    def get_absolute_url(self):
+        return reverse("core:order-receipt", kwargs={'pk': self.order_id})
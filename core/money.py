@@ -0,0 +1,37 @@
+"""
+Money helpers.
+
+Prices are stored as DecimalField(max_digits=10, decimal_places=2) and
+priced in SQL as integer cents (see OrderItemQuerySet.with_prices), so
+totals are exact sums of integers on every database backend; SQLite, for
+one, has no decimal type and would otherwise add them up as floats.
+Amounts go to payment gateways as integer cents.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+CENT = Decimal('0.01')
+MAX_DIGITS = 10
+DECIMAL_PLACES = 2
+
+
+def to_decimal(value):
+    """Quantize a number (or numeric string) to a whole cent."""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        # go through repr so 19.99 becomes Decimal('19.99'), not its binary
+        # approximation
+        value = repr(value)
+    return Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def to_cents(value):
+    """An amount in currency units as integer cents."""
+    return int(to_decimal(value) * 100)
+
+
+def from_cents(cents):
+    """Integer cents as a Decimal amount in currency units."""
+    if cents is None:
+        return None
+    return (Decimal(int(cents)) / 100).quantize(CENT)
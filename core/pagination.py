@@ -0,0 +1,183 @@
+"""
+Keyset (cursor) pagination, and a page-number paginator that estimates.
+
+Instead of COUNT(*) plus LIMIT/OFFSET, a page is fetched with
+WHERE pk > <last pk seen> ORDER BY pk LIMIT n+1, which walks the primary
+key index and costs the same on page 1 and page 100000. The position is
+handed to the client as an opaque cursor.
+
+The admin needs page numbers, so its changelists use
+EstimatedCountPaginator instead, which at least spares them the
+COUNT(*) of a whole big table.
+"""
+import base64
+import binascii
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.utils.functional import cached_property
+
+# tables estimated to hold fewer rows than this are counted exactly
+ESTIMATED_COUNT_THRESHOLD = getattr(settings, 'ESTIMATED_COUNT_THRESHOLD', 100000)
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor(direction, value):
+    raw = f"{direction}:{value}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (direction, pk) for a cursor, or None if it is not valid."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        direction, value = base64.urlsafe_b64decode(
+            padded.encode()).decode().split(':', 1)
+        value = int(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    if direction not in (NEXT, PREVIOUS):
+        return None
+    return direction, value
+
+
+class KeysetPage:
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self.has_next_page = has_next
+        self.has_previous_page = has_previous
+        self.next_cursor = None
+        self.previous_cursor = None
+        if object_list and has_next:
+            self.next_cursor = encode_cursor(NEXT, object_list[-1].pk)
+        if object_list and has_previous:
+            self.previous_cursor = encode_cursor(PREVIOUS, object_list[0].pk)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.has_next_page
+
+    def has_previous(self):
+        return self.has_previous_page
+
+    def has_other_pages(self):
+        return self.has_next_page or self.has_previous_page
+
+
+class KeysetPaginator:
+    """
+    Paginates a queryset on its primary key, one query per page; with
+    descending=True the highest keys (e.g. the newest rows) come first.
+    """
+
+    def __init__(self, queryset, per_page, descending=False):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.descending = descending
+
+    def page(self, cursor=None):
+        if self.descending:
+            order, reverse, after, before = '-pk', 'pk', 'pk__lt', 'pk__gt'
+        else:
+            order, reverse, after, before = 'pk', '-pk', 'pk__gt', 'pk__lt'
+        position = decode_cursor(cursor)
+        if position is None:
+            rows = list(self.queryset.order_by(order)[:self.per_page + 1])
+            return KeysetPage(rows[:self.per_page],
+                              has_next=len(rows) > self.per_page,
+                              has_previous=False)
+        direction, pk = position
+        if direction == NEXT:
+            rows = list(self.queryset.filter(**{after: pk}).order_by(order)[
+                :self.per_page + 1])
+            return KeysetPage(rows[:self.per_page],
+                              has_next=len(rows) > self.per_page,
+                              has_previous=True)
+        rows = list(self.queryset.filter(**{before: pk}).order_by(reverse)[
+            :self.per_page + 1])
+        return KeysetPage(rows[:self.per_page][::-1],
+                          has_next=True,
+                          has_previous=len(rows) > self.per_page)
+
+
+class KeysetPaginationMixin:
+    """
+    Swaps a ListView's page-number pagination for keyset pagination. The
+    page_obj in the context has next_query/previous_query, ready-made query
+    strings that keep the other GET parameters (e.g. filters).
+    """
+    cursor_kwarg = 'cursor'
+    descending = False
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size, descending=self.descending)
+        page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        page.next_query = self.get_cursor_query(page.next_cursor)
+        page.previous_query = self.get_cursor_query(page.previous_cursor)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_cursor_query(self, cursor):
+        if cursor is None:
+            return None
+        query = self.request.GET.copy()
+        query[self.cursor_kwarg] = cursor
+        return query.urlencode()
+
+
+ROW_ESTIMATE_SQL = {
+    # kept current by autovacuum/ANALYZE; -1 (or 0) before the first one
+    'postgresql': "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+    'mysql': ("SELECT table_rows FROM information_schema.tables "
+              "WHERE table_schema = DATABASE() AND table_name = %s"),
+    # written by ANALYZE; the first number of an index's stat is the row count
+    'sqlite': "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1",
+}
+
+
+def estimate_row_count(model, using='default'):
+    """
+    The database's own estimate of the rows in model's table, or None where
+    it has none (e.g. the table was never analyzed).
+    """
+    connection = connections[using]
+    sql = ROW_ESTIMATE_SQL.get(connection.vendor)
+    if sql is None:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [model._meta.db_table])
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None  # e.g. no sqlite_stat1 yet
+    if row is None or row[0] is None:
+        return None
+    estimate = int(float(str(row[0]).split()[0]))
+    return estimate if estimate > 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    A Paginator that, for an unfiltered queryset over a big table, takes
+    the count from the database's statistics instead of COUNT(*), which
+    has to read the whole table. Filtered querysets (a search, a list
+    filter) and small tables get an exact count.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if hasattr(queryset, 'query') and not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
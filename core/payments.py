@@ -0,0 +1,216 @@
+"""
+Background payment processing.
+
+PaymentView only records a pending Payment (holding the order's stock) and
+hands the charge to a small thread pool, so a slow gateway ties up a pool
+thread instead of a web worker. When the charge returns, the order is
+placed, or reopened with its stock held again if the charge failed. The
+browser follows along on the payment status page.
+
+Every attempt has an idempotency key derived from the order and the
+number of its earlier failed attempts. It is stored with a unique index and
+sent to the processor (Stripe's Idempotency-Key, PayPal's PayPal-Request-Id),
+so a double submit or a retried request gets the first attempt's payment
+back instead of a second charge or gateway round-trip.
+
+A payment records its processor (Payment.processor) and is charged
+through that processor's Gateway (core.gateway).
+
+With PAYMENTS_EAGER = True (e.g. in tests) the charge runs inline, inside
+the request. The pool lives in the web process; a process that dies
+mid-charge leaves its payments pending, with their carts frozen and their
+stock committed. fail_stale_payments (the fail_stale_payments command runs
+it in a loop) fails those still pending after PAYMENT_STALE_AFTER, which
+reopens their carts. Whether the processor took the money by then is not
+known, so each one is logged with its idempotency key for checking.
+"""
+import datetime
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import IntegrityError, OperationalError, close_old_connections, transaction
+from django.utils import timezone
+
+from .cart import invalidate_cart_item_count
+from .gateway import GatewayUnavailable, get_gateway
+from .inventory import commit_order_stock, restore_order_stock
+from .models import IdempotencyKey, Order, OrderReceipt, Payment
+from .money import to_cents
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_WORKERS = getattr(settings, 'PAYMENT_WORKERS', 16)
+PAYMENTS_EAGER = getattr(settings, 'PAYMENTS_EAGER', False)
+# attempts at recording a charge's outcome; the card has been charged (or
+# declined) by then, so a transient database error must not lose that
+SETTLE_ATTEMPTS = 5
+# far longer than a charge with all its retries takes
+PAYMENT_STALE_AFTER = getattr(settings, 'PAYMENT_STALE_AFTER', datetime.timedelta(minutes=10))
+STALE_PAYMENT_MESSAGE = ("We could not confirm your payment. If you were charged, please "
+                         "contact us; otherwise, please try again.")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=PAYMENT_WORKERS, thread_name_prefix='payments')
+        return _executor
+
+
+def idempotency_key(order):
+    """
+    The key of the order's current payment attempt. The order's creation
+    time keeps keys apart across databases that reuse primary keys (a
+    restored backup, staging) but share a processor account.
+    """
+    created = int(order.order_created_date.timestamp() * 1_000_000)
+    return f"order-{order.pk}-{created}-attempt-{order.payment_attempts}"
+
+
+def find_payment(user, key):
+    """The user's payment recorded under `key`, or None."""
+    found = IdempotencyKey.objects.select_related('payment').filter(
+        key=key, payment__user=user).first()
+    return found.payment if found else None
+
+
+def start_payment(order, token, processor='stripe'):
+    """
+    Take the order's stock and record a pending Payment for its total, then
+    charge `token` (a Stripe card token, an approved PayPal order id)
+    through `processor` once that has committed. A duplicate of an attempt that
+    was already submitted gets that attempt's Payment back, uncharged.
+    Returns None if another payment for the order is in flight. Raises
+    OutOfStock.
+    """
+    key = idempotency_key(order)
+    payment = find_payment(order.user, key)
+    if payment is not None:
+        return payment
+    try:
+        with transaction.atomic():
+            payment = Payment.objects.create(
+                user=order.user, amount=order.get_total(), status=Payment.PENDING,
+                processor=processor)
+            IdempotencyKey.objects.create(key=key, payment=payment)
+            # only one payment per open order
+            if not Order.objects.filter(
+                    pk=order.pk, ordered=False, payment__isnull=True
+            ).update(payment=payment):
+                transaction.set_rollback(True)
+                return None
+            commit_order_stock(order)
+    except IntegrityError:
+        # a duplicate submission committed the key first
+        return find_payment(order.user, key)
+    submit_charge(payment.pk, token)
+    return payment
+
+
+def submit_charge(payment_id, token):
+    if PAYMENTS_EAGER:
+        process_payment(payment_id, token)
+    else:
+        # the worker has to see the pending payment, so wait for the commit
+        transaction.on_commit(
+            lambda: get_executor().submit(_run_in_worker, payment_id, token))
+
+
+def _run_in_worker(payment_id, token):
+    close_old_connections()
+    try:
+        process_payment(payment_id, token)
+    except Exception:
+        logger.exception("Payment %s could not be settled", payment_id)
+    finally:
+        close_old_connections()
+
+
+def process_payment(payment_id, token):
+    payment = Payment.objects.select_related('user', 'idempotency_key').get(pk=payment_id)
+    gateway = get_gateway(payment.processor)
+    try:
+        charge = gateway.charge(
+            amount=to_cents(payment.amount),  # processors take integer cents
+            currency='usd',
+            source=token,
+            # the processor answers a repeat of this request with the first charge
+            idempotency_key=payment.idempotency_key.key,
+        )
+    except GatewayUnavailable:
+        _settle(fail_payment, payment, "Our payment provider is not responding. You were "
+                                       "not charged. Please try again in a few minutes.")
+    except gateway.backend.errors as e:
+        _settle(fail_payment, payment, gateway.backend.failure_message(e))
+    except Exception:
+        # something unrelated to the processor; logged for whoever is on call
+        logger.exception("Charge for payment %s failed", payment_id)
+        _settle(fail_payment, payment, "A serious error occured. We have been notified.")
+    else:
+        _settle(complete_payment, payment, charge['id'])
+
+
+def _settle(func, payment, *args):
+    for attempt in range(1, SETTLE_ATTEMPTS + 1):
+        try:
+            return func(payment, *args)
+        except OperationalError:
+            if attempt == SETTLE_ATTEMPTS:
+                raise
+            time.sleep(random.uniform(0, 0.05 * 2 ** attempt))
+
+
+def complete_payment(payment, charge_id):
+    with transaction.atomic():
+        payment.status = Payment.SUCCEEDED
+        payment.charge_id = charge_id
+        payment.save()
+        order = Order.objects.get(payment=payment)
+        order.ordered = True
+        order.ordered_date = timezone.now()
+        order.save()
+        order.items.update(ordered=True)
+        OrderReceipt.snapshot(order)
+    invalidate_cart_item_count(payment.user)
+
+
+def fail_payment(payment, message):
+    with transaction.atomic():
+        payment.status = Payment.FAILED
+        payment.error = message[:255]
+        payment.save()
+        order = Order.objects.get(payment=payment)
+        # reopen the cart for another try (under a new key), stock held again
+        order.payment = None
+        order.payment_attempts += 1
+        order.save()
+        restore_order_stock(order)
+
+
+def fail_stale_payments(now=None, older_than=PAYMENT_STALE_AFTER):
+    """
+    Fail the payments still pending `older_than` after they were started,
+    whose worker died. Returns how many were failed.
+    """
+    cutoff = (now or timezone.now()) - older_than
+    stale = Payment.objects.filter(status=Payment.PENDING, timestamp__lt=cutoff)
+    failed = 0
+    for payment in stale.select_related('idempotency_key'):
+        # skipped if its worker settled it meanwhile
+        if not Payment.objects.filter(pk=payment.pk, status=Payment.PENDING).exists():
+            continue
+        _settle(fail_payment, payment, STALE_PAYMENT_MESSAGE)
+        logger.warning("Payment %s was still pending after %s and was failed; check %s for "
+                       "a charge under idempotency key %s", payment.pk, older_than,
+                       payment.processor, payment.idempotency_key.key)
+        failed += 1
+    return failed
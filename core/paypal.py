@@ -0,0 +1,177 @@
+"""
+A small client for the PayPal REST API, the PayPal half of core.gateway.
+
+The shop creates a PayPal order for the cart total (core.views.paypal_order),
+the shopper approves it in PayPal's own window (the JS SDK on the payment
+page), and the payment worker captures it, once it has checked that the
+order it was handed is for the amount being paid. Like stripe's
+PooledHTTPClient, calls go over one keep-alive connection pool with
+timeouts we choose, overridable per thread; the OAuth access token is
+fetched once and reused until shortly before it expires, or until PayPal
+turns it down.
+
+Errors are raised as the classes below, which mirror stripe.error's
+(rate limits, connection errors, PayPal's own failures, declines), so
+that the Gateway retries and trips its breaker on both processors alike.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import quote
+
+from django.conf import settings
+
+import requests
+
+PAYPAL_API_BASE = getattr(settings, 'PAYPAL_API_BASE', 'https://api-m.sandbox.paypal.com')
+PAYPAL_CLIENT_ID = getattr(settings, 'PAYPAL_CLIENT_ID', '')
+PAYPAL_SECRET = getattr(settings, 'PAYPAL_SECRET', '')
+# (connect, read) seconds for one HTTP call to PayPal
+PAYPAL_TIMEOUT = getattr(settings, 'PAYPAL_TIMEOUT', (3.05, 10))
+PAYPAL_POOL_SIZE = getattr(settings, 'PAYPAL_POOL_SIZE', 16)
+# a token is refreshed this many seconds before PayPal says it expires
+TOKEN_MARGIN = 60
+
+
+class PayPalError(Exception):
+    def __init__(self, message, http_status=None, issue=None, headers=None):
+        super().__init__(message)
+        self.message = message
+        self.http_status = http_status
+        # PayPal's error name, or the issue of its first detail
+        self.issue = issue
+        self.headers = headers or {}
+
+
+class APIConnectionError(PayPalError):
+    """PayPal could not be reached, or did not answer in time."""
+
+
+class RateLimitError(PayPalError):
+    pass
+
+
+class APIError(PayPalError):
+    """PayPal failed (5xx)."""
+
+
+class AuthenticationError(PayPalError):
+    pass
+
+
+class InvalidRequestError(PayPalError):
+    pass
+
+
+class DeclinedError(PayPalError):
+    """The buyer's funding source was declined."""
+
+
+class AmountMismatch(PayPalError):
+    """The approved order is not for the amount being paid."""
+
+
+def error_for(status, body, headers):
+    details = body.get('details') or [{}]
+    issue = details[0].get('issue') or body.get('name') or body.get('error')
+    message = (details[0].get('description') or body.get('message')
+               or body.get('error_description') or f"PayPal answered {status}")
+    if status == 429:
+        error_class = RateLimitError
+    elif status >= 500:
+        error_class = APIError
+    elif status in (401, 403):
+        error_class = AuthenticationError
+    elif issue == 'INSTRUMENT_DECLINED':
+        error_class = DeclinedError
+    else:
+        error_class = InvalidRequestError
+    return error_class(message, http_status=status, issue=issue, headers=headers)
+
+
+class PayPalClient:
+    def __init__(self, api_base=PAYPAL_API_BASE, client_id=PAYPAL_CLIENT_ID,
+                 secret=PAYPAL_SECRET, pool_size=PAYPAL_POOL_SIZE, timeout=PAYPAL_TIMEOUT):
+        self.api_base = api_base
+        self.client_id = client_id
+        self.secret = secret
+        self.default_timeout = timeout
+        self._local = threading.local()
+        self._token_lock = threading.Lock()
+        # (api_base, access token, monotonic time to refresh it at)
+        self._token = None
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @contextmanager
+    def timeout(self, value):
+        self._local.timeout = value
+        try:
+            yield
+        finally:
+            self._local.timeout = None
+
+    def access_token(self, refresh=False):
+        with self._token_lock:
+            token = self._token
+            if (refresh or token is None or token[0] != self.api_base
+                    or time.monotonic() >= token[2]):
+                body = self._send('POST', '/v1/oauth2/token',
+                                  data={'grant_type': 'client_credentials'},
+                                  auth=(self.client_id, self.secret))
+                token = self._token = (self.api_base, body['access_token'],
+                                       time.monotonic() + body['expires_in'] - TOKEN_MARGIN)
+            return token[1]
+
+    def request(self, method, path, request_id=None, **kwargs):
+        """
+        Call the API with the access token; `request_id` (PayPal-Request-Id)
+        makes a repeat of the call return the first one's result.
+        """
+        headers = {}
+        if request_id:
+            headers['PayPal-Request-Id'] = request_id
+        headers['Authorization'] = f"Bearer {self.access_token()}"
+        try:
+            return self._send(method, path, headers=headers, **kwargs)
+        except AuthenticationError:
+            # the token was revoked early; one more try with a new one
+            headers['Authorization'] = f"Bearer {self.access_token(refresh=True)}"
+            return self._send(method, path, headers=headers, **kwargs)
+
+    def create_order(self, value, currency='USD', custom_id=None):
+        """An order for `value` (e.g. '24.68') for the buyer to approve."""
+        unit = {'amount': {'currency_code': currency, 'value': value}}
+        if custom_id:
+            unit['custom_id'] = custom_id
+        return self.request('POST', '/v2/checkout/orders',
+                            json={'intent': 'CAPTURE', 'purchase_units': [unit]})
+
+    def get_order(self, order_id):
+        return self.request('GET', f"/v2/checkout/orders/{quote(order_id, safe='')}")
+
+    def capture_order(self, order_id, request_id=None):
+        """Take the payment of an order the buyer approved."""
+        return self.request('POST', f"/v2/checkout/orders/{quote(order_id, safe='')}/capture",
+                            request_id=request_id, json={})
+
+    def _send(self, method, path, **kwargs):
+        timeout = getattr(self._local, 'timeout', None) or self.default_timeout
+        try:
+            response = self.session.request(
+                method, self.api_base + path, timeout=timeout, **kwargs)
+        except requests.RequestException as e:
+            raise APIConnectionError(f"Could not reach PayPal: {e}") from e
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if response.status_code >= 400:
+            raise error_for(response.status_code, body, response.headers)
+        return body
+
+
+client = PayPalClient()
@@ -0,0 +1,250 @@
+"""
+Product search over Item title, description and category.
+
+On PostgreSQL the database does the work: a GIN index on a tsvector
+expression (created by migration 0020) serves full-text matching and
+ts_rank orders the results. Everywhere else an in-process inverted index
+with BM25 ranking is used. It is built from the database on first use and
+then kept up to date by the Item signals in core.signals, so each process
+holds its own copy; bulk writes that bypass the signals call
+invalidate_index() to have it rebuilt lazily.
+
+On PostgreSQL a term that matches most of the catalog would make an exact
+count a scan of all its matches, so matches are counted only up to
+SEARCH_COUNT_LIMIT (or the end of the requested page) and the results say
+when the total is a lower bound.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import namedtuple
+from operator import itemgetter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+from .models import CATEGORY_CHOICES, Item
+
+# capped: total is a lower bound, there are more matches than were counted
+SearchResults = namedtuple('SearchResults', ['items', 'total', 'capped'], defaults=[False])
+
+SEARCH_COUNT_LIMIT = getattr(settings, 'SEARCH_COUNT_LIMIT', 1000)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+CATEGORY_NAMES = dict(CATEGORY_CHOICES)
+
+# must stay identical to the indexed expression in migration 0020
+PG_SEARCH_VECTOR = (
+    "to_tsvector('english', "
+    "coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || "
+    "CASE category " + ' '.join(
+        f"WHEN '{key}' THEN '{name}'" for key, name in CATEGORY_CHOICES
+    ) + " ELSE '' END)"
+)
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def item_text(title, description, category):
+    return ' '.join([title, description, CATEGORY_NAMES.get(category, '')])
+
+
+class InvertedIndex:
+    """
+    Term -> {doc id: term frequency} postings with Okapi BM25 scoring.
+    Queries match documents containing every term. Per-term scores and
+    rankings are cached, so a common term is scored once rather than on
+    every query, and large multi-term matches are ranked with the threshold
+    algorithm instead of scoring every match.
+    """
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.postings = {}
+        self.doc_lengths = {}
+        self.doc_terms = {}
+        self.total_length = 0
+        # per-term scores and rankings, dropped when the term changes
+        self._ranked = {}
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, doc_id, text):
+        tokens = tokenize(text)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        with self._lock:
+            self._remove(doc_id)
+            for term, tf in counts.items():
+                self.postings.setdefault(term, {})[doc_id] = tf
+                self._ranked.pop(term, None)
+            self.doc_terms[doc_id] = tuple(counts)
+            self.doc_lengths[doc_id] = len(tokens)
+            self.total_length += len(tokens)
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        for term in self.doc_terms.pop(doc_id, ()):
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+            self._ranked.pop(term, None)
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+
+    def _term_scores(self, term):
+        """
+        BM25 contributions of one term as ({doc id: score}, [(doc id, score)]
+        best first). Cached until a document containing the term changes.
+        """
+        cached = self._ranked.get(term)
+        if cached is None:
+            postings = self.postings[term]
+            n = len(self.doc_lengths)
+            avgdl = self.total_length / n
+            k1, b = self.k1, self.b
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            norm = k1 * (1 - b)
+            scale = k1 * b / avgdl
+            lengths = self.doc_lengths
+            scores = {
+                doc_id: idf * tf * (k1 + 1) / (tf + norm + scale * lengths[doc_id])
+                for doc_id, tf in postings.items()}
+            ranked = sorted(scores.items(), key=itemgetter(1), reverse=True)
+            cached = self._ranked[term] = (scores, ranked)
+        return cached
+
+    def search(self, query, offset=0, limit=20):
+        """Return ([doc ids ranked best first], total matches)."""
+        terms = set(tokenize(query))
+        with self._lock:
+            if not terms or any(term not in self.postings for term in terms):
+                return [], 0
+            per_term = sorted((self._term_scores(term) for term in terms),
+                              key=lambda scores: len(scores[0]))
+            if len(per_term) == 1:
+                ranked = per_term[0][1]
+                return [doc_id for doc_id, _ in ranked[offset:offset + limit]], len(ranked)
+
+            matches = per_term[0][0].keys()
+            for scores, _ in per_term[1:]:
+                matches = matches & scores.keys()
+            wanted = offset + limit
+            if len(matches) <= self.direct_scoring_limit:
+                # sum the cached per-term scores column-wise with map/zip,
+                # which keeps the per-match work out of the interpreter loop
+                matches = list(matches)
+                columns = [map(scores.__getitem__, matches) for scores, _ in per_term]
+                totals = map(sum, zip(*columns))
+                top = [doc_id for _, doc_id in
+                       heapq.nlargest(wanted, zip(totals, matches))]
+            else:
+                top = self._threshold_top(per_term, wanted)
+            return top[offset:], len(matches)
+
+    # above this many matches, ranking uses the threshold algorithm instead
+    # of scoring every match
+    direct_scoring_limit = 10000
+
+    def _threshold_top(self, per_term, wanted):
+        # Fagin's threshold algorithm: walk every term's ranking in step and
+        # stop once the k-th best full score beats the best score any unseen
+        # document could still reach
+        heap = []
+        seen = set()
+        depth = 0
+        while True:
+            threshold = 0.0
+            for _, ranked in per_term:
+                if depth >= len(ranked):
+                    # every match appears in every ranking, so all are seen
+                    return [doc_id for _, doc_id in sorted(heap, reverse=True)]
+                doc_id, score = ranked[depth]
+                threshold += score
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                total = 0.0
+                for scores, _ in per_term:
+                    part = scores.get(doc_id)
+                    if part is None:
+                        break
+                    total += part
+                else:
+                    if len(heap) < wanted:
+                        heapq.heappush(heap, (total, doc_id))
+                    elif total > heap[0][0]:
+                        heapq.heapreplace(heap, (total, doc_id))
+            if len(heap) >= wanted and heap[0][0] >= threshold:
+                return [doc_id for _, doc_id in sorted(heap, reverse=True)]
+            depth += 1
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def use_database_search():
+    return connection.vendor == 'postgresql'
+
+
+def get_index():
+    global _index
+    with _index_lock:
+        if _index is None:
+            index = InvertedIndex()
+            rows = Item.objects.values_list(
+                'pk', 'title', 'description', 'category').iterator()
+            for pk, title, description, category in rows:
+                index.add(pk, item_text(title, description, category))
+            _index = index
+        return _index
+
+
+def invalidate_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def index_item(item):
+    # only maintained once something has searched and built the index
+    if _index is not None:
+        _index.add(item.pk, item_text(item.title, item.description, item.category))
+
+
+def unindex_item(item):
+    if _index is not None:
+        _index.remove(item.pk)
+
+
+def search_items(query, offset=0, limit=20):
+    """Items matching query, best match first, and the number of matches."""
+    if not query.strip():
+        return SearchResults([], 0)
+    if use_database_search():
+        matches = Item.objects.filter(RawSQL(
+            f"{PG_SEARCH_VECTOR} @@ plainto_tsquery('english', %s)", [query],
+            output_field=BooleanField()))
+        items = matches.annotate(rank=RawSQL(
+            f"ts_rank({PG_SEARCH_VECTOR}, plainto_tsquery('english', %s))",
+            [query], output_field=FloatField())).order_by('-rank', 'pk')[offset:offset + limit]
+        # a COUNT over a LIMITed subquery stops at the cap
+        cap = max(SEARCH_COUNT_LIMIT, offset + limit + 1)
+        total = matches.values('pk')[:cap].count()
+        return SearchResults(list(items), total, total == cap)
+    ids, total = get_index().search(query, offset, limit)
+    items = Item.objects.in_bulk(ids)
+    return SearchResults([items[pk] for pk in ids if pk in items], total)
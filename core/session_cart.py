@@ -0,0 +1,137 @@
+"""
+Carts for visitors who are not logged in.
+
+A visitor's cart lives in their session as a short string of item ids and
+quantities ("12:1,34:2"), so browsing and filling a cart costs no Order or
+OrderItem writes and no stock reservations. With a cookie or cache
+session engine (SESSION_ENGINE = 'django.contrib.sessions.backends.
+signed_cookies', say) it costs no database writes at all; with the
+database engine, one session row write per change.
+
+On login the cart is merged into the user's open order in bulk
+(cart.merge_lines, from the user_logged_in receiver in core.signals).
+Django's login() keeps the session's data, and logout() flushes it, so a
+merged cart can't come back.
+"""
+from django.conf import settings
+
+from .cart import (
+    Cart,
+    ITEM_ADDED,
+    ITEM_REMOVED,
+    NOT_IN_CART,
+    OUT_OF_STOCK,
+    PAYMENT_PENDING,
+    QUANTITY_UPDATED,
+    merge_lines,
+)
+from .models import Item, OrderItem
+from .money import from_cents, to_cents
+
+SESSION_KEY = 'cart'
+# keeps a signed-cookie session well below the browsers' 4KB cookie limit
+SESSION_CART_MAX_LINES = getattr(settings, 'SESSION_CART_MAX_LINES', 50)
+CART_FULL = 'cart-full'
+
+
+def encode(quantities):
+    return ','.join(f"{item_id}:{quantity}" for item_id, quantity in quantities.items())
+
+
+def decode(value):
+    quantities = {}
+    for line in (value or '').split(','):
+        try:
+            item_id, quantity = map(int, line.split(':'))
+        except ValueError:
+            continue  # empty or mangled
+        if quantity > 0:
+            quantities[item_id] = quantity
+    return quantities
+
+
+class SessionCart:
+    """The {item_id: quantity} cart kept in a visitor's session."""
+
+    def __init__(self, session):
+        self.session = session
+        self.quantities = decode(session.get(SESSION_KEY))
+
+    def __len__(self):
+        return len(self.quantities)
+
+    def save(self):
+        if self.quantities:
+            self.session[SESSION_KEY] = encode(self.quantities)
+        else:
+            self.session.pop(SESSION_KEY, None)
+
+    def clear(self):
+        self.quantities = {}
+        self.save()
+
+    def add_item(self, item):
+        """add_item for a visitor; stock is checked but not reserved."""
+        if item.pk not in self.quantities and len(self.quantities) >= SESSION_CART_MAX_LINES:
+            return CART_FULL
+        quantity = self.quantities.get(item.pk, 0) + 1
+        if quantity > item.inventory_quantity:
+            return OUT_OF_STOCK
+        self.quantities[item.pk] = quantity
+        self.save()
+        return QUANTITY_UPDATED if quantity > 1 else ITEM_ADDED
+
+    def remove_single_item(self, item):
+        quantity = self.quantities.get(item.pk)
+        if quantity is None:
+            return NOT_IN_CART
+        if quantity > 1:
+            self.quantities[item.pk] = quantity - 1
+        else:
+            del self.quantities[item.pk]
+        self.save()
+        return QUANTITY_UPDATED
+
+    def remove_item(self, item):
+        if self.quantities.pop(item.pk, None) is None:
+            return NOT_IN_CART
+        self.save()
+        return ITEM_REMOVED
+
+    def get_cart(self):
+        """
+        A Cart priced like get_cart's, from one query for the items, or None
+        for an empty cart. Its lines are unsaved OrderItems.
+        """
+        if not self.quantities:
+            return None
+        items = Item.objects.in_bulk(list(self.quantities))
+        lines = []
+        for item_id, quantity in self.quantities.items():
+            item = items.get(item_id)
+            if item is None:
+                continue
+            line = OrderItem(item=item, order_quantity=quantity)
+            line.line_price_cents = quantity * to_cents(item.price)
+            line.line_total_cents = quantity * to_cents(
+                item.discount_price if item.discount_price else item.price)
+            line.line_savings_cents = line.line_price_cents - line.line_total_cents
+            lines.append(line)
+        return Cart(None, lines, {
+            'total': from_cents(sum(line.line_total_cents for line in lines)),
+            'savings': from_cents(sum(line.line_savings_cents for line in lines)),
+        })
+
+    def merge_into(self, user):
+        """
+        Move the cart into the user's open order. Returns the Items that
+        were left out for lack of stock; the cart is kept, unmerged, while
+        the user has a payment pending.
+        """
+        if not self.quantities:
+            return []
+        left_out = merge_lines(user, self.quantities)
+        if left_out == PAYMENT_PENDING:
+            return []
+        self.clear()
+        return left_out
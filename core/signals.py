@@ -0,0 +1,136 @@
+import logging
+
+from django.contrib import messages
+from django.contrib.auth.signals import user_logged_in
+from django.db import IntegrityError
+from django.db.models.signals import (
+    post_delete, post_init, post_save, pre_delete, pre_save
+)
+from django.dispatch import receiver
+
+from .caching import invalidate_product_pages
+from .cart import invalidate_cart_item_counts, refresh_cart_totals, refresh_item_carts
+from .facets import FACET_FIELDS, apply_facet_delta, facet_values
+from .images import schedule_derivatives
+from .models import Item, Order
+from .search import index_item, unindex_item
+from .session_cart import SessionCart
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = {'price', 'discount_price'}
+
+
+@receiver(post_init, sender=Item)
+def remember_loaded_values(sender, instance, **kwargs):
+    instance._loaded_slug = instance.slug
+    # None when unknown (deferred), which counts as a change
+    if instance.get_deferred_fields().isdisjoint(PRICE_FIELDS):
+        instance._loaded_prices = (instance.price, instance.discount_price)
+    else:
+        instance._loaded_prices = None
+    # None when a facet field was deferred; see load_facets
+    if instance.get_deferred_fields().isdisjoint(FACET_FIELDS):
+        instance._loaded_facets = facet_values(instance)
+    else:
+        instance._loaded_facets = None
+
+
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Item)
+def purge_item_caches(sender, instance, **kwargs):
+    # catalog cards are keyed on item.modified and re-key themselves on save;
+    # the anonymous product page is keyed on the slug (old and new) and has
+    # to be dropped
+    invalidate_product_pages({instance.slug, instance._loaded_slug})
+    instance._loaded_slug = instance.slug
+
+
+@receiver(post_save, sender=Item)
+def reprice_open_carts(sender, instance, created, **kwargs):
+    prices = (instance.price, instance.discount_price)
+    if not created and instance._loaded_prices != prices:
+        refresh_item_carts([instance.pk])
+    instance._loaded_prices = prices
+
+
+@receiver(pre_delete, sender=Item)
+def remember_open_carts(sender, instance, **kwargs):
+    # the lines go with the item, by cascade and without signals of their own
+    instance._open_carts = list(Order.objects.filter(
+        ordered=False, items__item=instance).values_list('pk', 'user_id').distinct())
+
+
+@receiver(post_delete, sender=Item)
+def reprice_carts_without_item(sender, instance, **kwargs):
+    carts = getattr(instance, '_open_carts', ())
+    if carts:
+        refresh_cart_totals([pk for pk, user_id in carts])
+        invalidate_cart_item_counts({user_id for pk, user_id in carts})
+
+
+@receiver(post_save, sender=Item)
+def update_search_index(sender, instance, **kwargs):
+    index_item(instance)
+
+
+@receiver(post_delete, sender=Item)
+def remove_from_search_index(sender, instance, **kwargs):
+    unindex_item(instance)
+
+
+@receiver(pre_save, sender=Item)
+@receiver(pre_delete, sender=Item)
+def load_facets(sender, instance, **kwargs):
+    # an Item loaded with .only()/.defer() on a facet field never saw its
+    # old values; read them before the write
+    if instance._loaded_facets is None and not instance._state.adding:
+        old = Item.objects.filter(pk=instance.pk).first()
+        instance._loaded_facets = old and facet_values(old)
+
+
+@receiver(post_save, sender=Item)
+def update_facet_counts(sender, instance, created, **kwargs):
+    old = None if created else instance._loaded_facets
+    new = facet_values(instance)
+    if old != new:
+        apply_facet_delta(old, new)
+    instance._loaded_facets = new
+
+
+@receiver(post_delete, sender=Item)
+def remove_facet_counts(sender, instance, **kwargs):
+    apply_facet_delta(instance._loaded_facets, None)
+
+
+@receiver(pre_save, sender=Item)
+def note_image_upload(sender, instance, **kwargs):
+    # a newly assigned file is not committed to storage until this save;
+    # the old image's derivatives no longer apply
+    instance._image_uploaded = bool(instance.image) and not instance.image._committed
+    if instance._image_uploaded or not instance.image:
+        instance.image_digest = ''
+        instance.image_width = instance.image_height = None
+
+
+@receiver(post_save, sender=Item)
+def resize_uploaded_image(sender, instance, **kwargs):
+    if instance._image_uploaded:
+        instance._image_uploaded = False
+        schedule_derivatives(instance.pk)
+
+
+@receiver(user_logged_in)
+def merge_session_cart(sender, request, user, **kwargs):
+    if request is None or not hasattr(request, 'session'):
+        return
+    try:
+        left_out = SessionCart(request.session).merge_into(user)
+    except IntegrityError:
+        # raced with a cart change of the user's in another tab; the visitor
+        # cart stays in the session and is merged at the next login
+        logger.exception("Could not merge the session cart of user %s", user.pk)
+        return
+    for item in left_out:
+        messages.warning(request, f"Sorry, {item.title} is out of stock and was "
+                                  "not added to your cart.", fail_silently=True)
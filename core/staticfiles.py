@@ -0,0 +1,127 @@
+"""
+Static files built once for far-future caching.
+
+collectstatic with CompressedManifestStaticFilesStorage stores every file
+a second time under a content-hashed name (css/mdb.min.4f3a09c1b2d7.css),
+rewrites the url()s inside the CSS to the hashed names and records the
+mapping in staticfiles.json, from which {% static %} emits the hashed
+names. A hashed file never changes, so it can be cached for a year
+without revalidation. Text files (CSS, JS, SVG, the older font formats)
+also get a .gz twin and, when the brotli package is installed, a .br
+one, compressed at build time at the highest levels instead of per
+response.
+
+StaticFilesMiddleware (core.middleware) serves the result from
+STATIC_ROOT, choosing the smallest variant the client accepts.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+from collections import namedtuple
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# seconds a file that is not content-hashed may be cached for
+STATIC_MAX_AGE = getattr(settings, 'STATIC_MAX_AGE', 60)
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+COMPRESSIBLE_EXTENSIONS = {
+    '.css', '.js', '.map', '.json', '.svg', '.txt', '.xml', '.html',
+    '.eot', '.ttf', '.otf', '.ico',
+}
+# a variant must save at least this much to be worth its file
+MIN_SAVING = 0.05
+
+# best first
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+StaticFile = namedtuple('StaticFile', 'path content_type size mtime immutable variants')
+
+
+def compress(data):
+    """Yield (suffix, compressed bytes) for each encoding that pays off."""
+    variants = []
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    # mtime=0 keeps the output the same from one build to the next
+    variants.append(('.gz', gzip.compress(data, compresslevel=9, mtime=0)))
+    for suffix, compressed in variants:
+        if len(compressed) <= len(data) * (1 - MIN_SAVING):
+            yield suffix, compressed
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """ManifestStaticFilesStorage that also writes .br and .gz variants."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        # the hashed copies, and the originals for anything that asks for
+        # them by name
+        names = set(paths) | set(self.hashed_files.values())
+        # most hashed copies have their original's content; brotli at its
+        # highest level is slow enough to be worth compressing that once
+        compressed_by_content = {}
+        for name in sorted(names):
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            with self.open(name) as original:
+                data = original.read()
+            digest = hashlib.sha256(data).digest()
+            if digest not in compressed_by_content:
+                compressed_by_content[digest] = list(compress(data))
+            for suffix, compressed in compressed_by_content[digest]:
+                if self.exists(name + suffix):
+                    self.delete(name + suffix)
+                self._save(name + suffix, ContentFile(compressed))
+                yield name + suffix, name + suffix, True
+
+
+def collected_files(root):
+    """
+    Map every file collected into root, by its name relative to root, to
+    the StaticFile serving it. Names from staticfiles.json's hashed side
+    are immutable.
+    """
+    try:
+        with open(os.path.join(root, 'staticfiles.json')) as manifest:
+            hashed = set(json.load(manifest)['paths'].values())
+    except (OSError, ValueError, KeyError):
+        hashed = set()
+    files = {}
+    for directory, _, filenames in os.walk(root):
+        present = set(filenames)
+        for filename in filenames:
+            if filename.endswith(('.br', '.gz')) and filename[:-3] in present:
+                continue  # a variant, listed with its original
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            stat = os.stat(path)
+            content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            files[name] = StaticFile(
+                path, content_type, stat.st_size, stat.st_mtime, name in hashed,
+                [(encoding, path + suffix) for encoding, suffix in ENCODINGS
+                 if filename + suffix in present])
+    return files
+
+
+def accepted_encodings(header):
+    """The content codings an Accept-Encoding header allows."""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q=') and quality[2:].strip('0.') == '':
+            continue  # q=0 refuses it
+        accepted.add(coding.strip().lower())
+    return accepted
@@ -1,13 +1,13 @@
 from django import template
-from core.models import Order
+from core.cart import get_cart_item_count
+from core.session_cart import SessionCart
 
 register = template.Library()
 
 
 @register.filter
-def cart_item_count(user):
-    if user.is_authenticated:
-        query_set = Order.objects.filter(user=user, ordered=False)
-        if query_set.exists():
-            return query_set[0].items.count()
-    return 0
+def cart_item_count(request):
+    if request.user.is_authenticated:
+        return get_cart_item_count(request.user)
+    # a visitor's cart is in their session; no query unless they have one
+    return len(SessionCart(request.session))
@@ -0,0 +1,45 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from core.images import FORMATS, derivative_name, derivative_widths
+
+register = template.Library()
+
+# shown for an item without an image
+PLACEHOLDER = 'img/sample.jpg'
+# the fallback <img src> for browsers without srcset
+FALLBACK_WIDTH = 640
+
+
+def _srcset(item, widths, extension):
+    return format_html_join(', ', '{} {}w', (
+        (default_storage.url(derivative_name(item.image_digest, width, extension)), width)
+        for width in widths))
+
+
+@register.simple_tag
+def item_image(item, sizes='100vw', css_class='img-fluid', lazy=True):
+    """
+    The item's image as a <picture> offering every derivative (see
+    core.images) in every format, for the browser to pick by `sizes`.
+    Shows the original until the derivatives are built.
+    """
+    loading = 'lazy' if lazy else 'eager'
+    if not item.image_digest:
+        src = item.image.url if item.image else static(PLACEHOLDER)
+        return format_html('<img src="{}" class="{}" alt="{}" loading="{}">',
+                           src, css_class, item.title, loading)
+    widths = derivative_widths(item.image_width)
+    fallback = next((width for width in widths if width >= FALLBACK_WIDTH), widths[-1])
+    *sources, (extension, _, _, _) = FORMATS
+    return format_html(
+        '<picture>{}<img src="{}" srcset="{}" sizes="{}" width="{}" height="{}" '
+        'class="{}" alt="{}" loading="{}"></picture>',
+        format_html_join('', '<source type="{}" srcset="{}" sizes="{}">', (
+            (mime_type, _srcset(item, widths, source_extension), sizes)
+            for source_extension, _, mime_type, _ in sources)),
+        default_storage.url(derivative_name(item.image_digest, fallback, extension)),
+        _srcset(item, widths, extension), sizes, item.image_width, item.image_height,
+        css_class, item.title, loading)
@@ -1,3 +1,2015 @@
-from django.test import TestCase
+import gzip
+import importlib
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+import stripe
+from PIL import Image
+
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, OperationalError, connection, transaction
+from django.http import HttpResponseNotFound
+from django.test import RequestFactory, TestCase, TransactionTestCase, modify_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .cart import (
+    ITEM_ADDED, ITEM_REMOVED, NO_ACTIVE_ORDER, NOT_IN_CART, OUT_OF_STOCK,
+    PAYMENT_PENDING, QUANTITY_UPDATED, abandoned_cart_batches, add_item, cart_count_stats,
+    get_cart, get_cart_item_count, merge_lines, refresh_cart_totals, remove_item,
+    remove_single_item
+)
+from . import images, metrics, payments, paypal, staticfiles
+from .addresses import clean_address, content_hash
+from .money import from_cents, to_cents, to_decimal
+from .models import (
+    BillingAddress, FacetCount, IdempotencyKey, Item, Order, OrderItem, OrderReceipt,
+    Payment, StockReservation,
+)
+from .pagination import EstimatedCountPaginator, KeysetPaginator, encode_cursor
+from .facets import rebuild_facet_counts
+from .fake_paypal import FakePayPal
+from .fake_stripe import DECLINED_TOKEN, FakeStripe
+from .gateway import (
+    GATEWAY_SLOW_SAMPLES, GATEWAY_SLOW_SECONDS, CircuitBreaker, Gateway, GatewayUnavailable,
+    PayPalBackend, get_gateway,
+)
+from .images import derivative_name
+from .inventory import (
+    RESERVATION_TTL, OutOfStock, commit_order_stock, release_expired_reservations
+)
+from .search import InvertedIndex, invalidate_index, search_items
+from .session_cart import SessionCart, decode, encode
+from .middleware import StaticFilesMiddleware
+from .signals import reprice_open_carts
+
+
+def make_item(n, price=10.0, discount_price=None, **kwargs):
+    fields = {
+        'title': f"Item {n}",
+        'category': 'S',
+        'label': 'P',
+        'slug': f"item-{n}",
+        'description': f"Description of item {n}",
+        'inventory_quantity': 1000,
+    }
+    fields.update(kwargs)
+    return Item.objects.create(price=price, discount_price=discount_price, **fields)
+
+
+def make_order(user, items, quantity=1):
+    order = Order.objects.create(user=user, ordered_date=timezone.now())
+    for item in items:
+        order.items.add(OrderItem.objects.create(
+            user=user, item=item, order_quantity=quantity))
+    refresh_cart_totals([order.pk])
+    order.refresh_from_db()
+    return order
+
+
+class CartTestCase(TestCase):
+    # queries for a cart page: session, user, order (with its totals), lines
+    # (the navbar badge is served from the cache)
+    SUMMARY_QUERIES = 4
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            'shopper', 'shopper@example.com', 'password')
+        self.client.force_login(self.user)
+
+    def test_totals_use_discount_price_when_set(self):
+        order = make_order(self.user, [
+            make_item(1, price=10.0),
+            make_item(2, price=20.0, discount_price=15.0),
+        ], quantity=2)
+        cart = get_cart(self.user)
+        self.assertEqual(cart.total, 50.0)
+        self.assertEqual(cart.savings, 10.0)
+        self.assertEqual(order.get_total(), 50.0)
+        self.assertEqual([line.line_total for line in cart.lines], [20.0, 30.0])
+
+    def test_get_cart_without_open_order(self):
+        self.assertIsNone(get_cart(self.user))
+
+    def test_order_summary_query_count_is_independent_of_cart_size(self):
+        items = [make_item(n) for n in range(40)]
+        make_order(self.user, items[:1])
+        get_cart_item_count(self.user)
+        with self.assertNumQueries(self.SUMMARY_QUERIES):
+            small = self.client.get(reverse('core:order-summary'))
+        OrderItem.objects.all().delete()
+        Order.objects.all().delete()
+        make_order(self.user, items)
+        cache.clear()
+        get_cart_item_count(self.user)
+        with self.assertNumQueries(self.SUMMARY_QUERIES):
+            large = self.client.get(reverse('core:order-summary'))
+        self.assertEqual(small.status_code, 200)
+        self.assertContains(large, 'Item 39')
+        self.assertContains(large, '$400.0')
+
+    def test_checkout_and_payment_query_counts(self):
+        make_order(self.user, [make_item(n) for n in range(40)])
+        get_cart_item_count(self.user)
+        # and the address book
+        with self.assertNumQueries(self.SUMMARY_QUERIES + 1):
+            response = self.client.get(reverse('core:checkout'))
+        self.assertContains(response, 'Item 39')
+        with self.assertNumQueries(self.SUMMARY_QUERIES):
+            response = self.client.get(
+                reverse('core:payment', kwargs={'payment_option': 'stripe'}))
+        self.assertContains(response, '$400.0')
+
+
+class CheckoutTestCase(TestCase):
+    # the session and user lookups every request makes
+    REQUEST_QUERIES = 2
+    ADDRESS = {'street_address': '1 Main Street', 'apartment_address': '',
+               'country': 'GB', 'zip': 'SW1A 1AA', 'payment_option': 'S'}
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user('shopper')
+        self.client.force_login(self.user)
+        self.order = make_order(self.user, [make_item(n) for n in range(3)])
+        self.url = reverse('core:checkout')
+
+    def submit(self, queries, processor='stripe', **data):
+        with self.assertNumQueries(self.REQUEST_QUERIES + queries):
+            response = self.client.post(self.url, data)
+        self.assertRedirects(
+            response, reverse('core:payment', kwargs={'payment_option': processor}),
+            fetch_redirect_response=False)
+        self.order.refresh_from_db()
+        return self.order.billing_address
+
+    def test_same_address_is_stored_once(self):
+        address = self.submit(2, **self.ADDRESS)
+        self.assertEqual(address.zip, 'SW1A 1AA')
+        self.assertFalse(address.saved)
+        retyped = dict(self.ADDRESS, street_address=' 1  main STREET', zip='sw1a1aa')
+        self.assertEqual(self.submit(2, **retyped), address)
+        other = self.submit(2, **dict(self.ADDRESS, apartment_address='Flat 2'))
+        self.assertNotEqual(other, address)
+        self.assertEqual(BillingAddress.objects.count(), 2)
+
+    def test_saved_addresses_are_reused_in_one_query(self):
+        address = self.submit(3, save_info='on', **self.ADDRESS)
+        self.assertTrue(address.saved)
+        get_cart_item_count(self.user)
+        with self.assertNumQueries(self.REQUEST_QUERIES + 3):
+            response = self.client.get(self.url)
+        self.assertContains(response, 'Item 2')
+        self.assertContains(response, f'name="saved_address" value="{address.pk}"')
+        self.assertContains(response, 'United Kingdom')
+
+        Order.objects.update(billing_address=None)
+        self.assertEqual(self.submit(1, saved_address=address.pk, payment_option='S'), address)
+
+    def test_payment_option_picks_the_processor(self):
+        self.submit(2, 'paypal', **dict(self.ADDRESS, payment_option='P'))
+        paypal_gateway = get_gateway('paypal')
+        self.addCleanup(paypal_gateway.stats.reset)
+        for _ in range(GATEWAY_SLOW_SAMPLES):
+            paypal_gateway.stats.call(GATEWAY_SLOW_SECONDS + 1, failed=False)
+        # PayPal has been slow; its shoppers are sent to Stripe
+        self.submit(2, 'stripe', **dict(self.ADDRESS, payment_option='P'))
+        response = self.client.get(reverse('core:payment', kwargs={'payment_option': 'paypal'}),
+                                   follow=True)
+        self.assertContains(response, 'PayPal is slow to respond right now')
+        self.assertContains(response, 'stripe-form')
+
+    def test_cannot_use_someone_elses_address(self):
+        stranger = get_user_model().objects.create_user('stranger')
+        theirs = BillingAddress.objects.create(
+            user=stranger, street_address='2 High St', apartment_address='', country='US',
+            zip='12345', content_hash='x', saved=True)
+        response = self.client.post(self.url, {'saved_address': theirs.pk,
+                                               'payment_option': 'S'}, follow=True)
+        self.assertContains(response, 'no longer in your address book')
+        self.order.refresh_from_db()
+        self.assertIsNone(self.order.billing_address)
+        self.assertNotContains(self.client.get(self.url), '2 High St')
+
+    def test_forgetting_keeps_the_order_address(self):
+        address = self.submit(3, save_info='on', **self.ADDRESS)
+        self.client.post(reverse('core:forget-address', args=[address.pk]))
+        self.assertNotContains(self.client.get(self.url), 'name="saved_address"')
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.billing_address, address)
+        # still in use, and found again when typed again
+        self.assertEqual(self.submit(3, save_info='on', **self.ADDRESS), address)
+        self.assertContains(self.client.get(self.url), 'name="saved_address"')
+
+    def test_without_an_open_order(self):
+        Order.objects.update(ordered=True)
+        response = self.client.post(self.url, self.ADDRESS)
+        self.assertRedirects(response, reverse('core:order-summary'),
+                             fetch_redirect_response=False)
+
+    def test_migration_merges_duplicates(self):
+        migration = importlib.import_module('core.migrations.0030_address_book')
+        fields = dict(user=self.user, street_address='1 Main St', apartment_address='',
+                      country='US', zip='12345')
+        first = BillingAddress.objects.create(content_hash='a', **fields)
+        second = BillingAddress.objects.create(
+            content_hash='b', **dict(fields, street_address='1 MAIN ST '))
+        Order.objects.update(billing_address=second)
+        migration.dedupe_addresses(django_apps, None)
+        self.assertEqual(list(BillingAddress.objects.all()), [first])
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.billing_address, first)
+        first.refresh_from_db()
+        self.assertEqual(first.content_hash, content_hash(clean_address(
+            {'street_address': '1 main st', 'country': 'US', 'zip': '12345'})))
+
+
+class MoneyTestCase(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user('shopper')
+
+    def test_conversions(self):
+        self.assertEqual(to_decimal(19.99), Decimal('19.99'))
+        self.assertEqual(to_decimal('0.005'), Decimal('0.01'))
+        self.assertEqual(to_cents(Decimal('19.99')), 1999)
+        self.assertEqual(to_cents(0.1 + 0.2), 30)
+        self.assertEqual(from_cents(1999), Decimal('19.99'))
+
+    def test_totals_are_exact_for_large_random_carts(self):
+        rng = random.Random(0)
+        Item.objects.bulk_create(Item(
+            title=f"Item {n}", slug=f"item-{n}", category='S', label='P',
+            description='', price=from_cents(rng.randint(1, 10 ** 7)),
+            discount_price=from_cents(rng.randint(1, 10 ** 6)) if rng.random() < 0.3 else None,
+        ) for n in range(3000))
+        items = list(Item.objects.all())
+        for n in range(3):
+            user = get_user_model().objects.create_user(f"random-{n}")
+            order = Order.objects.create(user=user, ordered_date=timezone.now())
+            OrderItem.objects.bulk_create(
+                OrderItem(user=user, item=item, order_quantity=rng.randint(1, 9))
+                for item in rng.sample(items, rng.randint(1000, 3000)))
+            order.items.add(*OrderItem.objects.filter(user=user))
+            expected_total = expected_savings = 0
+            for line in OrderItem.objects.filter(user=user).select_related('item'):
+                price = to_cents(line.item.price) * line.order_quantity
+                paid = price
+                if line.item.discount_price:
+                    paid = to_cents(line.item.discount_price) * line.order_quantity
+                expected_total += paid
+                expected_savings += price - paid
+            totals = order.items.totals()
+            self.assertEqual(totals['total'], from_cents(expected_total))
+            self.assertEqual(totals['savings'], from_cents(expected_savings))
+            self.assertEqual(order.get_total(), from_cents(expected_total))
+            # the per-line helpers agree with the SQL prices
+            for line in order.items.with_prices():
+                self.assertEqual(line.line_total, line.get_final_price())
+
+    @mock.patch('core.payments.PAYMENTS_EAGER', True)
+    @mock.patch('stripe.Charge.create', return_value={'id': 'ch_1'})
+    def test_payment_sends_integer_cents(self, create):
+        make_order(self.user, [make_item(1, price=Decimal('0.10')),
+                               make_item(2, price=Decimal('0.20'))], quantity=3)
+        self.client.force_login(self.user)
+        self.client.post(reverse('core:payment', kwargs={'payment_option': 'stripe'}),
+                         {'stripeToken': 'tok'})
+        self.assertEqual(create.call_args[1]['amount'], 90)
+        self.assertIsInstance(create.call_args[1]['amount'], int)
+        self.assertEqual(Payment.objects.get().amount, Decimal('0.90'))
+
+
+class CartCountCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        cart_count_stats.reset()
+        self.user = get_user_model().objects.create_user(
+            'shopper', 'shopper@example.com', 'password')
+        self.client.force_login(self.user)
+        self.item = make_item(1)
+
+    def test_hit_costs_no_queries(self):
+        make_order(self.user, [self.item, make_item(2)])
+        with self.assertNumQueries(1):
+            self.assertEqual(get_cart_item_count(self.user), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_cart_item_count(self.user), 2)
+        self.assertEqual(cart_count_stats.as_dict(), {'hits': 1, 'misses': 1})
+
+    def test_cart_views_invalidate_the_count(self):
+        self.assertEqual(get_cart_item_count(self.user), 0)
+        self.client.get(self.item.get_add_to_cart_url())
+        self.assertEqual(get_cart_item_count(self.user), 1)
+        self.client.get(self.item.get_remove_from_cart_url())
+        self.assertEqual(get_cart_item_count(self.user), 0)
+        self.client.get(self.item.get_add_to_cart_url())
+        self.client.get(reverse(
+            'core:remove-single-item-from-cart', kwargs={'slug': self.item.slug}))
+        self.assertEqual(get_cart_item_count(self.user), 0)
+
+
+class CartMutationTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            'shopper', 'shopper@example.com', 'password')
+        self.item = make_item(1)
+
+    def quantity(self):
+        return OrderItem.objects.get(user=self.user, item=self.item).order_quantity
+
+    def test_add_and_remove_round_trip(self):
+        self.assertEqual(add_item(self.user, self.item), ITEM_ADDED)
+        self.assertEqual(add_item(self.user, self.item), QUANTITY_UPDATED)
+        self.assertEqual(self.quantity(), 2)
+        self.assertEqual(remove_single_item(self.user, self.item), QUANTITY_UPDATED)
+        self.assertEqual(self.quantity(), 1)
+        self.assertEqual(remove_single_item(self.user, self.item), QUANTITY_UPDATED)
+        self.assertFalse(OrderItem.objects.exists())
+        self.assertEqual(remove_item(self.user, self.item), NOT_IN_CART)
+
+    def test_remove_without_order(self):
+        self.assertEqual(remove_item(self.user, self.item), NO_ACTIVE_ORDER)
+        self.assertEqual(remove_single_item(self.user, self.item), NO_ACTIVE_ORDER)
+
+    def test_remove_item_deletes_the_line(self):
+        add_item(self.user, self.item)
+        add_item(self.user, self.item)
+        self.assertEqual(remove_item(self.user, self.item), ITEM_REMOVED)
+        self.assertFalse(OrderItem.objects.exists())
+        self.assertTrue(Order.objects.filter(user=self.user, ordered=False).exists())
+
+    def test_lines_of_placed_orders_are_not_reused(self):
+        add_item(self.user, self.item)
+        Order.objects.update(ordered=True)
+        OrderItem.objects.update(ordered=True)
+        self.assertEqual(add_item(self.user, self.item), ITEM_ADDED)
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual(OrderItem.objects.count(), 2)
+
+    def test_increment_query_count(self):
+        add_item(self.user, self.item)
+        # savepoint, stock UPDATE, reservation UPDATE, line UPDATE, order
+        # totals UPDATE, release
+        with self.assertNumQueries(6):
+            add_item(self.user, self.item)
+        self.assertEqual(self.quantity(), 2)
+
+    def test_view_query_count(self):
+        self.client.force_login(self.user)
+        add_item(self.user, self.item)
+        # session, user, item, then the six of add_item()
+        with self.assertNumQueries(9):
+            self.client.get(self.item.get_add_to_cart_url())
+        self.assertEqual(self.quantity(), 2)
+
+
+class CartTotalsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user('shopper')
+        self.item = make_item(1, price=Decimal('10.00'))
+        self.sale = make_item(2, price=Decimal('20.00'), discount_price=Decimal('15.50'))
+
+    def totals(self):
+        order = Order.objects.get(user=self.user, ordered=False)
+        # the stored totals agree with the lines
+        self.assertEqual(refresh_cart_totals([order.pk], repair=False), [])
+        return order.item_count, order.subtotal, order.discount_total, order.total
+
+    def test_mutations_keep_the_totals(self):
+        add_item(self.user, self.item)
+        add_item(self.user, self.sale)
+        add_item(self.user, self.sale)
+        self.assertEqual(self.totals(), (2, Decimal('50.00'), Decimal('9.00'), Decimal('41.00')))
+        remove_single_item(self.user, self.sale)
+        self.assertEqual(self.totals(), (2, Decimal('30.00'), Decimal('4.50'), Decimal('25.50')))
+        remove_single_item(self.user, self.item)
+        self.assertEqual(self.totals(), (1, Decimal('20.00'), Decimal('4.50'), Decimal('15.50')))
+        merge_lines(self.user, {self.sale.pk: 2, self.item.pk: 3})
+        self.assertEqual(self.totals(), (2, Decimal('90.00'), Decimal('13.50'), Decimal('76.50')))
+        remove_item(self.user, self.sale)
+        self.assertEqual(self.totals(), (1, Decimal('30.00'), Decimal('0.00'), Decimal('30.00')))
+        cart = get_cart(self.user)
+        self.assertEqual((cart.total, cart.savings), (Decimal('30.00'), Decimal('0.00')))
+
+    def test_price_changes_reprice_open_carts_only(self):
+        placed = make_order(self.user, [self.item])
+        Order.objects.filter(pk=placed.pk).update(ordered=True)
+        placed.items.update(ordered=True)
+        add_item(self.user, self.item)
+        self.item.price = Decimal('12.00')
+        self.item.save()
+        self.assertEqual(self.totals(), (1, Decimal('12.00'), Decimal('0.00'), Decimal('12.00')))
+        self.assertEqual(Order.objects.get(pk=placed.pk).total, Decimal('10.00'))
+        # a change to another field leaves the carts alone
+        with self.assertNumQueries(0):
+            reprice_open_carts(Item, self.item, created=False)
+
+    def test_deleting_an_item_reprices_its_carts(self):
+        add_item(self.user, self.item)
+        add_item(self.user, self.sale)
+        self.assertEqual(get_cart_item_count(self.user), 2)
+        self.sale.delete()
+        self.assertEqual(self.totals(), (1, Decimal('10.00'), Decimal('0.00'), Decimal('10.00')))
+        self.assertEqual(get_cart_item_count(self.user), 1)
+        self.assertEqual(Order.objects.get().get_total(), Decimal('10.00'))
+
+    def test_cleanup_of_empty_lines_updates_the_count(self):
+        add_item(self.user, self.item)
+        add_item(self.user, self.sale)
+        OrderItem.objects.filter(item=self.sale).update(order_quantity=0)
+        call_command('cleanup_carts', stdout=io.StringIO())
+        self.assertEqual(self.totals(), (1, Decimal('10.00'), Decimal('0.00'), Decimal('10.00')))
+
+    def test_verify_command_repairs_drift(self):
+        add_item(self.user, self.item)
+        Order.objects.update(item_count=5, total_cents=1)
+        out = io.StringIO()
+        call_command('verify_cart_totals', dry_run=True, stdout=out)
+        self.assertIn('1 had drifted', out.getvalue())
+        self.assertEqual(Order.objects.get().item_count, 5)
+        out = io.StringIO()
+        call_command('verify_cart_totals', stdout=out)
+        self.assertIn('1 had drifted, all repaired', out.getvalue())
+        self.assertEqual(self.totals(), (1, Decimal('10.00'), Decimal('0.00'), Decimal('10.00')))
+
+
+class SessionCartTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            'shopper', 'shopper@example.com', 'password')
+        self.item = make_item(1, price=Decimal('10.00'), discount_price=Decimal('8.00'))
+        self.other = make_item(2, price=Decimal('5.50'))
+
+    def session_cart(self):
+        return SessionCart(self.client.session)
+
+    def writes(self, queries):
+        # the session row is the only thing a visitor's cart may write
+        return [q['sql'] for q in queries
+                if q['sql'].split()[0] in ('INSERT', 'UPDATE', 'DELETE')
+                and 'django_session' not in q['sql']]
+
+    def test_encoding_round_trip(self):
+        self.assertEqual(encode({12: 1, 34: 2}), '12:1,34:2')
+        self.assertEqual(decode('12:1,34:2'), {12: 1, 34: 2})
+        self.assertEqual(decode('12:1,,x:2,5:0,7'), {12: 1})
+        self.assertEqual(decode(None), {})
+
+    def test_visitor_cart_writes_nothing_but_the_session(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.item.get_add_to_cart_url())
+            self.client.get(self.item.get_add_to_cart_url())
+            self.client.get(self.other.get_add_to_cart_url())
+            self.client.get(reverse('core:remove-single-item-from-cart', args=[self.item.slug]))
+            self.client.get(reverse('core:remove-from-cart', args=[self.other.slug]))
+            self.client.get(self.item.get_add_to_cart_url())
+        self.assertEqual(self.writes(queries), [])
+        self.assertEqual(self.session_cart().quantities, {self.item.pk: 2})
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(StockReservation.objects.exists())
+
+    def test_visitor_order_summary(self):
+        self.client.get(self.item.get_add_to_cart_url())
+        self.client.get(self.item.get_add_to_cart_url())
+        self.client.get(self.other.get_add_to_cart_url())
+        response = self.client.get(reverse('core:order-summary'))
+        self.assertContains(response, 'Item 2')
+        self.assertEqual(response.context['cart'].total, Decimal('21.50'))
+        self.assertEqual(response.context['cart'].savings, Decimal('4.00'))
+        # the navbar badge
+        self.assertContains(response, '> 2 <')
+
+    def test_visitor_cannot_add_more_than_the_stock(self):
+        scarce = make_item(3, inventory_quantity=1)
+        self.client.get(scarce.get_add_to_cart_url())
+        response = self.client.get(scarce.get_add_to_cart_url(), follow=True)
+        self.assertContains(response, 'out of stock')
+        self.assertEqual(self.session_cart().quantities, {scarce.pk: 1})
+
+    def test_visitor_product_pages_with_a_cart_skip_the_page_cache(self):
+        self.client.get(self.item.get_absolute_url())
+        self.client.get(self.other.get_add_to_cart_url())
+        self.client.get(reverse('core:order-summary'))  # consume the message
+        response = self.client.get(self.item.get_absolute_url())
+        self.assertContains(response, '> 1 <')
+
+    def test_login_merges_the_visitor_cart(self):
+        add_item(self.user, self.item)
+        self.client.get(self.item.get_add_to_cart_url())
+        self.client.get(self.item.get_add_to_cart_url())
+        self.client.get(self.other.get_add_to_cart_url())
+        self.client.login(username='shopper', password='password')
+        quantities = dict(OrderItem.objects.filter(user=self.user).values_list(
+            'item_id', 'order_quantity'))
+        self.assertEqual(quantities, {self.item.pk: 3, self.other.pk: 1})
+        order = Order.objects.get(user=self.user, ordered=False)
+        self.assertEqual(order.items.count(), 2)
+        self.assertEqual(StockReservation.objects.get(item=self.item).quantity, 3)
+        self.assertEqual(StockReservation.objects.get(item=self.other).quantity, 1)
+        self.assertEqual(len(self.session_cart()), 0)
+        # logging in again does not add the cart twice
+        self.client.logout()
+        self.client.login(username='shopper', password='password')
+        self.assertEqual(OrderItem.objects.get(item=self.item).order_quantity, 3)
+
+    def test_merge_leaves_out_items_without_stock(self):
+        scarce = make_item(3, inventory_quantity=1)
+        self.client.get(scarce.get_add_to_cart_url())
+        Item.objects.filter(pk=scarce.pk).update(inventory_quantity=0)
+        self.client.get(self.other.get_add_to_cart_url())
+        self.client.login(username='shopper', password='password')
+        self.assertEqual(list(OrderItem.objects.values_list('item_id', flat=True)),
+                         [self.other.pk])
+
+    def test_merge_waits_while_a_payment_is_pending(self):
+        add_item(self.user, self.item)
+        Order.objects.update(payment=Payment.objects.create(
+            user=self.user, amount=Decimal('8.00'), status=Payment.PENDING))
+        self.client.get(self.other.get_add_to_cart_url())
+        self.client.login(username='shopper', password='password')
+        self.assertFalse(OrderItem.objects.filter(item=self.other).exists())
+        self.assertEqual(self.session_cart().quantities, {self.other.pk: 1})
+
+    def test_checkout_requires_login(self):
+        response = self.client.get(reverse('core:checkout'))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('next=/checkout/', response['Location'])
+
+
+class CartCleanupTestCase(TestCase):
+    def setUp(self):
+        self.item = make_item(1)
+        self.users = [get_user_model().objects.create_user(f"shopper-{n}") for n in range(7)]
+        self.stale = timezone.now() - timedelta(days=60)
+
+    def cart(self, user, created=None):
+        order = make_order(user, [self.item, make_item(f"{user.pk}-2")])
+        if created:
+            Order.objects.filter(pk=order.pk).update(order_created_date=created)
+        return order
+
+    def test_deletes_only_abandoned_carts(self):
+        stale = [self.cart(user, self.stale) for user in self.users[:4]]
+        fresh = self.cart(self.users[4])
+        paying = self.cart(self.users[5], self.stale)
+        Order.objects.filter(pk=paying.pk).update(payment=Payment.objects.create(
+            user=self.users[5], amount=Decimal('20.00'), status=Payment.PENDING))
+        shopping = self.cart(self.users[6], self.stale)
+        StockReservation.objects.create(
+            user=self.users[6], item=self.item, quantity=1,
+            expires_at=timezone.now() + timedelta(minutes=5))
+        placed = Order.objects.create(user=self.users[0], ordered=True, ordered_date=self.stale)
+        placed.items.add(OrderItem.objects.create(
+            user=self.users[0], item=make_item(99), ordered=True))
+        Order.objects.filter(pk=placed.pk).update(order_created_date=self.stale)
+
+        batches = list(abandoned_cart_batches(timezone.now() - timedelta(days=30), batch_size=2))
+        self.assertEqual(sum(orders for orders, _ in batches), 4)
+        self.assertEqual(sum(lines for _, lines in batches), 8)
+        self.assertEqual(set(Order.objects.values_list('pk', flat=True)),
+                         {fresh.pk, paying.pk, shopping.pk, placed.pk})
+        self.assertEqual(OrderItem.objects.count(), 7)
+        self.assertFalse(Order.items.through.objects.filter(
+            order_id__in=[order.pk for order in stale]).exists())
+
+    def test_command_archives_and_sweeps_dead_lines(self):
+        stale = self.cart(self.users[0], self.stale)
+        kept = self.cart(self.users[1])
+        # an empty line and one that belongs to no order
+        kept.items.filter(item=self.item).update(order_quantity=0)
+        OrderItem.objects.create(user=self.users[2], item=self.item)
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'carts.jsonl')
+            call_command('cleanup_carts', days=30, batch_size=1, archive=path, stdout=out)
+            with open(path) as f:
+                archived = [json.loads(line) for line in f]
+        self.assertEqual([cart['order'] for cart in archived], [stale.pk])
+        self.assertEqual(len(archived[0]['lines']), 2)
+        self.assertIn('Deleted 1 abandoned carts and 4 cart lines', out.getvalue())
+        self.assertIn('rows/s', out.getvalue())
+        self.assertEqual(list(kept.items.values_list('order_quantity', flat=True)), [1])
+
+    def test_cleanup_drops_cached_cart_counts(self):
+        self.cart(self.users[0], self.stale)
+        kept = self.cart(self.users[1])
+        self.assertEqual(get_cart_item_count(self.users[0]), 2)
+        self.assertEqual(get_cart_item_count(self.users[1]), 2)
+        kept.items.filter(item=self.item).update(order_quantity=0)
+        call_command('cleanup_carts', days=30, stdout=io.StringIO())
+        self.assertEqual(get_cart_item_count(self.users[0]), 0)
+        self.assertEqual(get_cart_item_count(self.users[1]), 1)
+
+    def test_command_rejects_empty_batches(self):
+        with self.assertRaisesMessage(CommandError, '--batch-size must be at least 1'):
+            call_command('cleanup_carts', batch_size=0, stdout=io.StringIO())
+
+
+class ConcurrentCartMutationTestCase(TransactionTestCase):
+    THREADS = 8
+    CLICKS = 250
+
+    def test_concurrent_increments_are_exact(self):
+        user = get_user_model().objects.create_user('shopper', password='password')
+        item = make_item(1, inventory_quantity=5000)
+        add_item(user, item)
+        errors = []
+
+        def click():
+            try:
+                for _ in range(self.CLICKS):
+                    while True:
+                        try:
+                            add_item(user, item)
+                            break
+                        except OperationalError:
+                            # SQLite's shared in-memory test database refuses
+                            # concurrent writers instead of queueing them; the
+                            # transaction rolled back, so retry like a client
+                            time.sleep(random.uniform(0, 0.02))
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=click) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            OrderItem.objects.get(user=user, item=item).order_quantity,
+            1 + self.THREADS * self.CLICKS)
+
+
+class InventoryTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user('shopper')
+        self.item = make_item(1, inventory_quantity=2)
+
+    def stock(self):
+        self.item.refresh_from_db()
+        held = sum(StockReservation.objects.values_list('quantity', flat=True))
+        return self.item.inventory_quantity, held
+
+    def test_cart_changes_reserve_and_release_stock(self):
+        self.assertEqual(add_item(self.user, self.item), ITEM_ADDED)
+        self.assertEqual(add_item(self.user, self.item), QUANTITY_UPDATED)
+        self.assertEqual(self.stock(), (0, 2))
+        self.assertEqual(add_item(self.user, self.item), OUT_OF_STOCK)
+        self.assertEqual(OrderItem.objects.get().order_quantity, 2)
+        remove_single_item(self.user, self.item)
+        self.assertEqual(self.stock(), (1, 1))
+        remove_item(self.user, self.item)
+        self.assertEqual(self.stock(), (2, 0))
+
+    def test_restocking_leaves_held_units_held(self):
+        add_item(self.user, self.item)
+        self.assertEqual(self.stock(), (1, 1))
+        # the stock on hand, as a catalog file or the admin states it
+        path = os.path.join(tempfile.mkdtemp(), 'catalog.jsonl')
+        self.addCleanup(os.remove, path)
+        with open(path, 'w') as f:
+            json.dump({'slug': 'item-1', 'title': 'Item 1', 'price': '10.00',
+                       'category': 'S', 'label': 'P', 'description': 'Description of item 1',
+                       'inventory_quantity': 2}, f)
+        out = io.StringIO()
+        call_command('import_catalog', path, stdout=out)
+        self.assertIn('1 unchanged', out.getvalue())
+        self.assertEqual(self.stock(), (1, 1))
+        Item.objects.update(title='Renamed')
+        call_command('import_catalog', path, stdout=io.StringIO())
+        self.assertEqual(self.stock(), (1, 1))
+
+        admin = get_user_model().objects.create_superuser('admin', '', 'password')
+        self.client.force_login(admin)
+        url = reverse('admin:core_item_change', args=[self.item.pk])
+        self.assertContains(self.client.get(url), 'name="stock_on_hand" value="2"')
+        form = {'title': 'item 1', 'slug': 'item-1', 'price': '10.00', 'category': 'S',
+                'label': 'P', 'description': 'x', 'stock_on_hand': 5}
+        self.assertEqual(self.client.post(url, form).status_code, 302)
+        self.assertEqual(self.stock(), (4, 1))
+        remove_item(self.user, self.item)
+        self.assertEqual(self.stock(), (5, 0))
+
+    def test_restock_empty_items(self):
+        empty = make_item(2, inventory_quantity=0)
+        held = make_item(3, inventory_quantity=1)
+        add_item(self.user, held)
+        with self.assertRaises(CommandError):
+            call_command('restock', 10, stdout=io.StringIO())
+        call_command('restock', 10, '--empty', stdout=io.StringIO())
+        self.assertEqual(Item.objects.get(pk=empty.pk).inventory_quantity, 10)
+        self.assertEqual(Item.objects.get(pk=held.pk).inventory_quantity, 0)
+        self.assertEqual(Item.objects.get(pk=self.item.pk).inventory_quantity, 2)
+        call_command('restock', 10, 'item-3', stdout=io.StringIO())
+        self.assertEqual(Item.objects.get(pk=held.pk).inventory_quantity, 9)
+
+    def test_add_to_cart_view_when_out_of_stock(self):
+        Item.objects.update(inventory_quantity=0)
+        self.client.force_login(self.user)
+        response = self.client.get(self.item.get_add_to_cart_url(), follow=True)
+        self.assertContains(response, 'out of stock')
+        self.assertFalse(OrderItem.objects.exists())
+
+    def test_sweeper_releases_only_expired_holds(self):
+        add_item(self.user, self.item)
+        self.assertEqual(release_expired_reservations(), 0)
+        later = timezone.now() + RESERVATION_TTL * 2
+        self.assertEqual(release_expired_reservations(now=later), 1)
+        self.assertEqual(self.stock(), (2, 0))
+        # the cart line stays; paying takes the stock again
+        order = Order.objects.get()
+        commit_order_stock(order)
+        self.assertEqual(self.stock(), (1, 0))
+
+    def test_commit_fails_when_expired_stock_was_sold(self):
+        add_item(self.user, self.item)
+        add_item(self.user, self.item)
+        release_expired_reservations(now=timezone.now() + RESERVATION_TTL * 2)
+        other = get_user_model().objects.create_user('other')
+        add_item(other, self.item)
+        with self.assertRaises(OutOfStock):
+            commit_order_stock(Order.objects.get(user=self.user))
+
+    @mock.patch('core.payments.PAYMENTS_EAGER', True)
+    @mock.patch('stripe.Charge.create', return_value={'id': 'ch_1'})
+    def test_payment_commits_stock_with_the_payment(self, create):
+        add_item(self.user, self.item)
+        self.client.force_login(self.user)
+        url = reverse('core:payment', kwargs={'payment_option': 'stripe'})
+        self.client.post(url, {'stripeToken': 'tok'})
+        self.assertEqual(self.stock(), (1, 0))
+        self.assertTrue(Order.objects.get().ordered)
+
+    @mock.patch('core.payments.PAYMENTS_EAGER', True)
+    @mock.patch('stripe.Charge.create', return_value={'id': 'ch_1'})
+    def test_payment_is_refused_without_stock(self, create):
+        make_order(self.user, [self.item], quantity=3)
+        self.client.force_login(self.user)
+        url = reverse('core:payment', kwargs={'payment_option': 'stripe'})
+        response = self.client.post(url, {'stripeToken': 'tok'}, follow=True)
+        self.assertContains(response, 'out of stock')
+        create.assert_not_called()
+        self.assertFalse(Payment.objects.exists())
+        self.assertFalse(Order.objects.get().ordered)
+        self.assertEqual(self.stock(), (2, 0))
+
+
+class ConcurrentInventoryTestCase(TransactionTestCase):
+    THREADS = 8
+    SHOPPERS = 10
+    STOCK = 25
+
+    def test_last_units_are_never_oversold(self):
+        item = make_item(1, inventory_quantity=self.STOCK)
+        User = get_user_model()
+        shoppers = [[User.objects.create_user(f"shopper-{t}-{n}")
+                     for n in range(self.SHOPPERS)] for t in range(self.THREADS)]
+        sold = []
+        errors = []
+
+        def retry(func):
+            while True:
+                try:
+                    return func()
+                except OperationalError:
+                    # see ConcurrentCartMutationTestCase
+                    time.sleep(random.uniform(0, 0.02))
+
+        def checkout(user):
+            with transaction.atomic():
+                order = Order.objects.get(user=user, ordered=False)
+                commit_order_stock(order)
+                Order.objects.filter(pk=order.pk).update(ordered=True)
+
+        def shop(users):
+            try:
+                for user in users:
+                    if retry(lambda: add_item(user, item)) == OUT_OF_STOCK:
+                        continue
+                    retry(lambda: checkout(user))
+                    sold.append(user.pk)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=shop, args=(users,)) for users in shoppers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        item.refresh_from_db()
+        self.assertEqual(len(sold), self.STOCK)
+        self.assertEqual(item.inventory_quantity, 0)
+        self.assertFalse(StockReservation.objects.exists())
+
+
+class FakeStripeMixin:
+    LATENCY = 0.0
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.fake_stripe = FakeStripe(latency=cls.LATENCY).start()
+        cls.api_base = mock.patch.object(stripe, 'api_base', cls.fake_stripe.url)
+        cls.api_base.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.api_base.stop()
+        cls.fake_stripe.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.fake_stripe.reset()
+
+    def pay(self, token='tok_visa', key=None, **kwargs):
+        data = {'stripeToken': token}
+        if key is not None:
+            data['idempotency_key'] = key
+        return self.client.post(
+            reverse('core:payment', kwargs={'payment_option': 'stripe'}), data, **kwargs)
+
+
+@mock.patch('core.payments.PAYMENTS_EAGER', True)
+class PaymentFlowTestCase(FakeStripeMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = get_user_model().objects.create_user('shopper')
+        self.client.force_login(self.user)
+        self.item = make_item(1, price=Decimal('12.34'), inventory_quantity=5)
+        add_item(self.user, self.item)
+        add_item(self.user, self.item)
+
+    def test_successful_charge_places_the_order(self):
+        response = self.pay()
+        payment = Payment.objects.get()
+        self.assertRedirects(response, reverse('core:payment-status', args=[payment.pk]),
+                             fetch_redirect_response=False)
+        self.assertEqual(payment.status, Payment.SUCCEEDED)
+        self.assertEqual(payment.amount, Decimal('24.68'))
+        self.assertEqual(self.fake_stripe.charges[-1]['amount'], 2468)
+        self.assertEqual(payment.charge_id, self.fake_stripe.charges[-1]['id'])
+        order = Order.objects.get()
+        self.assertTrue(order.ordered)
+        self.assertTrue(order.items.get().ordered)
+        response = self.client.get(response['Location'], follow=True)
+        self.assertContains(response, 'successfully placed')
+        self.assertRedirects(response, order.receipt.get_absolute_url())
+        self.assertEqual(order.receipt.total, Decimal('24.68'))
+
+    def test_payment_whose_worker_died_is_failed(self):
+        with mock.patch('core.payments.submit_charge'):
+            self.pay()
+        payment = Payment.objects.get()
+        self.assertEqual(payment.status, Payment.PENDING)
+        self.assertEqual(add_item(self.user, self.item), PAYMENT_PENDING)
+        self.assertEqual(payments.fail_stale_payments(), 0)
+        later = timezone.now() + payments.PAYMENT_STALE_AFTER * 2
+        with self.assertLogs('core.payments', 'WARNING') as logs:
+            self.assertEqual(payments.fail_stale_payments(now=later), 1)
+        self.assertIn(payment.idempotency_key.key, logs.output[0])
+        payment.refresh_from_db()
+        self.assertEqual(payment.status, Payment.FAILED)
+        self.assertEqual(self.fake_stripe.charges, [])
+        self.assertEqual(StockReservation.objects.get().quantity, 2)
+        self.assertEqual(add_item(self.user, self.item), QUANTITY_UPDATED)
+
+    def test_declined_charge_reopens_the_cart(self):
+        response = self.pay(DECLINED_TOKEN, follow=True)
+        self.assertContains(response, 'Your card was declined.')
+        payment = Payment.objects.get()
+        self.assertEqual(payment.status, Payment.FAILED)
+        order = Order.objects.get()
+        self.assertFalse(order.ordered)
+        self.assertIsNone(order.payment)
+        # the units are held for the cart again
+        self.assertEqual(StockReservation.objects.get().quantity, 2)
+        self.assertEqual(add_item(self.user, self.item), QUANTITY_UPDATED)
+
+    def test_status_api(self):
+        payment = Payment.objects.create(
+            user=self.user, amount=Decimal('1.00'), status=Payment.PENDING)
+        response = self.client.get(reverse('core:payment-status-api', args=[payment.pk]))
+        self.assertEqual(response.json()['status'], 'pending')
+        self.assertContains(self.client.get(
+            reverse('core:payment-status', args=[payment.pk])), 'Processing your payment')
+        other = get_user_model().objects.create_user('other')
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(
+            reverse('core:payment-status-api', args=[payment.pk])).status_code, 404)
+
+    def test_cart_is_frozen_while_a_payment_is_pending(self):
+        order = Order.objects.get()
+        order.payment = Payment.objects.create(
+            user=self.user, amount=Decimal('24.68'), status=Payment.PENDING)
+        order.save()
+        self.assertEqual(add_item(self.user, self.item), PAYMENT_PENDING)
+        self.assertEqual(add_item(self.user, make_item(2)), PAYMENT_PENDING)
+        self.assertEqual(remove_item(self.user, self.item), PAYMENT_PENDING)
+        self.assertEqual(OrderItem.objects.get().order_quantity, 2)
+        self.assertEqual(StockReservation.objects.get(item=self.item).quantity, 2)
+        # a second submit does not charge again
+        self.pay()
+        self.assertEqual(self.fake_stripe.charges, [])
+
+    def test_resubmitted_form_is_not_charged_again(self):
+        response = self.client.get(reverse('core:payment', kwargs={'payment_option': 'stripe'}))
+        key = response.context['idempotency_key']
+        self.assertEqual(key, payments.idempotency_key(Order.objects.get()))
+        first = self.pay(key=key)
+        # the order has been placed by now; the resubmit still finds its payment
+        second = self.pay(key=key)
+        self.assertEqual(first['Location'], second['Location'])
+        self.assertEqual(len(self.fake_stripe.charges), 1)
+        self.assertEqual(Payment.objects.get().idempotency_key.key, key)
+        self.assertIn(key, self.fake_stripe.replies)
+
+    def test_retry_after_a_decline_is_a_new_attempt(self):
+        self.pay(DECLINED_TOKEN)
+        self.pay()
+        keys = list(IdempotencyKey.objects.order_by('pk').values_list('key', flat=True))
+        self.assertEqual(len(keys), 2)
+        self.assertEqual(keys[0].replace('attempt-0', 'attempt-1'), keys[1])
+        self.assertTrue(Order.objects.get().ordered)
+        self.assertEqual(len(self.fake_stripe.charges), 1)
+
+    def test_open_breaker_fails_the_payment_fast(self):
+        with mock.patch('core.payments.get_gateway') as get_gateway:
+            get_gateway.return_value.charge.side_effect = GatewayUnavailable
+            response = self.pay(follow=True)
+        self.assertContains(response, 'You were not charged')
+        self.assertEqual(Payment.objects.get().status, Payment.FAILED)
+        self.assertFalse(Order.objects.get().ordered)
+
+    def test_gateway_metrics_are_staff_only(self):
+        url = reverse('core:gateway-metrics')
+        self.assertEqual(self.client.get(url).status_code, 302)
+        self.user.is_staff = True
+        self.user.save()
+        metrics = self.client.get(url).json()
+        self.assertEqual(set(metrics), {'stripe', 'paypal'})
+        self.assertEqual(metrics['stripe']['breaker'], CircuitBreaker.CLOSED)
+        self.assertTrue(metrics['paypal']['healthy'])
+        self.assertIn('p95_ms', metrics['stripe']['latency'])
+
+    def test_gateway_replays_a_repeated_key(self):
+        first = stripe.Charge.create(amount=100, currency='usd', source='tok_visa',
+                                     idempotency_key='replayed')
+        second = stripe.Charge.create(amount=100, currency='usd', source='tok_visa',
+                                      idempotency_key='replayed')
+        self.assertEqual(first['id'], second['id'])
+        self.assertEqual(len(self.fake_stripe.charges), 1)
+
+
+class AsyncPaymentTestCase(FakeStripeMixin, TransactionTestCase):
+    LATENCY = 0.5
+
+    def test_request_returns_before_the_charge(self):
+        user = get_user_model().objects.create_user('shopper')
+        self.client.force_login(user)
+        add_item(user, make_item(1))
+        start = time.perf_counter()
+        response = self.pay()
+        self.assertLess(time.perf_counter() - start, self.LATENCY)
+        payment = Payment.objects.get()
+        self.assertEqual(payment.status, Payment.PENDING)
+        self.assertEqual(response['Location'], reverse('core:payment-status', args=[payment.pk]))
+
+        def status():
+            url = reverse('core:payment-status-api', args=[payment.pk])
+            while True:
+                try:
+                    return self.client.get(url).json()['status']
+                except OperationalError:
+                    # the payment worker is writing; see
+                    # ConcurrentCartMutationTestCase
+                    time.sleep(0.01)
+
+        deadline = time.monotonic() + 10
+        while status() == 'pending':
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.05)
+        self.assertEqual(status(), 'succeeded')
+        self.assertTrue(Order.objects.get().ordered)
+
+
+@mock.patch('core.payments.PAYMENTS_EAGER', True)
+class DuplicatePaymentTestCase(FakeStripeMixin, TransactionTestCase):
+    LATENCY = 0.2
+    SUBMITS = 6
+
+    def test_parallel_duplicate_submissions_charge_once(self):
+        user = get_user_model().objects.create_user('shopper')
+        add_item(user, make_item(1))
+        key = payments.idempotency_key(Order.objects.get())
+        barrier = threading.Barrier(self.SUBMITS)
+        locations = []
+        errors = []
+
+        def retry(func):
+            while True:
+                try:
+                    return func()
+                except OperationalError:
+                    # see ConcurrentCartMutationTestCase
+                    time.sleep(random.uniform(0, 0.02))
+
+        def submit():
+            try:
+                client = self.client_class()
+                retry(lambda: client.force_login(user))
+                barrier.wait()
+                response = retry(lambda: client.post(
+                    reverse('core:payment', kwargs={'payment_option': 'stripe'}),
+                    {'stripeToken': 'tok_visa', 'idempotency_key': key}))
+                locations.append(response['Location'])
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=submit) for _ in range(self.SUBMITS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        payment = Payment.objects.get()
+        self.assertEqual(payment.status, Payment.SUCCEEDED)
+        self.assertEqual(len(self.fake_stripe.charges), 1)
+        self.assertEqual(
+            set(locations), {reverse('core:payment-status', args=[payment.pk])})
+        self.assertTrue(Order.objects.get().ordered)
+
+
+class GatewayTestCase(FakeStripeMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = 0.0
+        self.sleeps = []
+        self.gateway = Gateway(
+            timeout=0.3, retries=2, backoff=0.1, max_backoff=1.0,
+            breaker=CircuitBreaker(threshold=3, reset_timeout=30, clock=lambda: self.now),
+            sleep=self.sleeps.append)
+
+    def charge(self, token='tok_visa', **kwargs):
+        return self.gateway.charge(amount=100, currency='usd', source=token, **kwargs)
+
+    def test_rate_limits_are_retried_with_backoff(self):
+        self.fake_stripe.fail_next(2, status=429)
+        charge = self.charge(idempotency_key='retried')
+        self.assertEqual(charge['status'], 'succeeded')
+        self.assertEqual(self.fake_stripe.requests, 3)
+        self.assertEqual(len(self.fake_stripe.charges), 1)
+        self.assertEqual(len(self.sleeps), 2)
+        # full jitter below the doubling cap
+        self.assertTrue(0 <= self.sleeps[0] <= 0.1 and 0 <= self.sleeps[1] <= 0.2)
+        stats = self.gateway.stats.as_dict()
+        self.assertEqual((stats['calls'], stats['retries'], stats['failures']), (3, 2, 2))
+        self.assertEqual(stats['latency']['count'], 3)
+
+    def test_gives_up_after_the_last_retry(self):
+        self.fake_stripe.fail_next(3, status=429)
+        with self.assertRaises(stripe.error.RateLimitError):
+            self.charge()
+        self.assertEqual(self.fake_stripe.requests, 3)
+
+    def test_slow_responses_time_out(self):
+        # declined, so the stalled requests finishing late charge nothing
+        self.fake_stripe.stall_next(3, seconds=0.6)
+        start = time.perf_counter()
+        with self.assertRaises(stripe.error.APIConnectionError):
+            self.charge(DECLINED_TOKEN)
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertEqual(self.gateway.stats.as_dict()['retries'], 2)
+
+    def test_declines_are_not_retried(self):
+        with self.assertRaises(stripe.error.CardError):
+            self.charge(DECLINED_TOKEN)
+        self.assertEqual(self.fake_stripe.requests, 1)
+        self.assertEqual(self.gateway.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_breaker_fails_fast_while_stripe_is_down(self):
+        self.fake_stripe.fail_next(3, status=503)
+        for _ in range(3):
+            with self.assertRaises(stripe.error.APIError):
+                self.charge()
+        self.assertEqual(self.gateway.breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(GatewayUnavailable):
+            self.charge()
+        self.assertEqual(self.fake_stripe.requests, 3)
+        self.assertEqual(self.gateway.stats.as_dict()['rejected'], 1)
+        # after the reset timeout one trial call goes through and closes it
+        self.now += 31
+        self.assertEqual(self.gateway.breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertEqual(self.charge()['status'], 'succeeded')
+        self.assertEqual(self.gateway.breaker.state, CircuitBreaker.CLOSED)
+
+    def test_failed_trial_reopens_the_breaker(self):
+        self.fake_stripe.fail_next(4, status=500)
+        for _ in range(3):
+            with self.assertRaises(stripe.error.APIError):
+                self.charge()
+        self.now += 31
+        with self.assertRaises(stripe.error.APIError):
+            self.charge()
+        self.assertEqual(self.gateway.breaker.state, CircuitBreaker.OPEN)
+
+
+class FakePayPalMixin:
+    LATENCY = 0.0
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.fake_paypal = FakePayPal(latency=cls.LATENCY).start()
+        cls.paypal_api_base = mock.patch.object(paypal.client, 'api_base', cls.fake_paypal.url)
+        cls.paypal_api_base.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.paypal_api_base.stop()
+        cls.fake_paypal.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.fake_paypal.reset()
+
+
+@mock.patch('core.payments.PAYMENTS_EAGER', True)
+class PayPalPaymentFlowTestCase(FakePayPalMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = get_user_model().objects.create_user('shopper')
+        self.client.force_login(self.user)
+        self.item = make_item(1, price=Decimal('12.34'), inventory_quantity=5)
+        add_item(self.user, self.item)
+        add_item(self.user, self.item)
+        self.url = reverse('core:payment', kwargs={'payment_option': 'paypal'})
+
+    def test_approved_order_is_captured(self):
+        response = self.client.get(self.url)
+        self.assertContains(response, 'paypal-buttons')
+        self.assertContains(response, reverse('core:paypal-order'))
+        order_id = self.client.post(reverse('core:paypal-order')).json()['id']
+        self.assertEqual(self.fake_paypal.orders[order_id]['amount'],
+                         {'currency_code': 'USD', 'value': '24.68'})
+        self.client.post(self.url, {'paypalOrderID': order_id})
+        payment = Payment.objects.get()
+        self.assertEqual(payment.status, Payment.SUCCEEDED)
+        self.assertEqual(payment.processor, 'paypal')
+        self.assertEqual(payment.charge_id, self.fake_paypal.captures[-1]['id'])
+        self.assertEqual(self.fake_paypal.replies.keys(), {payment.idempotency_key.key})
+        self.assertTrue(Order.objects.get().ordered)
+
+    def test_declined_order_reopens_the_cart(self):
+        order_id = self.fake_paypal.create_order('24.68', decline=True)
+        response = self.client.post(self.url, {'paypalOrderID': order_id}, follow=True)
+        self.assertContains(response, 'PayPal declined the payment')
+        self.assertEqual(Payment.objects.get().status, Payment.FAILED)
+        self.assertFalse(Order.objects.get().ordered)
+        self.assertEqual(StockReservation.objects.get().quantity, 2)
+
+    def test_capture_that_did_not_complete_is_not_an_order(self):
+        for status in ('PENDING', 'DECLINED'):
+            order_id = self.fake_paypal.create_order('24.68', capture_status=status)
+            response = self.client.post(self.url, {'paypalOrderID': order_id}, follow=True)
+            self.assertContains(response, 'PayPal declined the payment')
+            self.assertEqual(Payment.objects.latest('pk').status, Payment.FAILED)
+            self.assertFalse(Order.objects.get().ordered)
+            self.assertFalse(OrderReceipt.objects.exists())
+
+    def test_order_for_another_amount_is_refused(self):
+        # e.g. one the browser created itself
+        order_id = self.fake_paypal.create_order('0.01')
+        response = self.client.post(self.url, {'paypalOrderID': order_id}, follow=True)
+        self.assertContains(response, 'did not match your order total. You were not charged')
+        self.assertEqual(self.fake_paypal.captures, [])
+        self.assertEqual(Payment.objects.get().status, Payment.FAILED)
+        self.assertFalse(Order.objects.get().ordered)
+
+    def test_orders_are_only_created_for_a_cart(self):
+        url = reverse('core:paypal-order')
+        self.assertEqual(self.client.get(url).status_code, 405)
+        self.client.force_login(get_user_model().objects.create_user('browser'))
+        self.assertEqual(self.client.post(url).status_code, 400)
+        self.assertEqual(self.fake_paypal.orders, {})
+
+    def test_unknown_payment_option(self):
+        url = reverse('core:payment', kwargs={'payment_option': 'bitcoin'})
+        self.assertEqual(self.client.get(url).status_code, 404)
+        self.assertEqual(self.client.post(url).status_code, 404)
+
+
+class PayPalGatewayTestCase(FakePayPalMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sleeps = []
+        self.gateway = Gateway(PayPalBackend(), timeout=0.3, retries=2, backoff=0.1,
+                               max_backoff=1.0, breaker=CircuitBreaker(threshold=3),
+                               sleep=self.sleeps.append)
+
+    def charge(self, key, value='1.00'):
+        return self.gateway.charge(amount=to_cents(value), currency='usd',
+                                   source=self.fake_paypal.create_order(value),
+                                   idempotency_key=key)
+
+    def test_rate_limits_are_retried_under_one_request_id(self):
+        self.fake_paypal.fail_next(2, status=429)
+        capture = self.charge('retried')
+        self.assertEqual(capture['status'], 'completed')
+        # the order's lookup three times, then its capture
+        self.assertEqual(self.fake_paypal.requests, 4)
+        self.assertEqual([c['id'] for c in self.fake_paypal.captures], [capture['id']])
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_repeated_request_id_is_captured_once(self):
+        order_id = self.fake_paypal.create_order('1.00')
+        first, second = (
+            self.gateway.charge(amount=100, currency='usd', source=order_id,
+                                idempotency_key='replayed')
+            for _ in range(2))
+        self.assertEqual(first['id'], second['id'])
+        self.assertEqual(len(self.fake_paypal.captures), 1)
+
+    def test_revoked_token_is_replaced(self):
+        self.charge('first')
+        self.fake_paypal.expire_tokens()
+        self.charge('second')
+        self.assertEqual(len(self.fake_paypal.captures), 2)
+        # one token per fake's reset, one after the revocation
+        self.assertEqual(self.fake_paypal.token_requests, 2)
+
+    def test_breaker_fails_fast_while_paypal_is_down(self):
+        self.fake_paypal.fail_next(3, status=503)
+        for n in range(3):
+            with self.assertRaises(paypal.APIError):
+                self.charge(f"down-{n}")
+        with self.assertRaises(GatewayUnavailable):
+            self.charge('rejected')
+        self.assertEqual(self.fake_paypal.requests, 3)
+        # the other processor's gateway is unaffected
+        self.assertTrue(get_gateway('stripe').healthy())
+        self.assertFalse(self.gateway.healthy())
+
+
+class OrderReceiptTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user('shopper')
+        self.client.force_login(self.user)
+        self.item = make_item(1, price=Decimal('10.00'), discount_price=Decimal('7.50'))
+        self.other = make_item(2, price=Decimal('3.25'))
+
+    def place(self, items, quantity=1):
+        order = make_order(self.user, items, quantity)
+        order.ordered = True
+        order.save()
+        order.items.update(ordered=True)
+        return OrderReceipt.snapshot(order)
+
+    def test_snapshot_keeps_what_was_paid(self):
+        receipt = self.place([self.item, self.other], quantity=2)
+        Item.objects.filter(pk=self.item.pk).update(
+            title='Renamed', price=Decimal('99.00'), discount_price=None)
+        receipt = OrderReceipt.objects.get(pk=receipt.pk)
+        self.assertEqual(receipt.total, Decimal('21.50'))
+        self.assertEqual(receipt.savings, Decimal('5.00'))
+        self.assertEqual(receipt.item_count, 4)
+        first = receipt.lines[0]
+        self.assertEqual((first.title, first.quantity, first.price, first.discount_price),
+                         ('Item 1', 2, Decimal('10.00'), Decimal('7.50')))
+        self.assertEqual(first.total, Decimal('15.00'))
+        response = self.client.get(receipt.get_absolute_url())
+        self.assertContains(response, 'Item 1')
+        self.assertNotContains(response, 'Renamed')
+        self.assertContains(response, '$21.50')
+
+    def test_history_is_one_query_per_page(self):
+        receipts = [self.place([self.item]) for _ in range(12)]
+        get_cart_item_count(self.user)
+        # session, user, then the page of receipts
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('core:order-history'))
+        page = response.context['page_obj']
+        self.assertEqual([r.pk for r in page], [r.pk for r in receipts[::-1][:10]])
+        self.assertContains(response, f"#{receipts[-1].order_id}")
+        response = self.client.get(reverse('core:order-history') + '?' + page.next_query)
+        self.assertEqual([r.pk for r in response.context['page_obj']],
+                         [receipts[1].pk, receipts[0].pk])
+
+    def test_receipts_are_private(self):
+        receipt = self.place([self.item])
+        self.client.force_login(get_user_model().objects.create_user('other'))
+        self.assertEqual(self.client.get(receipt.get_absolute_url()).status_code, 404)
+        response = self.client.get(reverse('core:order-history'))
+        self.assertContains(response, 'not placed any orders')
+
+
+@modify_settings(MIDDLEWARE={'prepend': 'core.middleware.RequestMetricsMiddleware'})
+class RequestMetricsTestCase(TestCase):
+    def setUp(self):
+        for series in metrics.REQUEST_METRICS_SERIES:
+            series.reset()
+        make_item(1)
+
+    def test_records_latency_queries_and_templates(self):
+        response = self.client.get('/')
+        timing = response['Server-Timing']
+        self.assertIn('desc="2 queries"', timing)
+        self.assertIn('tpl;dur=', timing)
+        self.assertEqual(metrics.request_latency.snapshot('core:home')['count'], 1)
+        self.assertEqual(metrics.request_queries.snapshot('core:home')['sum'], 2)
+        self.assertGreater(metrics.request_template_time.snapshot('core:home')['sum'], 0)
+        self.client.get('/no-such-page/')
+        self.assertEqual(metrics.request_latency.snapshot('unresolved')['count'], 1)
+
+    def test_prometheus_endpoint(self):
+        self.client.get('/')
+        self.client.get('/')
+        self.assertEqual(self.client.get(reverse('core:metrics')).status_code, 403)
+        staff = get_user_model().objects.create_user('staff', is_staff=True)
+        self.client.force_login(staff)
+        body = self.client.get(reverse('core:metrics')).content.decode()
+        self.assertIn('shop_request_duration_seconds_bucket{view="core:home",le="+Inf"} 2', body)
+        self.assertIn('shop_request_queries_bucket{view="core:home",le="2"} 2', body)
+        self.assertIn('shop_request_queries_bucket{view="core:home",le="1"} 0', body)
+        self.assertIn('shop_responses_total{view="core:home",status="200"} 2', body)
+        self.assertIn('shop_cart_count_cache_total{kind="hits"}', body)
+        self.assertIn('shop_gateway_calls_total{processor="stripe",kind="retries"}', body)
+        self.assertIn('shop_gateway_calls_total{processor="paypal",kind="calls"}', body)
+
+    @mock.patch('core.views.METRICS_TOKEN', 'scrape-me')
+    def test_prometheus_token(self):
+        url = reverse('core:metrics')
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.assertEqual(self.client.get(
+            url, HTTP_AUTHORIZATION='Bearer scrape-me').status_code, 200)
+
+    @mock.patch('core.metrics.REQUEST_METRICS', False)
+    def test_can_be_turned_off(self):
+        response = self.client.get('/')
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(metrics.request_latency.snapshot('core:home')['count'], 0)
+
+
+class StaticFilesTestCase(TestCase):
+    STYLESHEET = 'body { background: url("../img/dot.svg"); }\n' * 50
+
+    def setUp(self):
+        source, root = tempfile.mkdtemp(), tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, source)
+        self.addCleanup(shutil.rmtree, root)
+        for name, content in (('css/site.css', self.STYLESHEET.encode()),
+                              ('img/dot.svg', b'<svg xmlns="http://www.w3.org/2000/svg"/>' * 20),
+                              ('img/pixel.png', os.urandom(64))):
+            os.makedirs(os.path.join(source, os.path.dirname(name)), exist_ok=True)
+            with open(os.path.join(source, name), 'wb') as f:
+                f.write(content)
+        overrides = self.settings(
+            STATICFILES_DIRS=[source], STATIC_ROOT=root, STATIC_URL='/static/',
+            STATICFILES_STORAGE='core.staticfiles.CompressedManifestStaticFilesStorage')
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        call_command('collectstatic', interactive=False, verbosity=0)
+        with open(os.path.join(root, 'staticfiles.json')) as manifest:
+            self.hashed = json.load(manifest)['paths']
+        self.middleware = StaticFilesMiddleware(lambda request: HttpResponseNotFound())
+
+    def get(self, name, **headers):
+        request = RequestFactory().get(f'/static/{name}', **headers)
+        return self.middleware(request)
+
+    def test_collects_hashed_and_compressed_files(self):
+        css = self.hashed['css/site.css']
+        self.assertRegex(css, r'^css/site\.[0-9a-f]{12}\.css$')
+        response = self.get(css, HTTP_ACCEPT_ENCODING='gzip')
+        content = b''.join(response.streaming_content)
+        self.assertLess(len(content), len(self.STYLESHEET) / 10)
+        body = gzip.decompress(content).decode()
+        self.assertIn(self.hashed['img/dot.svg'], body)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/css')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    @unittest.skipIf(staticfiles.brotli is None, 'brotli is not installed')
+    def test_prefers_brotli(self):
+        response = self.get(self.hashed['img/dot.svg'], HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        response = self.get(self.hashed['img/dot.svg'], HTTP_ACCEPT_ENCODING='gzip, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_identity_when_nothing_is_accepted(self):
+        response = self.get(self.hashed['css/site.css'])
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(b''.join(response.streaming_content).decode(),
+                         self.STYLESHEET.replace('../img/dot.svg',
+                                                 '../' + self.hashed['img/dot.svg']))
+        # a PNG is compressed already
+        response = self.get(self.hashed['img/pixel.png'], HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertNotIn('Vary', response)
+
+    def test_caches_hashed_names_forever(self):
+        response = self.get(self.hashed['css/site.css'])
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        response = self.get('css/site.css')
+        self.assertEqual(response['Cache-Control'],
+                         f'public, max-age={staticfiles.STATIC_MAX_AGE}')
+        response = self.get('css/site.css', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.get('css/missing.css').status_code, 404)
+
+
+@mock.patch('core.payments.PAYMENTS_EAGER', True)
+class FunnelBenchmarkTestCase(TestCase):
+    def test_times_every_step_and_compares_runs(self):
+        path = os.path.join(tempfile.mkdtemp(), 'funnel.json')
+        self.addCleanup(os.remove, path)
+        options = {'users': 3, 'items': 10, 'orders': 1, 'stripe_latency': 0,
+                   'scratch_db': True}
+        call_command('bench_funnel', output=path, stdout=io.StringIO(), **options)
+        with open(path) as f:
+            results = json.load(f)
+        self.assertEqual(results['steps']['product']['count'], 9)
+        self.assertEqual(results['steps']['add-to-cart']['count'], 6)
+        for name, step in results['steps'].items():
+            self.assertEqual(step['errors'], 0, name)
+        self.assertEqual(results['funnel']['orders_placed'], 3)
+        self.assertEqual(results['meta']['driver'], 'client')
+
+        out = io.StringIO()
+        call_command('bench_funnel', compare=path, stdout=out, **options)
+        self.assertIn('vs p50', out.getvalue())
+
+    def test_refuses_without_a_scratch_database(self):
+        with self.assertRaisesMessage(CommandError, '--scratch-db'):
+            call_command('bench_funnel', users=1, stdout=io.StringIO())
+        self.assertFalse(get_user_model().objects.exists())
+
+
+class CartIndexTestCase(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user('shopper')
+        self.item = make_item(1)
+        make_order(self.user, [self.item])
+
+    def plan(self, queryset):
+        if connection.vendor == 'postgresql':
+            # with only a handful of rows the planner would rather scan
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
+        if connection.vendor == 'sqlite':
+            return queryset.explain()
+        raise unittest.SkipTest('no plan expectations for this database')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = self.plan(queryset)
+        self.assertIn(index_name, plan)
+        self.assertNotIn('SCAN', plan.replace('Index Scan', '').replace('Index Only Scan', ''))
+
+    def test_open_order_lookup_uses_index(self):
+        self.assertUsesIndex(
+            Order.objects.filter(user=self.user, ordered=False),
+            'core_order_user_ordered_idx')
+
+    def test_open_line_lookup_uses_index(self):
+        self.assertUsesIndex(
+            OrderItem.objects.filter(user=self.user, item=self.item, ordered=False),
+            'core_orderitem_user_item_idx')
+
+    def test_slug_lookup_uses_index(self):
+        plan = self.plan(Item.objects.filter(slug=self.item.slug))
+        self.assertIn('INDEX' if connection.vendor == 'sqlite' else 'Index', plan)
+
+    def test_one_open_order_per_user(self):
+        Order.objects.create(user=self.user, ordered=True, ordered_date=timezone.now())
+        with self.assertRaises(IntegrityError):
+            Order.objects.create(user=self.user, ordered_date=timezone.now())
+
+    def test_one_open_line_per_item(self):
+        OrderItem.objects.create(user=self.user, item=self.item, ordered=True)
+        with self.assertRaises(IntegrityError):
+            OrderItem.objects.create(user=self.user, item=self.item)
+
+    def test_unique_slug(self):
+        with self.assertRaises(IntegrityError):
+            make_item(1)
+
+
+class ImportCatalogTestCase(TestCase):
+    def write(self, suffix, content):
+        f = tempfile.NamedTemporaryFile('w', suffix=suffix, delete=False)
+        self.addCleanup(os.remove, f.name)
+        with f:
+            f.write(content)
+        return f.name
+
+    def run_import(self, path, *args):
+        out, err = io.StringIO(), io.StringIO()
+        call_command('import_catalog', path, *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def test_csv_import_creates_items_in_batches(self):
+        rows = ['slug,title,price,discount_price,category,label,description']
+        rows += [f'shirt-{n},Shirt {n},{n}.50,,S,P,Shirt number {n}' for n in range(25)]
+        out, _ = self.run_import(
+            self.write('.csv', '\n'.join(rows)), '--batch-size', '10')
+        self.assertEqual(Item.objects.count(), 25)
+        self.assertEqual(out.count('rows processed'), 3)
+        self.assertEqual(Item.objects.get(slug='shirt-3').price, 3.5)
+
+    def test_jsonl_import_upserts_by_slug(self):
+        make_item(1)
+        lines = [
+            {'slug': 'item-1', 'title': 'Renamed', 'price': 12, 'category': 'Sport wear',
+             'label': 'danger', 'description': 'Updated', 'inventory_quantity': 4},
+            {'title': 'Rain Coat', 'price': '80', 'category': 'OW', 'label': 'S'},
+        ]
+        out, _ = self.run_import(self.write(
+            '.jsonl', '\n'.join(json.dumps(line) for line in lines)))
+        self.assertIn('1 created, 1 updated', out)
+        item = Item.objects.get(slug='item-1')
+        self.assertEqual((item.title, item.category, item.label, item.inventory_quantity),
+                         ('Renamed', 'SW', 'D', 4))
+        self.assertTrue(Item.objects.filter(slug='rain-coat').exists())
+
+    def test_invalid_rows_are_skipped_or_fatal(self):
+        path = self.write('.jsonl', '\n'.join([
+            json.dumps({'slug': 'ok', 'title': 'Ok', 'price': 1, 'category': 'S', 'label': 'P'}),
+            json.dumps({'slug': 'bad', 'title': 'Bad', 'price': 1, 'category': 'X', 'label': 'P'}),
+            '{not json',
+        ]))
+        out, err = self.run_import(path)
+        self.assertIn('2 skipped', out)
+        self.assertIn('line 2: category', err)
+        self.assertIn('line 3: row is not a JSON object', err)
+        with self.assertRaises(CommandError):
+            self.run_import(path, '--strict')
+
+    def test_values_of_the_wrong_type_are_invalid_rows(self):
+        row = {'slug': 'ok', 'title': 'Ok', 'price': 1, 'category': 'S', 'label': 'P'}
+        path = self.write('.jsonl', '\n'.join(json.dumps(dict(row, **bad)) for bad in [
+            {'title': 123}, {'category': ['S']}, {'description': {}}, {'price': True},
+            {'inventory_quantity': 2.5}, {},
+        ]))
+        out, err = self.run_import(path)
+        self.assertIn('1 created', out)
+        self.assertIn('5 skipped', out)
+        for message in ('line 1: title must be a string', 'line 2: category must be a string',
+                        'line 3: description must be a string', 'line 4: price must be a number',
+                        'line 5: inventory_quantity must be an integer'):
+            self.assertIn(message, err)
+        with self.assertRaises(CommandError):
+            self.run_import(path, '--strict')
+
+    def test_long_slugs(self):
+        title = ' '.join(['Waterproof'] * 8)
+        path = self.write('.jsonl', '\n'.join([
+            json.dumps({'title': title, 'price': 1, 'category': 'S', 'label': 'P'}),
+            json.dumps({'slug': 'x' * 90, 'title': 'Long', 'price': 1, 'category': 'S',
+                        'label': 'P'}),
+        ]))
+        out, err = self.run_import(path)
+        self.assertIn('line 2: slug is longer than 50 characters', err)
+        slug = Item.objects.get().slug
+        self.assertEqual(slug, ('waterproof-' * 4) + 'waterp')
+        self.assertEqual(len(slug), 50)
+
+    def test_prepopulate_loads_the_sample_catalog(self):
+        call_command('prepopulate', stdout=io.StringIO())
+        self.assertTrue(Item.objects.exists())
+
+
+class AdminTestCase(TestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_superuser('admin', '', 'password')
+        self.client.force_login(self.admin)
+        self.items = [make_item(n) for n in range(3)]
+        self.shoppers = 0
+
+    def place_orders(self, count):
+        for _ in range(count):
+            self.shoppers += 1
+            user = get_user_model().objects.create_user(f"shopper-{self.shoppers}")
+            order = make_order(user, self.items)
+            order.payment = Payment.objects.create(user=user, amount=order.total)
+            order.save()
+            BillingAddress.objects.create(user=user, street_address='1 Main St',
+                                          country='US', zip='12345')
+
+    def changelist_queries(self, model, **params):
+        url = reverse(f'admin:core_{model._meta.model_name}_changelist')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries]
+
+    def test_changelists_cost_the_same_for_any_number_of_rows(self):
+        for model in (Order, OrderItem, Payment, BillingAddress, Item):
+            self.place_orders(2)
+            _, few = self.changelist_queries(model)
+            self.place_orders(20)
+            response, many = self.changelist_queries(model)
+            self.assertEqual(len(few), len(many), model)
+        self.assertContains(self.changelist_queries(Order)[0], f"shopper-{self.shoppers}")
+
+    def test_searches_are_exact_and_indexed(self):
+        self.place_orders(3)
+        response, _ = self.changelist_queries(Order, q='shopper-1')
+        self.assertContains(response, '1 order')
+        self.assertNotContains(self.changelist_queries(Order, q='shopper')[0], 'shopper-1')
+        order = Order.objects.last()
+        self.assertContains(self.changelist_queries(Order, q=str(order.pk))[0], '1 order')
+        # too big for a primary key (and '²' is a digit int() refuses)
+        for term in ('9' * 20, '²'):
+            self.assertContains(self.changelist_queries(Order, q=term)[0], '0 orders')
+        response, _ = self.changelist_queries(Item, q='item 2')
+        self.assertContains(response, 'item-2')
+        self.assertContains(self.changelist_queries(Item, q='item-1')[0], '1 item')
+
+    def test_date_drill_down_reads_only_the_bounds(self):
+        self.place_orders(2)
+        Order.objects.filter(pk=Order.objects.first().pk).update(
+            ordered_date=timezone.now() - timedelta(days=800))
+        response, queries = self.changelist_queries(Order)
+        self.assertFalse([sql for sql in queries if 'DISTINCT' in sql])
+        this_year = timezone.localtime().year
+        for year in range(this_year - 2, this_year + 1):
+            self.assertContains(response, f'ordered_date__year={year}')
+        response, _ = self.changelist_queries(Order, ordered_date__year=this_year)
+        self.assertContains(response, 'All dates')
+
+    def test_order_form_does_not_list_every_line(self):
+        self.place_orders(1)
+        order = Order.objects.get()
+        response = self.client.get(reverse('admin:core_order_change', args=[order.pk]))
+        self.assertContains(response, 'vManyToManyRawIdAdminField')
+        self.assertNotContains(response, '<option value="%s"' % order.items.first().pk)
+
+    def test_estimated_count_for_unfiltered_big_tables(self):
+        self.place_orders(2)
+        with mock.patch('core.pagination.estimate_row_count', return_value=5000000):
+            self.assertEqual(EstimatedCountPaginator(Order.objects.all(), 10).count, 5000000)
+            filtered = Order.objects.filter(ordered=False)
+            self.assertEqual(EstimatedCountPaginator(filtered, 10).count, 2)
+        with mock.patch('core.pagination.estimate_row_count', return_value=10):
+            self.assertEqual(EstimatedCountPaginator(Order.objects.all(), 10).count, 2)
+
+
+class KeysetPaginationTestCase(TestCase):
+    def setUp(self):
+        self.items = [make_item(n) for n in range(25)]
+
+    def titles(self, page):
+        return [item.title for item in page]
+
+    def test_walk_forward_and_back(self):
+        paginator = KeysetPaginator(Item.objects.all(), 10)
+        first = paginator.page()
+        self.assertEqual(self.titles(first), [f"Item {n}" for n in range(10)])
+        self.assertFalse(first.has_previous())
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+        self.assertEqual(self.titles(third), [f"Item {n}" for n in range(20, 25)])
+        self.assertFalse(third.has_next())
+        back = paginator.page(third.previous_cursor)
+        self.assertEqual(self.titles(back), self.titles(second))
+        self.assertTrue(back.has_previous())
+        self.assertEqual(self.titles(paginator.page(back.previous_cursor)),
+                         self.titles(first))
+        self.assertFalse(paginator.page(back.previous_cursor).has_previous())
+
+    def test_descending_walk(self):
+        paginator = KeysetPaginator(Item.objects.all(), 10, descending=True)
+        first = paginator.page()
+        self.assertEqual(self.titles(first), [f"Item {n}" for n in range(24, 14, -1)])
+        third = paginator.page(paginator.page(first.next_cursor).next_cursor)
+        self.assertEqual(self.titles(third), [f"Item {n}" for n in range(4, -1, -1)])
+        self.assertFalse(third.has_next())
+        back = paginator.page(third.previous_cursor)
+        self.assertEqual(self.titles(back), [f"Item {n}" for n in range(14, 4, -1)])
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        paginator = KeysetPaginator(Item.objects.all(), 10)
+        for cursor in ['garbage', '!!', encode_cursor('x', 3), encode_cursor('n', 'a')]:
+            self.assertEqual(self.titles(paginator.page(cursor)),
+                             [f"Item {n}" for n in range(10)])
+
+    def test_home_view_pages_without_count(self):
+        cursor = encode_cursor('n', self.items[19].pk)
+        # the page itself plus the facet counts
+        with self.assertNumQueries(2):
+            response = self.client.get('/', {'cursor': cursor, 'label': 'P'})
+        self.assertEqual([item.title for item in response.context['object_list']],
+                         [f"Item {n}" for n in range(20, 25)])
+        self.assertContains(response, '&amp;label=P" aria-label="Previous"')
+        self.assertFalse(response.context['page_obj'].has_next())
+
+
+class PageCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.item = make_item(1)
+        self.url = self.item.get_absolute_url()
+
+    def test_anonymous_product_page_is_served_from_cache(self):
+        first = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first['ETag'], second['ETag'])
+        self.assertIn('Last-Modified', second)
+
+    def test_conditional_requests_get_304(self):
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_saving_an_item_purges_its_page(self):
+        etag = self.client.get(self.url)['ETag']
+        self.item.description = 'Brand new description'
+        self.item.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, 'Brand new description')
+        self.item.slug = 'moved'
+        self.item.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_logged_in_users_bypass_the_page_cache(self):
+        self.client.get(self.url)
+        user = get_user_model().objects.create_user('shopper')
+        self.client.force_login(user)
+        response = self.client.get(self.url)
+        self.assertContains(response, 'Logout')
+
+    def test_catalog_cards_follow_item_changes(self):
+        self.assertContains(self.client.get('/'), 'Item 1')
+        self.item.title = 'Renamed item'
+        self.item.save()
+        self.assertContains(self.client.get('/'), 'Renamed item')
+
+
+def image_file(width, height, color='red', name='photo.png'):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), color).save(buffer, 'PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+@mock.patch('core.images.IMAGES_EAGER', True)
+class ItemImageTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        overrides = self.settings(MEDIA_ROOT=media_root, MEDIA_URL='/media/')
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.item = make_item(1)
+
+    def derivatives(self, digest):
+        return sorted(os.listdir(default_storage.path(f'derivatives/{digest[:2]}/{digest}')))
+
+    def test_upload_builds_resized_copies(self):
+        modified = self.item.modified
+        self.item.image = image_file(800, 400)
+        self.item.save()
+        self.item.refresh_from_db()
+        self.assertEqual(len(self.item.image_digest), 64)
+        self.assertEqual((self.item.image_width, self.item.image_height), (800, 400))
+        self.assertGreater(self.item.modified, modified)
+        self.assertEqual(self.derivatives(self.item.image_digest), [
+            f'{width}.{extension}' for width in (160, 320, 480, 640, 800)
+            for extension in ('jpg', 'webp')])
+        with default_storage.open(derivative_name(self.item.image_digest, 320, 'webp')) as f:
+            self.assertEqual(Image.open(f).size, (320, 160))
+
+    def test_same_picture_is_resized_once(self):
+        self.item.image = image_file(400, 400)
+        self.item.save()
+        other = make_item(2, image=image_file(400, 400, name='copy.png'))
+        other.refresh_from_db()
+        self.item.refresh_from_db()
+        self.assertEqual(other.image_digest, self.item.image_digest)
+        self.assertNotEqual(other.image.name, self.item.image.name)
+        self.assertEqual(len(self.derivatives(other.image_digest)), 6)
+
+    def test_replacing_the_image_rebuilds(self):
+        self.item.image = image_file(300, 300)
+        self.item.save()
+        self.item.refresh_from_db()
+        first = self.item.image_digest
+        self.item.image = image_file(300, 300, color='blue')
+        with mock.patch('core.signals.schedule_derivatives') as schedule:
+            self.item.save()
+        schedule.assert_called_once_with(self.item.pk)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.image_digest, '')  # until the new build is done
+        self.item.title = 'Renamed'
+        with mock.patch('core.signals.schedule_derivatives') as schedule:
+            self.item.save()
+        schedule.assert_not_called()
+        self.assertNotEqual(images.build_derivatives(self.item.pk), first)
+
+    def test_srcset_on_catalog_and_product_pages(self):
+        self.assertContains(self.client.get('/'), 'img/sample.jpg')
+        self.item.image = image_file(1000, 500)
+        self.item.save()
+        self.item.refresh_from_db()
+        digest = self.item.image_digest
+        for url in ('/', self.item.get_absolute_url()):
+            page = self.client.get(url).content.decode()
+            self.assertIn('<source type="image/webp" srcset="'
+                          f'/media/derivatives/{digest[:2]}/{digest}/160.webp 160w, ', page)
+            self.assertIn(f'/{digest}/1000.jpg 1000w"', page)
+            self.assertIn(f'<img src="/media/derivatives/{digest[:2]}/{digest}/640.jpg"', page)
+            self.assertIn('width="1000" height="500"', page)
+
+    def test_backfill(self):
+        name = default_storage.save('items/old.png', image_file(200, 100))
+        Item.objects.filter(pk=self.item.pk).update(image=name)
+        # before the derivatives exist pages show the original
+        self.assertContains(self.client.get('/'), f'<img src="/media/{name}"')
+        out = io.StringIO()
+        call_command('build_image_derivatives', workers=1, stdout=out)
+        self.assertIn('Built derivatives for 1 of 1 images', out.getvalue())
+        self.item.refresh_from_db()
+        self.assertEqual(self.derivatives(self.item.image_digest),
+                         ['160.jpg', '160.webp', '200.jpg', '200.webp'])
+
+
+class InvertedIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add(1, 'red cotton shirt')
+        self.index.add(2, 'red red red shirt')
+        self.index.add(3, 'blue linen shirt')
+        self.index.add(4, 'red wool coat')
+
+    def test_bm25_ranking_and_all_terms_required(self):
+        self.assertEqual(self.index.search('red shirt'), ([2, 1], 2))
+        self.assertEqual(self.index.search('RED')[1], 3)
+        self.assertEqual(self.index.search('green shirt'), ([], 0))
+        self.assertEqual(self.index.search(''), ([], 0))
+
+    def test_offsets(self):
+        ranked, total = self.index.search('shirt')
+        self.assertEqual(total, 3)
+        self.assertEqual(self.index.search('shirt', offset=1, limit=1), (ranked[1:2], 3))
+
+    def test_updates_replace_and_remove_documents(self):
+        self.index.search('coat')
+        self.index.add(4, 'red wool scarf')
+        self.assertEqual(self.index.search('coat'), ([], 0))
+        self.assertEqual(self.index.search('scarf'), ([4], 1))
+        self.index.remove(4)
+        self.assertEqual(self.index.search('red')[1], 2)
+
+    def test_threshold_ranking_matches_direct_scoring(self):
+        index = InvertedIndex()
+        for doc_id in range(300):
+            index.add(doc_id, ' '.join(['common'] * (doc_id % 7 + 1) +
+                                       ['shared'] * (doc_id % 5 + 1) +
+                                       ['filler'] * (doc_id % 11)))
+        direct = index.search('common shared', limit=30)
+        index.direct_scoring_limit = 0
+        self.assertEqual(index.search('common shared', limit=30), direct)
+
+
+class SearchViewTestCase(TestCase):
+    def setUp(self):
+        invalidate_index()
+        self.addCleanup(invalidate_index)
+        self.shirt = make_item(1, description='Soft organic cotton')
+        self.coat = Item.objects.create(
+            title='Rain coat', price=80, category='OW', label='S',
+            slug='rain-coat', description='Keeps you dry')
+
+    def test_matches_title_description_and_category(self):
+        self.assertEqual(search_items('cotton').items, [self.shirt])
+        self.assertEqual(search_items('rain').items, [self.coat])
+        self.assertEqual(search_items('out wear').items, [self.coat])
+
+    def test_index_follows_item_signals(self):
+        search_items('coat')
+        self.coat.title = 'Rain poncho'
+        self.coat.save()
+        self.assertEqual(search_items('coat').total, 0)
+        self.assertEqual(search_items('poncho').items, [self.coat])
+        self.coat.delete()
+        self.assertEqual(search_items('poncho').total, 0)
+
+    def test_search_page_and_api(self):
+        for n in range(2, 30):
+            make_item(n, description='Soft organic cotton')
+        response = self.client.get(reverse('core:search'), {'q': 'cotton'})
+        self.assertContains(response, '29 items found')
+        self.assertEqual(len(response.context['items']), 20)
+        self.assertEqual(response.context['next_page'], 2)
+        data = self.client.get(reverse('core:search-api'),
+                               {'q': 'cotton', 'page': 2}).json()
+        self.assertEqual(data['total'], 29)
+        self.assertEqual(len(data['results']), 9)
+        self.assertEqual(data['results'][0]['category'], 'Shirt')
+
+
+class FacetTestCase(TestCase):
+    def setUp(self):
+        make_item(1, price=10.0)
+        make_item(2, price=30.0, discount_price=20.0, category='SW')
+        make_item(3, price=120.0, category='OW', label='D')
+
+    def counts(self):
+        return {(row.facet, row.value): row.count
+                for row in FacetCount.objects.exclude(count=0)}
+
+    def titles(self, response):
+        return [item.title for item in response.context['object_list']]
+
+    def test_counts_follow_item_changes(self):
+        self.assertEqual(self.counts(), {
+            ('category', 'S'): 1, ('category', 'SW'): 1, ('category', 'OW'): 1,
+            ('label', 'P'): 2, ('label', 'D'): 1, ('discount', '1'): 1,
+            ('price', '0-25'): 2, ('price', '100-'): 1,
+        })
+        item = Item.objects.get(slug='item-1')
+        item.price = 60.0
+        item.category = 'SW'
+        item.save()
+        deferred = Item.objects.only('pk', 'slug').get(slug='item-3')
+        deferred.label = 'P'
+        deferred.save()
+        Item.objects.get(slug='item-2').delete()
+        expected = {
+            ('category', 'SW'): 1, ('category', 'OW'): 1, ('label', 'P'): 2,
+            ('price', '50-100'): 1, ('price', '100-'): 1,
+        }
+        self.assertEqual(self.counts(), expected)
+        rebuild_facet_counts()
+        self.assertEqual(self.counts(), expected)
+
+    def test_home_view_filters(self):
+        self.assertEqual(self.titles(self.client.get('/', {'category': 'SW'})),
+                         ['Item 2'])
+        self.assertEqual(self.titles(self.client.get('/', {'discount': '1'})),
+                         ['Item 2'])
+        # the price bands go by the price paid, i.e. the discount price
+        self.assertEqual(self.titles(self.client.get('/', {'price': '0-25'})),
+                         ['Item 1', 'Item 2'])
+        self.assertEqual(
+            self.titles(self.client.get('/', {'price': '100-', 'label': 'D'})),
+            ['Item 3'])
+        # unknown values are ignored rather than matching nothing
+        self.assertEqual(len(self.titles(self.client.get('/', {'category': 'X'}))), 3)
+
+    def test_facet_links_and_counts(self):
+        response = self.client.get('/', {'category': 'S', 'cursor': 'abc'})
+        category = response.context['facets'][0]
+        self.assertEqual(category.selected, 'S')
+        shirt = category.options[0]
+        self.assertEqual((shirt.count, shirt.selected, shirt.query), (1, True, ''))
+        self.assertEqual(category.options[1].query, 'category=SW')
+        self.assertContains(response, 'Under $25 (2)')
+
+    def test_facet_cost_does_not_grow_with_the_catalog(self):
+        for n in range(4, 60):
+            make_item(n, price=n)
+        with self.assertNumQueries(2):
+            response = self.client.get('/', {'price': '25-50'})
+        self.assertEqual(len(self.titles(response)), 10)
+        self.assertContains(response, '$25 to $50 (25)')
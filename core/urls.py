@@ -2,13 +2,22 @@ from django.urls import path
 from .views import (
     HomeView,
     CheckoutView,
-    products,
+    forget_saved_address,
     ItemDetailView,
     OrderSummaryView,
+    OrderHistoryView,
+    order_receipt,
     add_to_cart,
     remove_from_cart,
     remove_single_item_from_cart,
-    PaymentView
+    PaymentView,
+    paypal_order,
+    payment_status,
+    payment_status_api,
+    gateway_metrics,
+    prometheus_metrics,
+    search,
+    search_api
 )
 
 app_name = 'core'
@@ -16,11 +25,22 @@ app_name = 'core'
 urlpatterns = [
     path('', HomeView.as_view(), name='home'),
     path('checkout/', CheckoutView.as_view(), name='checkout'),
+    path('checkout/addresses/<int:pk>/forget/', forget_saved_address,
+         name='forget-address'),
     path('product/<slug>/', ItemDetailView.as_view(), name='product'),
     path('order-summary/', OrderSummaryView.as_view(), name='order-summary'),
+    path('orders/', OrderHistoryView.as_view(), name='order-history'),
+    path('orders/<int:pk>/', order_receipt, name='order-receipt'),
     path('add-to-cart/<slug>/', add_to_cart, name='add-to-cart'),
     path('remove-from-cart/<slug>/', remove_from_cart, name='remove-from-cart'),
     path('remove_item_from_cart/<slug>/', remove_single_item_from_cart,
          name='remove-single-item-from-cart'),
-    path('payment/<payment_option>/', PaymentView.as_view(), name='payment')
+    path('payment/paypal/order/', paypal_order, name='paypal-order'),
+    path('payment/<payment_option>/', PaymentView.as_view(), name='payment'),
+    path('payments/<int:pk>/', payment_status, name='payment-status'),
+    path('api/payments/<int:pk>/', payment_status_api, name='payment-status-api'),
+    path('api/gateway/metrics/', gateway_metrics, name='gateway-metrics'),
+    path('metrics', prometheus_metrics, name='metrics'),
+    path('search/', search, name='search'),
+    path('api/search/', search_api, name='search-api')
 ]
@@ -1,263 +1,376 @@
 from django.conf import settings
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import render, get_object_or_404, redirect
+from django.views.decorators.http import require_POST
 from django.views.generic import ListView, DetailView, View
-from .models import Item, Order, OrderItem, BillingAddress, Payment
-from .forms import CheckoutForm
-from django.utils import timezone
+from .models import Item, Order, OrderReceipt, Payment
+from .addresses import address_book, forget_address, use_new_address, use_saved_address
+from .forms import CHOICE_PROCESSORS, CheckoutForm, SavedAddressForm
+from .pagination import KeysetPaginationMixin
+from .caching import cached_product_page
+from .inventory import OutOfStock
+from .gateway import PAYMENT_PROCESSORS, GatewayUnavailable, get_gateway, route
+from .metrics import METRICS_TOKEN, render_prometheus
+from .money import to_cents
+from .payments import find_payment, idempotency_key, start_payment
+from .paypal import PAYPAL_CLIENT_ID
+from .facets import facet_groups, filter_items, selected_facets
+from .search import search_items
+from .cart import (
+    get_cart,
+    add_item,
+    remove_item,
+    remove_single_item,
+    ITEM_ADDED,
+    ITEM_REMOVED,
+    QUANTITY_UPDATED,
+    NOT_IN_CART,
+    OUT_OF_STOCK,
+    PAYMENT_PENDING
+)
+from .session_cart import CART_FULL, SessionCart
 
 import stripe
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
+# e.g. a local fake gateway (manage.py fake_stripe) for development
+stripe.api_base = getattr(settings, 'STRIPE_API_BASE', stripe.api_base)
 
 
-def products(request):
-    context = {
-        'items': Item.objects.all()
-    }
-    return render(request, "products.html", context)
-
-
-class CheckoutView(View):
+class CheckoutView(LoginRequiredMixin, View):
+    # the page costs two queries (the cart and its lines) plus the address
+    # book, a submission at most three; see core.addresses
     def get(self, *args, **kwargs):
-        # form
-        form = CheckoutForm()
         context = {
-            'form': form
+            'form': CheckoutForm(),
+            'cart': get_cart(self.request.user),
+            'addresses': address_book(self.request.user),
         }
         return render(self.request, 'checkout.html', context)
 
     def post(self, *args, **kwargs):
-        form = CheckoutForm(self.request.POST or None)
-        try:
-            order = Order.objects.get(user=self.request.user, ordered=False)
-            if form.is_valid():
-                street_address = form.cleaned_data.get('street_address')
-                apartment_address = form.cleaned_data.get('apartment_address')
-                country = form.cleaned_data.get('country')
-                zip = form.cleaned_data.get('zip')
-                # TODO: add funcitonality for these fields
-                # same_shipping_address = form.cleaned_data.get(
-                #     'same_shipping_address')
-                # save_info = form.cleaned_data.get('save_info')
-                payment_option = form.cleaned_data.get('payment_option')
-
-                billing_address = BillingAddress(
-                    user=self.request.user,
-                    street_address=street_address,
-                    apartment_address=apartment_address,
-                    country=country,
-                    zip=zip
-                )
-                billing_address.save()
-                order.billing_address = billing_address
-                order.save()
-                # TODO add redirect to the selected payment option
-                return redirect('core:checkout')
+        reuse = 'saved_address' in self.request.POST
+        form = (SavedAddressForm if reuse else CheckoutForm)(self.request.POST)
+        if not form.is_valid():
             messages.warning(self.request, "Failed Checkout")
             return redirect('core:checkout')
-        except ObjectDoesNotExist:
-            messages.error(self.request, "You do not have an active order.")
-            return redirect('core:order-summary')
-
-
-class PaymentView(View):
-    def get(self, *args, **kwargs):
-        # order
-        context = {'STRIPE_PUBLISHABLE_KEY': settings.STRIPE_PUBLISHABLE_KEY}
-        return render(self.request, "payment.html")
+        data = form.cleaned_data
+        if reuse:
+            used = use_saved_address(self.request.user, data['saved_address'])
+        else:
+            used = use_new_address(self.request.user, data, save=data['save_info'])
+        if not used:
+            if not Order.objects.filter(user=self.request.user, ordered=False).exists():
+                messages.error(self.request, "You do not have an active order.")
+                return redirect('core:order-summary')
+            messages.warning(self.request, "That address is no longer in your address book.")
+            return redirect('core:checkout')
+        # away from a processor that is failing or slow; see core.gateway
+        processor = route(CHOICE_PROCESSORS[data['payment_option']])
+        return redirect('core:payment', payment_option=processor)
 
-    def post(self, *args, **kwargs):
-        order = Order.objects.get(user=self.request.user, ordered=False)
-        token = self.request.POST.get('stripeToken')
-        amount = order.get_total() * 100  # this is * 100 because the amount is in cents
 
-        # try/except for error handling on the payment
+@login_required
+def forget_saved_address(request, pk):
+    if request.method == 'POST':
+        forget_address(request.user, pk)
+    return redirect('core:checkout')
+
+
+class PaymentView(LoginRequiredMixin, View):
+    # the page of each processor, and the field it posts what the shopper
+    # approved in: a Stripe card token, a PayPal order id
+    PAGES = {
+        'stripe': ('payment.html', 'stripeToken'),
+        'paypal': ('paypal_payment.html', 'paypalOrderID'),
+    }
 
-        try:
-            # Use Stripe's library to make requests...
-            charge = stripe.Charge.create(
-                amount=amount,
-                currency='usd',
-                source=token,
-            )
-
-            # create the payment
-            payment = Payment()
-            payment.stripe_charge_id = charge['id']
-            payment.user = self.request.user
-            payment.amount = amount
-            payment.save()
-
-            # assign the payment to the order
-            order.ordered = True
-            order.payment = payment
-            order.save()
-
-            # redirect user after the order is saved
-            messages.success(
-                self.request, "Your order was successfully placed. Thank you for your business!")
-            return redirect("/")
+    def get_processor(self):
+        processor = self.kwargs['payment_option']
+        if processor not in PAYMENT_PROCESSORS:
+            raise Http404("No such payment option")
+        return processor
 
-        except stripe.error.CardError as e:
-            # Since it's a decline, stripe.error.CardError will be caught
-            body = e.json_body
-            err = body.get('error', {})
-            messages.error(self.request, f"{err.get('message')}")
-            return redirect("/")
+    def get(self, *args, **kwargs):
+        processor = self.get_processor()
+        routed = route(processor)
+        if routed != processor:
+            messages.info(self.request, f"{get_gateway(processor).backend.label} is slow to "
+                                        f"respond right now, please pay with "
+                                        f"{get_gateway(routed).backend.label}.")
+            return redirect('core:payment', payment_option=routed)
+        cart = get_cart(self.request.user)
+        context = {
+            'cart': cart,
+            'idempotency_key': idempotency_key(cart.order) if cart else '',
+            'STRIPE_PUBLISHABLE_KEY': settings.STRIPE_PUBLISHABLE_KEY,
+            'PAYPAL_CLIENT_ID': PAYPAL_CLIENT_ID,
+        }
+        return render(self.request, self.PAGES[processor][0], context)
 
-        except stripe.error.RateLimitError as e:
-            # Too many requests made to the API too quickly
-            messages.error(self.request, "Rate Limit Error")
+    def post(self, *args, **kwargs):
+        processor = self.get_processor()
+        # a resubmitted form, possibly after its order was placed, gets the
+        # first submission's outcome
+        key = self.request.POST.get('idempotency_key')
+        if key:
+            payment = find_payment(self.request.user, key)
+            if payment is not None:
+                return redirect("core:payment-status", pk=payment.pk)
+        order = Order.objects.filter(user=self.request.user, ordered=False).first()
+        if order is None:
+            messages.error(self.request, "You do not have an active order.")
             return redirect("/")
+        token = self.request.POST.get(self.PAGES[processor][1])
 
-        except stripe.error.InvalidRequestError as e:
-            # Invalid parameters were supplied to Stripe's API
-            messages.error(self.request, "Invalid Parameter")
-            return redirect("/")
+        # the charge itself runs in the background; see core.payments
+        try:
+            payment = start_payment(order, token, processor)
+        except OutOfStock as e:
+            messages.warning(
+                self.request, f"Sorry, {e.item.title} is out of stock. You were not charged.")
+            return redirect("core:order-summary")
+        if payment is None:
+            messages.info(self.request, "Your payment is already being processed.")
+            return redirect("core:payment-status", pk=Order.objects.get(pk=order.pk).payment_id)
+        return redirect("core:payment-status", pk=payment.pk)
 
-        except stripe.error.AuthenticationError as e:
-            # Authentication with Stripe's API failed
-            # (maybe you changed API keys recently)
-            messages.error(self.request, "Not Authenticated")
-            return redirect("/")
 
-        except stripe.error.APIConnectionError as e:
-            # Network communication with Stripe failed
-            messages.error(self.request, "Network Error")
-            return redirect("/")
+@login_required
+@require_POST
+def paypal_order(request):
+    # the order the PayPal buttons open, created here for the cart total so
+    # that the browser does not pick the amount
+    if 'paypal' not in PAYMENT_PROCESSORS:
+        raise Http404("No such payment option")
+    order = Order.objects.filter(user=request.user, ordered=False).first()
+    if order is None:
+        return JsonResponse({'error': "You do not have an active order."}, status=400)
+    gateway = get_gateway('paypal')
+    try:
+        created = gateway.call(gateway.backend.create_order, amount=to_cents(order.get_total()),
+                               currency='usd', reference=idempotency_key(order))
+    except GatewayUnavailable:
+        return JsonResponse({'error': "PayPal is not responding."}, status=503)
+    except gateway.backend.errors as e:
+        return JsonResponse({'error': gateway.backend.failure_message(e)}, status=502)
+    return JsonResponse({'id': created['id']})
 
-        except stripe.error.StripeError as e:
-            # Display a very generic error to the user, and maybe send
-            # yourself an email
-            messages.error(
-                self.request, "Oops! Something went wrong. You were not charged. Please try again.")
-            return redirect("/")
 
-        except Exception as e:
-            # Something else happened, completely unrelated to Stripe
-            messages.error(
-                self.request, "A serious error occured. We have been notified.")
-            # send an e-mail to admin, letting them know they need to fix something
-            return redirect("/")
+@login_required
+def payment_status(request, pk):
+    payment = get_object_or_404(Payment, pk=pk, user=request.user)
+    if payment.status == Payment.SUCCEEDED:
+        messages.success(
+            request, "Your order was successfully placed. Thank you for your business!")
+        receipt = OrderReceipt.objects.filter(order__payment=payment).first()
+        return redirect(receipt or "/")
+    if payment.status == Payment.FAILED:
+        messages.error(request, payment.error)
+        return redirect("core:order-summary")
+    # still pending: the page polls payment_status_api and reloads
+    return render(request, "payment_status.html", {'payment': payment})
 
 
-class HomeView(ListView):
+@login_required
+def payment_status_api(request, pk):
+    payment = get_object_or_404(Payment, pk=pk, user=request.user)
+    return JsonResponse({
+        'id': payment.pk,
+        'status': payment.status,
+        'error': payment.error,
+        'amount': payment.amount,
+    })
+
+
+def prometheus_metrics(request):
+    # scraped with METRICS_TOKEN as a bearer token, or viewed by staff
+    authorized = (request.META.get('HTTP_AUTHORIZATION') == f"Bearer {METRICS_TOKEN}"
+                  if METRICS_TOKEN else request.user.is_staff)
+    if not authorized:
+        return HttpResponse(status=403)
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4')
+
+
+@staff_member_required
+def gateway_metrics(request):
+    # counters of this process's processor clients; see core.gateway
+    metrics = {}
+    for processor in PAYMENT_PROCESSORS:
+        gateway = get_gateway(processor)
+        metrics[processor] = dict(gateway.stats.as_dict(), breaker=gateway.breaker.state,
+                                  healthy=gateway.healthy())
+    return JsonResponse(metrics)
+
+
+SEARCH_PAGE_SIZE = 20
+
+
+def _search_page(request):
+    query = request.GET.get('q', '').strip()
+    try:
+        page = max(1, int(request.GET.get('page', 1)))
+    except ValueError:
+        page = 1
+    results = search_items(query, offset=(page - 1) * SEARCH_PAGE_SIZE,
+                           limit=SEARCH_PAGE_SIZE)
+    return query, page, results
+
+
+def search(request):
+    query, page, results = _search_page(request)
+    context = {
+        'query': query,
+        'items': results.items,
+        'total': results.total,
+        'total_capped': results.capped,
+        'page': page,
+        'previous_page': page - 1 if page > 1 else None,
+        'next_page': page + 1 if page * SEARCH_PAGE_SIZE < results.total else None
+    }
+    return render(request, 'search.html', context)
+
+
+def search_api(request):
+    query, page, results = _search_page(request)
+    return JsonResponse({
+        'query': query,
+        'page': page,
+        'total': results.total,
+        'total_capped': results.capped,
+        'results': [{
+            'id': item.pk,
+            'title': item.title,
+            'slug': item.slug,
+            'url': item.get_absolute_url(),
+            'category': item.get_category_display(),
+            'price': item.price,
+            'discount_price': item.discount_price,
+        } for item in results.items]
+    })
+
+
+class HomeView(KeysetPaginationMixin, ListView):
     model = Item
     paginate_by = 10
     template_name = 'home.html'
 
+    def get_queryset(self):
+        self.selected_facets = selected_facets(self.request.GET)
+        return filter_items(super().get_queryset(), self.selected_facets)
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['facets'] = facet_groups(self.request.GET, self.selected_facets)
+        return context
+
 
-class OrderSummaryView(LoginRequiredMixin, View):
+class OrderSummaryView(View):
     def get(self, *args, **kwargs):
-        try:
-            order = Order.objects.get(user=self.request.user, ordered=False)
-            context = {
-                'object': order
-            }
-            return render(self.request, 'order_summary.html', context)
-        except ObjectDoesNotExist:
+        if self.request.user.is_authenticated:
+            cart = get_cart(self.request.user)
+        else:
+            cart = SessionCart(self.request.session).get_cart()
+        if cart is None:
             messages.error(self.request, "You do not have an active order.")
             return redirect('/')
+        context = {
+            'object': cart.order,
+            'cart': cart
+        }
+        return render(self.request, 'order_summary.html', context)
+
+
+class OrderHistoryView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
+    # one query per page: each receipt carries its own lines
+    template_name = 'order_history.html'
+    context_object_name = 'receipts'
+    paginate_by = 10
+    descending = True
+
+    def get_queryset(self):
+        return OrderReceipt.objects.filter(user=self.request.user)
+
+
+@login_required
+def order_receipt(request, pk):
+    receipt = get_object_or_404(OrderReceipt, order_id=pk, user=request.user)
+    return render(request, 'order_receipt.html', {'receipt': receipt})
 
 
 class ItemDetailView(DetailView):
     model = Item
     template_name = 'product.html'
 
+    def get(self, request, *args, **kwargs):
+        # anonymous visitors all see the same page, so it is served from the
+        # page cache unless there are flash messages or a cart badge to show
+        if (request.user.is_authenticated or len(messages.get_messages(request))
+                or len(SessionCart(request.session))):
+            return super().get(request, *args, **kwargs)
+
+        def render_page():
+            response = super(ItemDetailView, self).get(request, *args, **kwargs)
+            return self.object, response
+
+        return cached_product_page(request, kwargs['slug'], render_page)
+
 
-@login_required
 def add_to_cart(request, slug):
     cart_item = get_object_or_404(Item, slug=slug)
-    order_item, created = OrderItem.objects.get_or_create(
-        item=cart_item,
-        user=request.user,
-        ordered=False)
-    order_query_set = Order.objects.filter(
-        user=request.user,
-        ordered=False
-    )
-    if order_query_set.exists():
-        order = order_query_set[0]
-        # check if the order item is in the order
-        if order.items.filter(item__slug=cart_item.slug).exists():
-            order_item.order_quantity += 1
-            order_item.save()
-            messages.info(request, "Item quantity was updated.")
-            return redirect("core:order-summary")
-        else:
-            order_item.order_quantity = 1
-            order_item.save()
-            order.items.add(order_item)
-            messages.info(request, "This item was added to your cart.")
-            return redirect("core:order-summary")
+    if request.user.is_authenticated:
+        outcome = add_item(request.user, cart_item)
     else:
-        ordered_date = timezone.now()
-        order = Order.objects.create(
-            user=request.user, ordered_date=ordered_date)
-        order.items.add(order_item)
-        messages.info(request, "This item was added to your cart.")
+        # kept in the session until login; see core.session_cart
+        outcome = SessionCart(request.session).add_item(cart_item)
+    if outcome == CART_FULL:
+        messages.warning(request, "Your cart is full. Log in to add more items.")
         return redirect("core:order-summary")
+    if outcome == OUT_OF_STOCK:
+        messages.warning(request, "Sorry, this item is out of stock.")
+        return redirect("core:product", slug=slug)
+    if outcome == PAYMENT_PENDING:
+        return _missing_line_redirect(request, outcome, slug)
+    if outcome == ITEM_ADDED:
+        messages.info(request, "This item was added to your cart.")
+    else:
+        messages.info(request, "Item quantity was updated.")
+    return redirect("core:order-summary")
 
 
-@login_required
 def remove_from_cart(request, slug):
     cart_item = get_object_or_404(Item, slug=slug)
-    order_query_set = Order.objects.filter(
-        user=request.user,
-        ordered=False
-    )
-    if order_query_set.exists():
-        order = order_query_set[0]
-        # check if the order item is in the order
-        if order.items.filter(item__slug=cart_item.slug).exists():
-            order_item = OrderItem.objects.filter(
-                item=cart_item,
-                user=request.user,
-                ordered=False
-            )[0]
-            order_item.order_quantity = 0
-            order_item.save()
-            order.items.remove(order_item)
-            messages.info(request, "This item was removed from your cart.")
-            return redirect("core:order-summary")
-        else:
-            messages.info(request, "This item was not in your cart.")
-            return redirect("core:product", slug=slug)
+    if request.user.is_authenticated:
+        outcome = remove_item(request.user, cart_item)
     else:
-        messages.info(request, "You don't have an active order.")
-        return redirect("core:product", slug=slug)
+        outcome = SessionCart(request.session).remove_item(cart_item)
+    if outcome == ITEM_REMOVED:
+        messages.info(request, "This item was removed from your cart.")
+        return redirect("core:order-summary")
+    return _missing_line_redirect(request, outcome, slug)
 
 
-@login_required
 def remove_single_item_from_cart(request, slug):
     cart_item = get_object_or_404(Item, slug=slug)
-    order_query_set = Order.objects.filter(
-        user=request.user,
-        ordered=False
-    )
-    if order_query_set.exists():
-        order = order_query_set[0]
-        # check if the order item is in the order
-        if order.items.filter(item__slug=cart_item.slug).exists():
-            order_item = OrderItem.objects.filter(
-                item=cart_item,
-                user=request.user,
-                ordered=False
-            )[0]
-            if order_item.order_quantity > 1:
-                order_item.order_quantity -= 1
-                order_item.save()
-            else:
-                order.items.remove(order_item)
-            messages.info(request, "This item quantity was updated.")
-            return redirect("core:order-summary")
-        else:
-            messages.info(request, "This item was not in your cart.")
-            return redirect("core:product", slug=slug)
+    if request.user.is_authenticated:
+        outcome = remove_single_item(request.user, cart_item)
+    else:
+        outcome = SessionCart(request.session).remove_single_item(cart_item)
+    if outcome == QUANTITY_UPDATED:
+        messages.info(request, "This item quantity was updated.")
+        return redirect("core:order-summary")
+    return _missing_line_redirect(request, outcome, slug)
+
+
+def _missing_line_redirect(request, outcome, slug):
+    if outcome == PAYMENT_PENDING:
+        messages.info(request, "Your cart can't change while its payment is being processed.")
+    elif outcome == NOT_IN_CART:
+        messages.info(request, "This item was not in your cart.")
     else:
         messages.info(request, "You don't have an active order.")
-        return redirect("core:product", slug=slug)
+    return redirect("core:product", slug=slug)
@@ -24,7 +24,9 @@ DATABASES = {
     }
 }
 
-STATICFILES_STORAGE = 'storages.backends.azure_storage.AzureStorage'
-AZURE_ACCOUNT_NAME = os.getenv('AZ_STORAGE_ACCOUNT_NAME')
-AZURE_CONTAINER = os.getenv('AZ_STORAGE_CONTAINER')
-AZURE_ACCOUNT_KEY = os.getenv('AZ_STORAGE_KEY')
+# Static files are collected with content-hashed names and .br/.gz
+# variants and served by the app with far-future caching (core.staticfiles);
+# put a CDN in front of /static/ to take them off the app servers.
+STATICFILES_STORAGE = 'core.staticfiles.CompressedManifestStaticFilesStorage'
+MIDDLEWARE.insert(MIDDLEWARE.index('django.middleware.security.SecurityMiddleware') + 1,
+                  'core.middleware.StaticFilesMiddleware')